@@ -1 +1,34 @@
 # Database initialization
+from urllib.parse import urlparse
+from app.config import settings
+from app.database.base import CandidateStore
+
+
+def create_database(url: str) -> CandidateStore:
+    """
+    Create the candidate store selected by DATABASE_URL
+
+    - empty / json://      -> MockDatabase (JSON file at MOCK_DB_PATH)
+    - sqlite:///data/x.db  -> SQLiteDatabase (relative path)
+    - sqlite:////abs/x.db  -> SQLiteDatabase (absolute path)
+    - sqlite:///:memory:   -> SQLiteDatabase (shared in-memory database)
+    """
+    scheme = urlparse(url).scheme if url else ''
+
+    if scheme == 'sqlite':
+        from app.database.sqlite_db import SQLiteDatabase
+
+        path = url[len('sqlite:///'):]
+        if path == ':memory:':
+            path = 'file:recrutix?mode=memory&cache=shared'
+        return SQLiteDatabase(path)
+
+    from app.database.mock_db import MockDatabase
+
+    if scheme not in ('', 'json'):
+        print(f"Unsupported DATABASE_URL scheme '{scheme}', using JSON mock database")
+    return MockDatabase()
+
+
+# Create database instance
+db = create_database(settings.DATABASE_URL)
@@ -0,0 +1,206 @@
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+from app.database.stats_index import DayBucket
+from app.models.candidate import Candidate, CandidateRangeStats, CandidateStats
+
+
+# Calendar days (today included) counted as thisWeek / thisMonth
+STATS_WEEK_DAYS = 7
+STATS_MONTH_DAYS = 30
+
+
+class CandidateStore(ABC):
+    """
+    Storage interface shared by all candidate backends
+
+    Routes only talk to this interface, so switching backends via
+    DATABASE_URL never requires route changes.
+
+    Derived data (e.g. match features) subscribes with add_listener and is
+    notified of every insert and delete. A listener implements
+    on_candidate_added(candidate), on_candidate_deleted(candidate_id) and
+    on_store_reloaded(). `version` increases with every notification, so it
+    can key caches of derived results; `fingerprint()` identifies the
+    stored content across restarts, so persisted derived data can tell
+    whether it is still current.
+    """
+
+    def __init__(self):
+        self._listeners = []
+        self.version = 0
+        self._unnotified = 0  # Writes whose listeners have not all run yet
+        self._fingerprint_lock = threading.Lock()
+
+    def add_listener(self, listener):
+        """Subscribe to candidate inserts and deletes"""
+        self._listeners.append(listener)
+
+    def _notify_added(self, candidate: Candidate):
+        """Tell listeners a candidate was stored"""
+        self.version += 1
+        for listener in self._listeners:
+            listener.on_candidate_added(candidate)
+
+    def _notify_deleted(self, candidate_id: str):
+        """Tell listeners a candidate was deleted"""
+        self.version += 1
+        for listener in self._listeners:
+            listener.on_candidate_deleted(candidate_id)
+
+    def _notify_reloaded(self):
+        """Tell listeners the store was reloaded from disk"""
+        self.version += 1
+        for listener in self._listeners:
+            listener.on_store_reloaded()
+
+    @contextmanager
+    def _notifying_write(self):
+        """
+        Wrap a storage write and the notifications it sends
+
+        fingerprint() returns None until the block exits, so it never
+        describes content that a listener has not been told about yet.
+        """
+        with self._fingerprint_lock:
+            self._unnotified += 1
+        try:
+            yield
+        finally:
+            with self._fingerprint_lock:
+                self._unnotified -= 1
+
+    def fingerprint(self) -> Optional[str]:
+        """
+        Token identifying the stored content, stable across restarts
+
+        Derived data saves it with its own files and rebuilds on startup
+        when the store's token no longer matches. None (which never
+        matches) while a write is still being notified, or when the
+        backend cannot tell.
+        """
+        with self._fingerprint_lock:
+            if self._unnotified:
+                return None
+            return self._storage_fingerprint()
+
+    def _storage_fingerprint(self) -> Optional[str]:
+        """Backend part of fingerprint() (called under its lock)"""
+        return None
+
+    def refresh(self):
+        """Pick up changes other processes made to storage (no-op by default)"""
+
+    @abstractmethod
+    def add_candidate(self, candidate: Candidate) -> Candidate:
+        """Add new candidate"""
+
+    @abstractmethod
+    def add_candidates(self, candidates: List[Candidate]) -> List[Candidate]:
+        """Add many candidates in a single batched write"""
+
+    @abstractmethod
+    def get_all_candidates(self) -> List[Candidate]:
+        """Get all candidates"""
+
+    @abstractmethod
+    def get_candidate_ids(self) -> List[str]:
+        """Get all candidate IDs in insertion order"""
+
+    @abstractmethod
+    def get_candidates_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100
+    ) -> Tuple[List[Candidate], Optional[str]]:
+        """
+        Get up to `limit` candidates after `cursor`, in insertion order
+
+        Returns the page and the cursor of the next one (None at the end).
+        Cursors are opaque; an invalid cursor raises ValueError.
+        """
+
+    def iter_candidates(self, batch_size: int = 1000, cursor: Optional[str] = None) -> Iterator[List[Candidate]]:
+        """Yield every candidate (after `cursor`) in batches of bounded size"""
+        while True:
+            page, cursor = self.get_candidates_page(cursor, batch_size)
+            if page:
+                yield page
+            if cursor is None:
+                return
+
+    @abstractmethod
+    def get_candidate_by_id(self, candidate_id: str) -> Optional[Candidate]:
+        """Get candidate by ID"""
+
+    @abstractmethod
+    def get_candidates_by_email(self, email: str) -> List[Candidate]:
+        """Get candidates by email (case-insensitive)"""
+
+    @abstractmethod
+    def delete_candidate(self, candidate_id: str) -> bool:
+        """Delete candidate"""
+
+    @abstractmethod
+    def search_candidates(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Candidate]:
+        """Search candidates by name or skills, in insertion order"""
+
+    @abstractmethod
+    def get_upload_days(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None
+    ) -> Dict[str, DayBucket]:
+        """Per-day (uploads, score sum, scored uploads) for days in [start, end]"""
+
+    def get_stats(self, today: Optional[date] = None) -> CandidateStats:
+        """
+        Get candidate statistics (O(days) from the per-day buckets)
+
+        thisWeek and thisMonth count whole calendar days: uploads dated
+        within the last 7 (or 30) days, today included. This is a day
+        granularity approximation of the old rolling 7x24h / 30x24h
+        window, which needed every upload timestamp.
+        """
+        days = self.get_upload_days()
+        today = today or datetime.now().date()
+        week_start = (today - timedelta(days=STATS_WEEK_DAYS - 1)).isoformat()
+        month_start = (today - timedelta(days=STATS_MONTH_DAYS - 1)).isoformat()
+
+        score_sum = sum(bucket[1] for bucket in days.values())
+        scored = sum(bucket[2] for bucket in days.values())
+        return CandidateStats(
+            total=sum(bucket[0] for bucket in days.values()),
+            thisWeek=sum(bucket[0] for day, bucket in days.items() if day >= week_start),
+            thisMonth=sum(bucket[0] for day, bucket in days.items() if day >= month_start),
+            avgMatchScore=score_sum / scored if scored else 0.0
+        )
+
+    def get_range_stats(self, start: Optional[str] = None, end: Optional[str] = None) -> CandidateRangeStats:
+        """Get upload statistics for days in [start, end] (YYYY-MM-DD, inclusive)"""
+        days = self.get_upload_days(start, end)
+        score_sum = sum(bucket[1] for bucket in days.values())
+        scored = sum(bucket[2] for bucket in days.values())
+        return CandidateRangeStats(
+            start=start,
+            end=end,
+            total=sum(bucket[0] for bucket in days.values()),
+            avgMatchScore=score_sum / scored if scored else 0.0,
+            daily={day: bucket[0] for day, bucket in days.items()}
+        )
+
+
+def decode_cursor(cursor: Optional[str]) -> int:
+    """Sequence number a page cursor points after (0 = from the start)"""
+    if cursor is None:
+        return 0
+    if not cursor.isdigit():
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return int(cursor)
@@ -1,17 +1,49 @@
 import json
 import os
-from typing import List, Optional
-from datetime import datetime, timedelta
-from app.models.candidate import Candidate, CandidateStats
+import threading
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Set, Tuple
+from app.database.base import CandidateStore, decode_cursor
+from app.database.search_index import CandidateSearchIndex
+from app.database.stats_index import DayBucket, UploadStatsIndex
+from app.models.candidate import Candidate
+from app.services.metrics import metrics
+from app.utils.serialization import candidate_list, dump_candidates, dumps, loads
 from app.config import settings
 
 
-class MockDatabase:
-    """Mock database using JSON file storage"""
+class MockDatabase(CandidateStore):
+    """
+    Mock database using JSON file storage
+
+    The snapshot file is parsed once and kept in memory as a dict keyed by
+    id, with a secondary index on email, a name/skill search index (see
+    CandidateSearchIndex), per-day upload counters for statistics and
+    insertion sequence numbers for cursor pagination (cursors stay valid
+    until the store is reloaded from disk).
+    Mutations are appended to a JSONL write-ahead log next to the snapshot,
+    so an insert costs O(1) I/O; the log is replayed on startup and folded
+    into the snapshot by a background compaction once it grows past
+    MOCK_DB_COMPACT_THRESHOLD entries.
+    Storage is only re-read when the files change on disk.
+    """
 
     def __init__(self):
+        super().__init__()
         self.db_path = settings.MOCK_DB_PATH
+        self.log_path = os.path.splitext(self.db_path)[0] + '.wal.jsonl'
+        self._lock = threading.RLock()
+        self._candidates: Dict[str, Candidate] = {}
+        self._email_index: Dict[str, Set[str]] = {}
+        self._search_index = CandidateSearchIndex()
+        self._stats_index = UploadStatsIndex()
+        self._reset_order()
+        self._file_state: Optional[tuple] = None
+        self._log_entries = 0
+        self._compacting = False
+        self.corrupt_log_entries = 0
         self._ensure_db_exists()
+        self._refresh_if_changed()
 
     def _ensure_db_exists(self):
         """Ensure database file exists"""
@@ -20,90 +52,327 @@ class MockDatabase:
             with open(self.db_path, 'w') as f:
                 json.dump([], f)
 
-    def _read_db(self) -> List[dict]:
-        """Read database"""
-        with open(self.db_path, 'r') as f:
-            return json.load(f)
+    def _read_db(self) -> List[Candidate]:
+        """Read database (validated straight from JSON bytes)"""
+        with open(self.db_path, 'rb') as f:
+            return candidate_list.validate_json(f.read())
+
+    def _write_db(self, candidates: List[Candidate]) -> str:
+        """Write a snapshot next to the database file (compact JSON); returns its path"""
+        tmp_path = self.db_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(dump_candidates(candidates))
+            f.flush()
+            os.fsync(f.fileno())
+        return tmp_path
+
+    def _read_log(self) -> Tuple[List[dict], bool]:
+        """
+        Read write-ahead log entries (and whether a torn tail was cut off)
+
+        A partial last line (crash mid-append) is cut off the file so the
+        next append starts on a fresh line. Undecodable lines before it are
+        skipped and counted in corrupt_log_entries; the entries after them
+        are still replayed.
+        """
+        if not os.path.exists(self.log_path):
+            return [], False
+
+        with open(self.log_path, 'rb') as f:
+            lines = f.read().splitlines(keepends=True)
+
+        entries = []
+        valid_size = 0
+        for number, line in enumerate(lines, start=1):
+            try:
+                entries.append(loads(line))
+            except ValueError:
+                if number == len(lines) and not line.endswith(b'\n'):
+                    with open(self.log_path, 'r+b') as f:
+                        f.truncate(valid_size)
+                    return entries, True
+                self.corrupt_log_entries += 1
+                print(f"Error reading write-ahead log line {number}: skipping corrupt entry")
+            valid_size += len(line)
+        return entries, False
+
+    @staticmethod
+    def _add_entry(candidate: Candidate) -> bytes:
+        """Write-ahead log line for an insert"""
+        return b'{"op":"add","candidate":' + candidate.model_dump_json().encode() + b'}\n'
+
+    @staticmethod
+    def _delete_entry(candidate_id: str) -> bytes:
+        """Write-ahead log line for a delete"""
+        return dumps({'op': 'delete', 'id': candidate_id}) + b'\n'
+
+    def _append_log(self, entries: List[bytes]):
+        """Append mutations to the write-ahead log"""
+        with open(self.log_path, 'ab') as f:
+            f.write(b''.join(entries))
+            f.flush()
+            if settings.MOCK_DB_FSYNC:
+                os.fsync(f.fileno())
+        self._log_entries += len(entries)
+        self._file_state = self._stat_files()
+
+        if self._log_entries >= settings.MOCK_DB_COMPACT_THRESHOLD:
+            self._compact_in_background()
+
+    def _stat_files(self) -> tuple:
+        """Snapshot and log identity used to detect external changes"""
+        snapshot = os.stat(self.db_path)
+        try:
+            log = os.stat(self.log_path)
+            log_state = (log.st_mtime_ns, log.st_size)
+        except FileNotFoundError:
+            log_state = None
+        return (snapshot.st_mtime_ns, snapshot.st_size, log_state)
+
+    def _refresh_if_changed(self):
+        """Reload the in-memory store if storage changed on disk"""
+        try:
+            state = self._stat_files()
+        except FileNotFoundError:
+            self._ensure_db_exists()
+            state = self._stat_files()
+
+        if state == self._file_state:
+            return
+
+        with self._notifying_write():
+            self._reload()
+
+    def _reload(self):
+        """Re-read the snapshot and log and tell listeners"""
+        with self._lock:
+            state = self._stat_files()
+            if state == self._file_state:
+                return
+            self._candidates = {}
+            self._email_index = {}
+            self._search_index = CandidateSearchIndex()
+            self._stats_index = UploadStatsIndex()
+            self._reset_order()
+            self.corrupt_log_entries = 0
+            for candidate in self._read_db():
+                self._index(candidate)
+
+            entries, truncated = self._read_log()
+            for entry in entries:
+                self._replay(entry)
+            self._log_entries = len(entries)
+            reloaded = self._file_state is not None
+            self._file_state = self._stat_files() if truncated else state
+
+        if reloaded:
+            self._notify_reloaded()
 
-    def _write_db(self, data: List[dict]):
-        """Write to database"""
-        with open(self.db_path, 'w') as f:
-            json.dump(data, f, indent=2)
+    def refresh(self):
+        """Reload if another process changed the snapshot or log"""
+        self._refresh_if_changed()
 
+    def _storage_fingerprint(self) -> Optional[str]:
+        """Snapshot and log identity as of the last load or write"""
+        return repr(self._file_state) if self._file_state is not None else None
+
+    def _replay(self, entry: dict):
+        """Apply one write-ahead log entry to the in-memory store"""
+        if entry['op'] == 'add':
+            candidate = Candidate.model_validate(entry['candidate'])
+            existing = self._candidates.get(candidate.id)
+            if existing is not None:
+                self._unindex(existing)
+            self._index(candidate)
+        elif entry['op'] == 'delete':
+            existing = self._candidates.get(entry['id'])
+            if existing is not None:
+                self._unindex(existing)
+
+    def _reset_order(self):
+        """Forget insertion sequence numbers"""
+        self._next_seq = 0
+        self._seqs: Dict[str, int] = {}
+        self._seq_ids: Dict[int, str] = {}
+        self._seq_list: List[int] = []
+
+    def _index(self, candidate: Candidate):
+        """Insert candidate into the primary and secondary indexes"""
+        self._candidates[candidate.id] = candidate
+        self._next_seq += 1
+        self._seqs[candidate.id] = self._next_seq
+        self._seq_ids[self._next_seq] = candidate.id
+        self._seq_list.append(self._next_seq)
+        self._email_index.setdefault(candidate.email.lower(), set()).add(candidate.id)
+        self._search_index.add(candidate)
+        self._stats_index.add(candidate)
+
+    def _unindex(self, candidate: Candidate):
+        """Remove candidate from the primary and secondary indexes"""
+        del self._candidates[candidate.id]
+        seq = self._seqs.pop(candidate.id)
+        del self._seq_ids[seq]
+        del self._seq_list[bisect_left(self._seq_list, seq)]
+        ids = self._email_index.get(candidate.email.lower())
+        if ids is not None:
+            ids.discard(candidate.id)
+            if not ids:
+                del self._email_index[candidate.email.lower()]
+        self._search_index.remove(candidate)
+        self._stats_index.remove(candidate)
+
+    def _compact_in_background(self):
+        """Start a compaction thread unless one is already running"""
+        with self._lock:
+            if self._compacting:
+                return
+            self._compacting = True
+        threading.Thread(target=self.compact, daemon=True).start()
+
+    def compact(self):
+        """
+        Fold the write-ahead log into a fresh snapshot
+
+        The snapshot is written outside the lock; entries appended while it
+        is being written are carried over into the new log. Both files are
+        swapped and the recorded file state updated under the lock, so a
+        concurrent refresh never mistakes the compaction for an external
+        change. Replaying the old log on top of the new snapshot is
+        idempotent, so a crash at any point leaves the store consistent.
+        """
+        try:
+            with self._lock:
+                candidates = list(self._candidates.values())
+                log_offset = os.path.getsize(self.log_path) if os.path.exists(self.log_path) else 0
+                compacted_entries = self._log_entries
+
+            snapshot_path = self._write_db(candidates)
+
+            with self._lock:
+                os.replace(snapshot_path, self.db_path)
+                tail = b''
+                if os.path.exists(self.log_path):
+                    with open(self.log_path, 'rb') as f:
+                        f.seek(log_offset)
+                        tail = f.read()
+                tmp_path = self.log_path + '.tmp'
+                with open(tmp_path, 'wb') as f:
+                    f.write(tail)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.log_path)
+                self._log_entries -= compacted_entries
+                self._file_state = self._stat_files()
+        except Exception as e:
+            print(f"Error compacting database: {e}")
+        finally:
+            self._compacting = False
+
+    @metrics.timed("db_write")
     def add_candidate(self, candidate: Candidate) -> Candidate:
         """Add new candidate"""
-        candidates = self._read_db()
-        candidate_dict = candidate.model_dump()
-        candidates.append(candidate_dict)
-        self._write_db(candidates)
+        self._refresh_if_changed()
+        with self._notifying_write():
+            with self._lock:
+                self._append_log([self._add_entry(candidate)])
+                existing = self._candidates.get(candidate.id)
+                if existing is not None:
+                    self._unindex(existing)
+                self._index(candidate)
+            self._notify_added(candidate)
         return candidate
 
+    @metrics.timed("db_write")
+    def add_candidates(self, candidates: List[Candidate]) -> List[Candidate]:
+        """Add many candidates with a single log append"""
+        self._refresh_if_changed()
+        with self._notifying_write():
+            with self._lock:
+                self._append_log([self._add_entry(c) for c in candidates])
+                for candidate in candidates:
+                    existing = self._candidates.get(candidate.id)
+                    if existing is not None:
+                        self._unindex(existing)
+                    self._index(candidate)
+            for candidate in candidates:
+                self._notify_added(candidate)
+        return candidates
+
+    @metrics.timed("db_read")
     def get_all_candidates(self) -> List[Candidate]:
         """Get all candidates"""
-        candidates = self._read_db()
-        return [Candidate(**c) for c in candidates]
+        self._refresh_if_changed()
+        return list(self._candidates.values())
+
+    @metrics.timed("db_read")
+    def get_candidate_ids(self) -> List[str]:
+        """Get all candidate IDs in insertion order"""
+        self._refresh_if_changed()
+        return list(self._candidates)
 
+    @metrics.timed("db_read")
+    def get_candidates_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100
+    ) -> Tuple[List[Candidate], Optional[str]]:
+        """Keyset page over insertion sequence numbers (O(log n + limit))"""
+        after = decode_cursor(cursor)
+        self._refresh_if_changed()
+        with self._lock:
+            start = bisect_right(self._seq_list, after)
+            seqs = self._seq_list[start:start + limit]
+            page = [self._candidates[self._seq_ids[seq]] for seq in seqs]
+            more = start + limit < len(self._seq_list)
+        return page, str(seqs[-1]) if more and seqs else None
+
+    @metrics.timed("db_read")
     def get_candidate_by_id(self, candidate_id: str) -> Optional[Candidate]:
         """Get candidate by ID"""
-        candidates = self._read_db()
-        for c in candidates:
-            if c['id'] == candidate_id:
-                return Candidate(**c)
-        return None
+        self._refresh_if_changed()
+        return self._candidates.get(candidate_id)
+
+    @metrics.timed("db_read")
+    def get_candidates_by_email(self, email: str) -> List[Candidate]:
+        """Get candidates by email (case-insensitive)"""
+        self._refresh_if_changed()
+        ids = self._email_index.get(email.lower(), ())
+        return [self._candidates[i] for i in ids]
 
+    @metrics.timed("db_write")
     def delete_candidate(self, candidate_id: str) -> bool:
         """Delete candidate"""
-        candidates = self._read_db()
-        filtered = [c for c in candidates if c['id'] != candidate_id]
+        self._refresh_if_changed()
+        with self._notifying_write():
+            with self._lock:
+                candidate = self._candidates.get(candidate_id)
+                if candidate is None:
+                    return False
+                self._append_log([self._delete_entry(candidate_id)])
+                self._unindex(candidate)
+            self._notify_deleted(candidate_id)
+        return True
 
-        if len(filtered) < len(candidates):
-            self._write_db(filtered)
-            return True
-        return False
-
-    def search_candidates(self, query: str) -> List[Candidate]:
+    @metrics.timed("db_read")
+    def search_candidates(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Candidate]:
         """Search candidates by name or skills"""
-        candidates = self.get_all_candidates()
-        query_lower = query.lower()
-
-        results = []
-        for candidate in candidates:
-            if query_lower in candidate.name.lower():
-                results.append(candidate)
-            elif any(query_lower in skill.lower() for skill in candidate.skills):
-                results.append(candidate)
-
-        return results
-
-    def get_stats(self) -> CandidateStats:
-        """Get candidate statistics"""
-        candidates = self.get_all_candidates()
-
-        now = datetime.now()
-        week_ago = now - timedelta(days=7)
-        month_ago = now - timedelta(days=30)
-
-        this_week = sum(
-            1 for c in candidates
-            if datetime.fromisoformat(c.uploadedAt) >= week_ago
-        )
-
-        this_month = sum(
-            1 for c in candidates
-            if datetime.fromisoformat(c.uploadedAt) >= month_ago
-        )
-
-        # Calculate average match score
-        scores = [c.matchScore for c in candidates if c.matchScore is not None]
-        avg_score = sum(scores) / len(scores) if scores else 0.0
-
-        return CandidateStats(
-            total=len(candidates),
-            thisWeek=this_week,
-            thisMonth=this_month,
-            avgMatchScore=avg_score
-        )
-
-
-# Create database instance
-db = MockDatabase()
+        self._refresh_if_changed()
+        with self._lock:
+            ids = self._search_index.search(query, limit, offset)
+            return [self._candidates[i] for i in ids]
+
+    @metrics.timed("db_read")
+    def get_upload_days(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None
+    ) -> Dict[str, DayBucket]:
+        """Per-day upload buckets, maintained on every insert and delete"""
+        self._refresh_if_changed()
+        with self._lock:
+            return self._stats_index.days(start, end)
@@ -0,0 +1,110 @@
+from typing import Dict, Iterable, List, Optional, Set
+from app.models.candidate import Candidate
+
+
+NGRAM_SIZE = 3
+
+
+def normalize_skill(skill: str) -> str:
+    """Normalize a skill into its index token"""
+    return ' '.join(skill.lower().split())
+
+
+def name_ngrams(name: str) -> Set[str]:
+    """Character n-grams of a lower-cased name"""
+    return {name[i:i + NGRAM_SIZE] for i in range(len(name) - NGRAM_SIZE + 1)}
+
+
+class CandidateSearchIndex:
+    """
+    In-memory search index over candidate names and skills
+
+    - skills: normalized skill token -> candidate ids (inverted index). A
+      query matches every skill token it is a substring of, so lookups cost
+      O(skill vocabulary) instead of O(candidates x skills).
+    - names: character trigram -> candidate ids. Queries of 3+ characters
+      intersect the posting lists of their trigrams and verify the few
+      survivors; shorter queries fall back to scanning names.
+
+    Results keep insertion order so pagination is stable.
+    """
+
+    def __init__(self):
+        self._skills: Dict[str, Set[str]] = {}
+        self._ngrams: Dict[str, Set[str]] = {}
+        self._names: Dict[str, str] = {}
+        self._order: Dict[str, int] = {}
+        self._next_seq = 0
+
+    def add(self, candidate: Candidate):
+        """Index a candidate (re-indexes if the id already exists)"""
+        if candidate.id in self._order:
+            self.remove(candidate)
+
+        self._order[candidate.id] = self._next_seq
+        self._next_seq += 1
+
+        for token in {normalize_skill(s) for s in candidate.skills}:
+            self._skills.setdefault(token, set()).add(candidate.id)
+
+        name = candidate.name.lower()
+        self._names[candidate.id] = name
+        for gram in name_ngrams(name):
+            self._ngrams.setdefault(gram, set()).add(candidate.id)
+
+    def remove(self, candidate: Candidate):
+        """Drop a candidate from the index"""
+        if self._order.pop(candidate.id, None) is None:
+            return
+
+        for token in {normalize_skill(s) for s in candidate.skills}:
+            self._discard(self._skills, token, candidate.id)
+
+        name = self._names.pop(candidate.id)
+        for gram in name_ngrams(name):
+            self._discard(self._ngrams, gram, candidate.id)
+
+    @staticmethod
+    def _discard(postings: Dict[str, Set[str]], key: str, candidate_id: str):
+        """Remove an id from a posting list, dropping empty lists"""
+        ids = postings.get(key)
+        if ids is not None:
+            ids.discard(candidate_id)
+            if not ids:
+                del postings[key]
+
+    def _match_names(self, query: str) -> Iterable[str]:
+        """Candidate ids whose name contains the query"""
+        if len(query) < NGRAM_SIZE:
+            return (cid for cid, name in self._names.items() if query in name)
+
+        postings = []
+        for gram in name_ngrams(query):
+            ids = self._ngrams.get(gram)
+            if not ids:
+                return ()
+            postings.append(ids)
+
+        postings.sort(key=len)
+        candidates = postings[0].intersection(*postings[1:])
+        return (cid for cid in candidates if query in self._names[cid])
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[str]:
+        """Return a page of matching candidate ids in insertion order"""
+        skill_query = normalize_skill(query)
+        if not skill_query:
+            return []  # A blank query is a substring of every token
+
+        matches: Set[str] = set(self._match_names(query.lower()))
+        for token, ids in self._skills.items():
+            if skill_query in token:
+                matches.update(ids)
+
+        ordered = sorted(matches, key=self._order.__getitem__)
+        end = None if limit is None else offset + limit
+        return ordered[offset:end]
@@ -0,0 +1,359 @@
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+from app.database.base import CandidateStore, decode_cursor
+from app.database.search_index import NGRAM_SIZE, normalize_skill
+from app.database.stats_index import DayBucket
+from app.models.candidate import Candidate
+from app.services.metrics import metrics
+from app.config import settings
+
+
+# Statements are module-level constants so sqlite3's per-connection
+# statement cache reuses the compiled (prepared) form on every call
+SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS candidates (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        id TEXT NOT NULL UNIQUE,
+        email TEXT NOT NULL,
+        name_lower TEXT NOT NULL,
+        uploaded_at TEXT NOT NULL,
+        match_score REAL,
+        data TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_candidates_email ON candidates (email)",
+    "CREATE INDEX IF NOT EXISTS idx_candidates_uploaded_at ON candidates (uploaded_at)",
+    # Inverted skill index: normalized skill -> candidate seq
+    "CREATE TABLE IF NOT EXISTS skill_vocab (skill TEXT PRIMARY KEY) WITHOUT ROWID",
+    """
+    CREATE TABLE IF NOT EXISTS candidate_skills (
+        skill TEXT NOT NULL,
+        seq INTEGER NOT NULL,
+        PRIMARY KEY (skill, seq)
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_candidate_skills_seq ON candidate_skills (seq)",
+    # Per-day upload counters, kept current by triggers
+    """
+    CREATE TABLE IF NOT EXISTS upload_days (
+        day TEXT PRIMARY KEY,
+        uploads INTEGER NOT NULL,
+        score_sum REAL NOT NULL,
+        scored INTEGER NOT NULL
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_upload_days_insert AFTER INSERT ON candidates BEGIN
+        INSERT INTO upload_days (day, uploads, score_sum, scored)
+        VALUES (substr(NEW.uploaded_at, 1, 10), 1, coalesce(NEW.match_score, 0), NEW.match_score IS NOT NULL)
+        ON CONFLICT (day) DO UPDATE SET
+            uploads = uploads + 1,
+            score_sum = score_sum + excluded.score_sum,
+            scored = scored + excluded.scored;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_upload_days_delete AFTER DELETE ON candidates BEGIN
+        UPDATE upload_days SET
+            uploads = uploads - 1,
+            score_sum = score_sum - coalesce(OLD.match_score, 0),
+            scored = scored - (OLD.match_score IS NOT NULL)
+        WHERE day = substr(OLD.uploaded_at, 1, 10);
+        DELETE FROM upload_days WHERE day = substr(OLD.uploaded_at, 1, 10) AND uploads <= 0;
+    END
+    """,
+    # Store identity and a count of row changes by any writer (fingerprint)
+    "CREATE TABLE IF NOT EXISTS store_meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL) WITHOUT ROWID",
+    "INSERT OR IGNORE INTO store_meta (key, value) VALUES ('id', abs(random())), ('changes', 0)",
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_changes_insert AFTER INSERT ON candidates BEGIN
+        UPDATE store_meta SET value = value + 1 WHERE key = 'changes';
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_changes_update AFTER UPDATE ON candidates BEGIN
+        UPDATE store_meta SET value = value + 1 WHERE key = 'changes';
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_changes_delete AFTER DELETE ON candidates BEGIN
+        UPDATE store_meta SET value = value + 1 WHERE key = 'changes';
+    END
+    """,
+]
+
+# Trigram full-text index on names (rowid = candidates.seq), when available
+FTS_SCHEMA = "CREATE VIRTUAL TABLE IF NOT EXISTS candidate_names USING fts5(name, tokenize='trigram')"
+
+INSERT_CANDIDATE = """
+    INSERT INTO candidates (id, email, name_lower, uploaded_at, match_score, data)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+INSERT_VOCAB = "INSERT OR IGNORE INTO skill_vocab (skill) VALUES (?)"
+INSERT_SKILL = "INSERT OR IGNORE INTO candidate_skills (skill, seq) VALUES (?, ?)"
+INSERT_NAME = "INSERT INTO candidate_names (rowid, name) VALUES (?, ?)"
+SELECT_SEQ = "SELECT seq FROM candidates WHERE id = ?"
+DELETE_SKILLS = "DELETE FROM candidate_skills WHERE seq = ?"
+DELETE_NAME = "DELETE FROM candidate_names WHERE rowid = ?"
+SELECT_ALL = "SELECT data FROM candidates ORDER BY seq"
+SELECT_IDS = "SELECT id FROM candidates ORDER BY seq"
+SELECT_PAGE = "SELECT data, seq FROM candidates WHERE seq > ? ORDER BY seq LIMIT ?"
+SELECT_BY_ID = "SELECT data FROM candidates WHERE id = ?"
+SELECT_BY_EMAIL = "SELECT data FROM candidates WHERE email = ? ORDER BY seq"
+DELETE_BY_SEQ = "DELETE FROM candidates WHERE seq = ?"
+SEARCH_SKILLS = """
+    SELECT seq FROM candidate_skills
+    WHERE skill IN (SELECT skill FROM skill_vocab WHERE instr(skill, :skill) > 0)
+"""
+SEARCH_NAMES_FTS = "SELECT rowid FROM candidate_names WHERE candidate_names MATCH :phrase"
+SEARCH_NAMES_SCAN = "SELECT seq FROM candidates WHERE instr(name_lower, :name) > 0"
+SEARCH_PAGE = """
+    SELECT data FROM candidates
+    WHERE seq IN ({skills} UNION {names})
+    ORDER BY seq
+    LIMIT :limit OFFSET :offset
+"""
+SEARCH_FTS = SEARCH_PAGE.format(skills=SEARCH_SKILLS, names=SEARCH_NAMES_FTS)
+SEARCH_SCAN = SEARCH_PAGE.format(skills=SEARCH_SKILLS, names=SEARCH_NAMES_SCAN)
+SELECT_STORE_META = "SELECT key, value FROM store_meta WHERE key IN ('id', 'changes')"
+SELECT_UPLOAD_DAYS = """
+    SELECT day, uploads, score_sum, scored FROM upload_days
+    WHERE day >= :start AND day <= :end
+    ORDER BY day
+"""
+# Fills upload_days for databases created before the table existed
+BACKFILL_UPLOAD_DAYS = """
+    INSERT INTO upload_days (day, uploads, score_sum, scored)
+    SELECT substr(uploaded_at, 1, 10), COUNT(*), coalesce(SUM(match_score), 0), COUNT(match_score)
+    FROM candidates
+    WHERE NOT EXISTS (SELECT 1 FROM upload_days)
+    GROUP BY substr(uploaded_at, 1, 10)
+"""
+
+
+class SQLiteDatabase(CandidateStore):
+    """
+    SQLite candidate store
+
+    Runs in WAL mode so readers never block on an in-flight upload, keeps a
+    small pool of connections shared across request threads and serializes
+    writers in-process (SQLite allows a single writer at a time).
+
+    Search uses an inverted skill table plus an FTS5 trigram index on names,
+    falling back to a name scan when FTS5 is unavailable or the query is
+    shorter than a trigram. Per-day upload counters are maintained by
+    triggers, so statistics never scan the candidates table.
+
+    Triggers also count every row change in store_meta. The fingerprint is
+    that count as of startup plus this process's own changes, so it stops
+    matching the stored count as soon as another process writes.
+    """
+
+    def __init__(self, path: str, pool_size: int = settings.SQLITE_POOL_SIZE):
+        super().__init__()
+        self.path = path
+        self._uri = path.startswith('file:')
+        self._pool: queue.Queue = queue.Queue()
+        self._write_lock = threading.Lock()
+
+        if not self._uri and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        for _ in range(max(1, pool_size)):
+            self._pool.put(self._connect())
+
+        with self._connection() as conn:
+            for statement in SCHEMA:
+                conn.execute(statement)
+            try:
+                conn.execute(FTS_SCHEMA)
+                self._fts = True
+            except sqlite3.OperationalError:
+                self._fts = False
+            conn.execute(BACKFILL_UPLOAD_DAYS)
+            conn.commit()
+            meta = dict(conn.execute(SELECT_STORE_META).fetchall())
+        self._store_id = meta['id']
+        self._changes = meta['changes']
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a pooled connection"""
+        conn = sqlite3.connect(
+            self.path,
+            uri=self._uri,
+            check_same_thread=False,
+            timeout=30,
+            cached_statements=256,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection from the pool"""
+        conn = self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    @staticmethod
+    def _row_params(candidate: Candidate) -> tuple:
+        """Column values for a candidate row"""
+        return (
+            candidate.id,
+            candidate.email.lower(),
+            candidate.name.lower(),
+            candidate.uploadedAt,
+            candidate.matchScore,
+            candidate.model_dump_json(),
+        )
+
+    @staticmethod
+    def _to_candidate(row: tuple) -> Candidate:
+        """Build a candidate from a stored row"""
+        return Candidate.model_validate_json(row[0])
+
+    def _storage_fingerprint(self) -> Optional[str]:
+        """Store id and the row changes this process knows about"""
+        return f"{self._store_id}:{self._changes}"
+
+    def _delete_rows(self, conn: sqlite3.Connection, candidate_id: str) -> bool:
+        """Delete a candidate row and its index entries"""
+        row = conn.execute(SELECT_SEQ, (candidate_id,)).fetchone()
+        if row is None:
+            return False
+        conn.execute(DELETE_SKILLS, row)
+        if self._fts:
+            conn.execute(DELETE_NAME, row)
+        conn.execute(DELETE_BY_SEQ, row)
+        return True
+
+    def _insert_rows(self, conn: sqlite3.Connection, candidate: Candidate) -> int:
+        """Insert (or replace) a candidate row and its index entries; returns rows changed"""
+        skills = {normalize_skill(s) for s in candidate.skills}
+        replaced = self._delete_rows(conn, candidate.id)
+        seq = conn.execute(INSERT_CANDIDATE, self._row_params(candidate)).lastrowid
+        conn.executemany(INSERT_VOCAB, ((s,) for s in skills))
+        conn.executemany(INSERT_SKILL, ((s, seq) for s in skills))
+        if self._fts:
+            conn.execute(INSERT_NAME, (seq, candidate.name.lower()))
+        return 1 + replaced
+
+    @metrics.timed("db_write")
+    def add_candidate(self, candidate: Candidate) -> Candidate:
+        """Add new candidate"""
+        with self._notifying_write():
+            with self._write_lock:
+                with self._connection() as conn, conn:
+                    changes = self._insert_rows(conn, candidate)
+                self._changes += changes  # Only once committed
+            self._notify_added(candidate)
+        return candidate
+
+    @metrics.timed("db_write")
+    def add_candidates(self, candidates: List[Candidate]) -> List[Candidate]:
+        """Add many candidates in one transaction"""
+        with self._notifying_write():
+            with self._write_lock:
+                with self._connection() as conn, conn:
+                    changes = sum(self._insert_rows(conn, c) for c in candidates)
+                self._changes += changes  # Only once committed
+            for candidate in candidates:
+                self._notify_added(candidate)
+        return candidates
+
+    @metrics.timed("db_read")
+    def get_all_candidates(self) -> List[Candidate]:
+        """Get all candidates"""
+        with self._connection() as conn:
+            rows = conn.execute(SELECT_ALL).fetchall()
+        return [self._to_candidate(r) for r in rows]
+
+    @metrics.timed("db_read")
+    def get_candidate_ids(self) -> List[str]:
+        """Get all candidate IDs in insertion order"""
+        with self._connection() as conn:
+            rows = conn.execute(SELECT_IDS).fetchall()
+        return [r[0] for r in rows]
+
+    @metrics.timed("db_read")
+    def get_candidates_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100
+    ) -> Tuple[List[Candidate], Optional[str]]:
+        """Keyset page on seq (the cursor is the last seq returned)"""
+        after = decode_cursor(cursor)
+        with self._connection() as conn:
+            rows = conn.execute(SELECT_PAGE, (after, limit + 1)).fetchall()
+        page = [self._to_candidate(r) for r in rows[:limit]]
+        return page, str(rows[limit - 1][1]) if len(rows) > limit else None
+
+    @metrics.timed("db_read")
+    def get_candidate_by_id(self, candidate_id: str) -> Optional[Candidate]:
+        """Get candidate by ID"""
+        with self._connection() as conn:
+            row = conn.execute(SELECT_BY_ID, (candidate_id,)).fetchone()
+        return self._to_candidate(row) if row else None
+
+    @metrics.timed("db_read")
+    def get_candidates_by_email(self, email: str) -> List[Candidate]:
+        """Get candidates by email (case-insensitive)"""
+        with self._connection() as conn:
+            rows = conn.execute(SELECT_BY_EMAIL, (email.lower(),)).fetchall()
+        return [self._to_candidate(r) for r in rows]
+
+    @metrics.timed("db_write")
+    def delete_candidate(self, candidate_id: str) -> bool:
+        """Delete candidate"""
+        with self._notifying_write():
+            with self._write_lock:
+                with self._connection() as conn, conn:
+                    deleted = self._delete_rows(conn, candidate_id)
+                self._changes += deleted  # Only once committed
+            if deleted:
+                self._notify_deleted(candidate_id)
+        return deleted
+
+    @metrics.timed("db_read")
+    def search_candidates(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Candidate]:
+        """Search candidates by name or skills, in insertion order"""
+        skill = normalize_skill(query)
+        if not skill:
+            return []  # instr() finds a blank query in every row
+        name = query.lower()
+        params = {
+            'skill': skill,
+            'name': name,
+            'phrase': '"' + name.replace('"', '""') + '"',
+            'limit': -1 if limit is None else limit,
+            'offset': offset,
+        }
+        sql = SEARCH_FTS if self._fts and len(name) >= NGRAM_SIZE else SEARCH_SCAN
+        with self._connection() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [self._to_candidate(r) for r in rows]
+
+    @metrics.timed("db_read")
+    def get_upload_days(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None
+    ) -> Dict[str, DayBucket]:
+        """Per-day upload buckets from the trigger-maintained table"""
+        params = {'start': start or '', 'end': end or '9999-12-31'}
+        with self._connection() as conn:
+            rows = conn.execute(SELECT_UPLOAD_DAYS, params).fetchall()
+        return {day: (uploads, score_sum, scored) for day, uploads, score_sum, scored in rows}
@@ -0,0 +1,53 @@
+from typing import Dict, List, Optional, Tuple
+from app.models.candidate import Candidate
+
+
+# Per-day aggregate: (uploads, match score sum, scored uploads)
+DayBucket = Tuple[int, float, int]
+
+
+def upload_day(uploaded_at: str) -> str:
+    """Day key (YYYY-MM-DD) of an ISO upload timestamp"""
+    return uploaded_at[:10]
+
+
+class UploadStatsIndex:
+    """
+    Upload counts and match score sums bucketed by day
+
+    Maintained on every insert and delete, so statistics cost O(days)
+    instead of a pass over every candidate. Day keys are ISO dates and
+    compare as strings, which keeps range queries free of date parsing.
+    """
+
+    def __init__(self):
+        self._days: Dict[str, List] = {}
+
+    def add(self, candidate: Candidate):
+        """Count a stored candidate"""
+        bucket = self._days.setdefault(upload_day(candidate.uploadedAt), [0, 0.0, 0])
+        bucket[0] += 1
+        if candidate.matchScore is not None:
+            bucket[1] += candidate.matchScore
+            bucket[2] += 1
+
+    def remove(self, candidate: Candidate):
+        """Uncount a deleted candidate"""
+        day = upload_day(candidate.uploadedAt)
+        bucket = self._days.get(day)
+        if bucket is None:
+            return
+        bucket[0] -= 1
+        if candidate.matchScore is not None:
+            bucket[1] -= candidate.matchScore
+            bucket[2] -= 1
+        if bucket[0] <= 0:
+            del self._days[day]
+
+    def days(self, start: Optional[str] = None, end: Optional[str] = None) -> Dict[str, DayBucket]:
+        """Buckets for days in [start, end] (inclusive), oldest first"""
+        return {
+            day: tuple(bucket)
+            for day, bucket in sorted(self._days.items())
+            if (start is None or day >= start) and (end is None or day <= end)
+        }
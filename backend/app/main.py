@@ -1,10 +1,20 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 from fastapi.staticfiles import StaticFiles
 import os
 
 from app.config import settings
-from app.routes import upload, candidates, matching
+from app.database import db
+from app.routes import upload, candidates, matching, admin
+from app.services.feature_cache import feature_cache
+from app.services.ingest_queue import ingest_queue
+from app.services.metrics import CONTENT_TYPE, metrics
+from app.services.parallel_matcher import parallel_matcher
+from app.services.parse_cache import parse_cache
+from app.services.vector_index import vector_index
+from app.utils.request_metrics import MetricsMiddleware
+from app.utils.request_profiler import ProfilerMiddleware
 
 # Create FastAPI app
 app = FastAPI(
@@ -29,6 +39,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Opt-in profiling of requests to a route armed via /api/admin/profile
+app.add_middleware(ProfilerMiddleware)
+
+# Request metrics - outermost, so CORS preflights are measured too
+app.add_middleware(MetricsMiddleware)
+
 # Ensure upload directory exists
 os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
 os.makedirs("data", exist_ok=True)
@@ -37,6 +53,23 @@ os.makedirs("data", exist_ok=True)
 app.include_router(upload.router, prefix="/api", tags=["Upload"])
 app.include_router(candidates.router, prefix="/api/candidates", tags=["Candidates"])
 app.include_router(matching.router, prefix="/api/match", tags=["Matching"])
+app.include_router(admin.router, prefix="/api/admin", tags=["Admin"])
+
+
+@app.on_event("startup")
+def startup():
+    """Publish match features for the worker processes in the background"""
+    parallel_matcher.attach(db, feature_cache.snapshot)
+
+
+@app.on_event("shutdown")
+def shutdown():
+    """Finish queued uploads and persist derived data"""
+    ingest_queue.shutdown()
+    parallel_matcher.shutdown()
+    feature_cache.save()
+    vector_index.save()
+    parse_cache.save()
 
 
 @app.get("/")
@@ -56,6 +89,12 @@ def health_check():
     return {"status": "healthy", "environment": settings.ENV}
 
 
+@app.get("/api/metrics", include_in_schema=False)
+def get_metrics():
+    """Request and stage metrics in Prometheus text format"""
+    return Response(content=metrics.render(), media_type=CONTENT_TYPE)
+
+
 if __name__ == "__main__":
     import uvicorn
 
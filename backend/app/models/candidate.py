@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr, Field
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 
@@ -40,6 +40,15 @@ class Candidate(BaseModel):
 class CandidateStats(BaseModel):
     """Candidate statistics"""
     total: int
-    thisWeek: int
-    thisMonth: int
+    thisWeek: int  # Uploads in the last 7 calendar days, today included
+    thisMonth: int  # Uploads in the last 30 calendar days, today included
     avgMatchScore: float
+
+
+class CandidateRangeStats(BaseModel):
+    """Upload statistics for a date range"""
+    start: Optional[str] = None
+    end: Optional[str] = None
+    total: int
+    avgMatchScore: float
+    daily: Dict[str, int]
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import List, Optional
+from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
 
 
 class JobDescription(BaseModel):
@@ -29,3 +29,17 @@ class MatchRequest(BaseModel):
     """Request for matching candidates"""
     jobDescription: JobDescription
     topN: int = 10
+    mode: Literal["rules", "semantic"] = "rules"
+
+
+class BatchMatchRequest(BaseModel):
+    """Request for matching candidates to many job descriptions at once"""
+    jobDescriptions: List[JobDescription] = Field(min_length=1)
+    topN: int = 10
+
+
+class BatchMatchResult(BaseModel):
+    """Ranked candidates for one job description of a batch"""
+    jobId: Optional[str] = None
+    title: str
+    results: List[MatchResult]
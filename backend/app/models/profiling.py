@@ -0,0 +1,8 @@
+from pydantic import BaseModel, Field
+
+
+class ProfileRequest(BaseModel):
+    """Request for profiling the next requests to a route"""
+    route: str  # Route template, e.g. "/api/match" or "/api/candidates/{candidate_id}"
+    method: str = "POST"
+    requests: int = Field(default=1, ge=1, le=100)
@@ -0,0 +1,102 @@
+import os
+import secrets
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.responses import FileResponse, JSONResponse
+from app.config import settings
+from app.models.profiling import ProfileRequest
+from app.services.profiler import ProfilerBusyError, profiler
+
+
+def require_admin_token(x_admin_token: str = Header(default="")):
+    """Reject calls without the configured admin token"""
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Admin endpoints are disabled")
+    if not secrets.compare_digest(x_admin_token, settings.ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+router = APIRouter(dependencies=[Depends(require_admin_token)])
+
+
+def _get_session(profile_id: str):
+    """Profile session or 404"""
+    session = profiler.get(profile_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return session
+
+
+@router.post("/profile")
+async def start_profile(profile_request: ProfileRequest, request: Request):
+    """
+    Profile the next N requests to a route
+
+    Matching requests run under cProfile one at a time; poll the returned
+    profileId for the summary once captured equals requests.
+    """
+    routes = {getattr(route, "path", None) for route in request.app.routes}
+    if profile_request.route not in routes:
+        raise HTTPException(status_code=400, detail=f"Unknown route '{profile_request.route}'")
+
+    try:
+        session = profiler.start(profile_request.method, profile_request.route, profile_request.requests)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    return JSONResponse(
+        status_code=201,
+        content={
+            "success": True,
+            "data": session.to_dict(),
+            "message": f"Profiling the next {session.requests} {session.method} {session.route} request(s)"
+        }
+    )
+
+
+@router.get("/profile")
+async def list_profiles():
+    """Recent profiling sessions"""
+    return JSONResponse(
+        status_code=200,
+        content={
+            "success": True,
+            "data": [session.to_dict(limit=0) for session in profiler.recent()]
+        }
+    )
+
+
+@router.get("/profile/{profile_id}")
+async def get_profile(profile_id: str, limit: int = Query(30, ge=0, le=500)):
+    """Session status, span timings and the top functions by cumulative time"""
+    session = _get_session(profile_id)
+    return JSONResponse(
+        status_code=200,
+        content={
+            "success": True,
+            "data": session.to_dict(limit=limit)
+        }
+    )
+
+
+@router.get("/profile/{profile_id}/download")
+async def download_profile(profile_id: str):
+    """Raw pstats dump of a finished session (for snakeviz or pstats)"""
+    session = _get_session(profile_id)
+    if not session.stats_path or not os.path.exists(session.stats_path):
+        raise HTTPException(status_code=404, detail="Profile has no saved stats yet")
+    return FileResponse(session.stats_path, media_type="application/octet-stream", filename=f"{session.id}.prof")
+
+
+@router.delete("/profile/{profile_id}")
+async def cancel_profile(profile_id: str):
+    """Stop a session early, keeping what it captured"""
+    session = profiler.cancel(profile_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return JSONResponse(
+        status_code=200,
+        content={
+            "success": True,
+            "data": session.to_dict()
+        }
+    )
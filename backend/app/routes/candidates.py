@@ -1,38 +1,95 @@
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
-from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import JSONResponse, StreamingResponse
+from datetime import date
+from typing import Iterator, List, Literal, Optional, Set
 from app.models.candidate import Candidate, CandidateStats
-from app.database.mock_db import db
+from app.database import db
+from app.database.base import decode_cursor
+from app.utils.serialization import dump_candidates, envelope
 
 router = APIRouter()
 
+DEFAULT_PAGE_SIZE = 100
+EXPORT_BATCH_SIZE = 1000
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[Set[str]]:
+    """Validate a comma-separated field projection (id is always included)"""
+    if not fields:
+        return None
+    selected = {f.strip() for f in fields.split(',') if f.strip()}
+    unknown = selected - Candidate.model_fields.keys()
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+    return selected | {"id"}
+
+
+def _ndjson_lines(cursor: Optional[str], include: Optional[Set[str]]) -> Iterator[bytes]:
+    """Every candidate after the cursor as one JSON line, batch by batch"""
+    for batch in db.iter_candidates(EXPORT_BATCH_SIZE, cursor):
+        yield b''.join(c.model_dump_json(include=include).encode() + b'\n' for c in batch)
+
 
 @router.get("")
-async def get_all_candidates():
-    """Get all candidates from database"""
+async def get_all_candidates(
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = Query(None, description="Comma-separated fields, e.g. name,skills,matchScore"),
+    response_format: Literal["json", "ndjson"] = Query("json", alias="format")
+):
+    """
+    Get candidates from database
+
+    Without limit/cursor the whole pool is returned, as before. With them
+    the response is one page plus "nextCursor" (null on the last page);
+    pass it back as `cursor` for the next page. `fields` trims each
+    candidate to the listed fields. format=ndjson streams every candidate
+    (after `cursor`) as newline-delimited JSON in bounded batches, for
+    exports of any size.
+    """
+    include = _parse_fields(fields)
     try:
-        candidates = db.get_all_candidates()
-        return JSONResponse(
-            status_code=200,
-            content={
-                "success": True,
-                "data": [c.model_dump() for c in candidates]
-            }
-        )
+        decode_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        if response_format == "ndjson":
+            return StreamingResponse(_ndjson_lines(cursor, include), media_type="application/x-ndjson")
+
+        if limit is None and cursor is None:
+            return envelope(dump_candidates(db.get_all_candidates(), include))
+
+        candidates, next_cursor = db.get_candidates_page(cursor, limit or DEFAULT_PAGE_SIZE)
+        return envelope(dump_candidates(candidates, include), nextCursor=next_cursor)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/stats")
-async def get_candidate_stats():
-    """Get candidate statistics"""
+async def get_candidate_stats(
+    start: Optional[date] = Query(None, description="First upload day (YYYY-MM-DD)"),
+    end: Optional[date] = Query(None, description="Last upload day (YYYY-MM-DD), inclusive")
+):
+    """
+    Get candidate statistics
+
+    thisWeek and thisMonth count uploads in the last 7 and 30 calendar
+    days, today included. With start and/or end, also returns upload counts for that date range
+    and a per-day histogram under "range".
+    """
     try:
-        stats = db.get_stats()
+        data = db.get_stats().model_dump()
+        if start is not None or end is not None:
+            data["range"] = db.get_range_stats(
+                start.isoformat() if start else None,
+                end.isoformat() if end else None
+            ).model_dump()
         return JSONResponse(
             status_code=200,
             content={
                 "success": True,
-                "data": stats.model_dump()
+                "data": data
             }
         )
     except Exception as e:
@@ -40,20 +97,19 @@ async def get_candidate_stats():
 
 
 @router.get("/search")
-async def search_candidates(q: str):
+async def search_candidates(
+    q: str,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    offset: int = Query(0, ge=0)
+):
     """Search candidates by name or skills"""
     try:
+        q = q.strip()
         if not q:
             raise HTTPException(status_code=400, detail="Query parameter 'q' is required")
 
-        candidates = db.search_candidates(q)
-        return JSONResponse(
-            status_code=200,
-            content={
-                "success": True,
-                "data": [c.model_dump() for c in candidates]
-            }
-        )
+        candidates = db.search_candidates(q, limit=limit, offset=offset)
+        return envelope(dump_candidates(candidates), limit=limit, offset=offset)
     except HTTPException:
         raise
     except Exception as e:
@@ -1,24 +1,54 @@
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import JSONResponse
-from app.models.job import MatchRequest, MatchResult
+from starlette.concurrency import run_in_threadpool
+from typing import List
+from app.models.job import BatchMatchRequest, BatchMatchResult, MatchRequest, MatchResult
 from app.services.ai_matcher import ai_matcher
-from app.database.mock_db import db
+from app.services.feature_cache import feature_cache
+from app.services.match_scoring import CandidateFeatures
+from app.services.match_cache import match_cache
+from app.services.profiler import profiler
+from app.services.vector_index import vector_index
+from app.database import db
+from app.config import settings
+from app.utils.serialization import dump_batch_match_results, dump_match_results, envelope
 
 router = APIRouter()
 
 
+def _rank(request: MatchRequest, features: CandidateFeatures, depth: int) -> List[MatchResult]:
+    """Rank the pool for one request (blocking)"""
+    if request.mode == "semantic":
+        return ai_matcher.match_semantic(
+            index=vector_index,
+            job_description=request.jobDescription,
+            top_n=depth,
+            get_candidate=db.get_candidate_by_id
+        )
+    return ai_matcher.match_features(
+        features=features,
+        job_description=request.jobDescription,
+        top_n=depth,
+        get_candidate=db.get_candidate_by_id
+    )
+
+
 @router.post("")
 async def match_candidates(request: MatchRequest):
     """
     Match candidates to job description using AI
 
-    Returns top N candidates ranked by match score
+    Returns top N candidates ranked by match score. mode="semantic" ranks
+    by offline embedding similarity instead of the skill/experience rules.
     """
     try:
-        # Get all candidates from database
-        candidates = db.get_all_candidates()
+        # Reload external writes first so features and cache key are current
+        db.refresh()
+
+        # Precomputed features; full records are only loaded for the top N
+        features = feature_cache.snapshot()
 
-        if not candidates:
+        if not features.count_alive():
             return JSONResponse(
                 status_code=200,
                 content={
@@ -28,28 +58,75 @@ async def match_candidates(request: MatchRequest):
                 }
             )
 
-        # Perform matching
-        results = ai_matcher.match_candidates(
-            candidates=candidates,
-            job_description=request.jobDescription,
-            top_n=request.topN
+        # Serve repeated requests (e.g. UI paging) from the result cache
+        cache_key = match_cache.key(request.jobDescription, request.mode)
+        results = match_cache.get(cache_key, request.topN)
+
+        if results is None:
+            depth = max(request.topN, settings.MATCH_CACHE_DEPTH)
+
+            # Perform matching off the event loop (large pools fan out to
+            # the sharded matcher's processes); profiled there when armed
+            results = await run_in_threadpool(profiler.run, _rank, request, features, depth)
+
+            match_cache.put(cache_key, results, depth)
+            results = results[:request.topN]
+
+        # Note: match scores are per job description, so they are returned
+        # to the caller rather than written back onto the shared candidates
+
+        return envelope(dump_match_results(results))
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error matching candidates: {str(e)}"
         )
 
-        # Update candidates with match scores in database
-        for result in results:
-            candidate_id = result.candidate['id']
-            candidate = db.get_candidate_by_id(candidate_id)
-            if candidate:
-                candidate.matchScore = result.matchScore
-                # Note: In a real DB, we'd update here
 
-        return JSONResponse(
-            status_code=200,
-            content={
-                "success": True,
-                "data": [r.model_dump() for r in results]
-            }
+@router.post("/batch")
+async def match_candidates_batch(request: BatchMatchRequest):
+    """
+    Rank the pool for many job descriptions in one call
+
+    Candidate features are loaded once and every job is scored in the
+    same (candidates x jobs) pass, so a nightly re-rank of dozens of
+    requisitions costs about one pool scan. Results come back in request
+    order with the top N per job.
+    """
+    if len(request.jobDescriptions) > settings.MATCH_BATCH_MAX_JOBS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many job descriptions. Maximum is {settings.MATCH_BATCH_MAX_JOBS} per request"
+        )
+
+    try:
+        db.refresh()
+        features = feature_cache.snapshot()
+
+        if not features.count_alive():
+            return JSONResponse(
+                status_code=200,
+                content={
+                    "success": True,
+                    "data": [],
+                    "message": "No candidates found in database"
+                }
+            )
+
+        ranked = await run_in_threadpool(
+            profiler.run,
+            ai_matcher.match_batch,
+            features,
+            request.jobDescriptions,
+            request.topN,
+            db.get_candidate_by_id
         )
+        results = [
+            BatchMatchResult(jobId=job.id, title=job.title, results=job_results)
+            for job, job_results in zip(request.jobDescriptions, ranked)
+        ]
+        return envelope(dump_batch_match_results(results))
 
     except Exception as e:
         raise HTTPException(
@@ -58,6 +135,18 @@ async def match_candidates(request: MatchRequest):
         )
 
 
+@router.get("/cache/stats")
+async def get_match_cache_stats():
+    """Match result cache hit/miss counters"""
+    return JSONResponse(
+        status_code=200,
+        content={
+            "success": True,
+            "data": match_cache.stats()
+        }
+    )
+
+
 @router.post("/analyze/{candidate_id}")
 async def analyze_candidate(candidate_id: str):
     """
@@ -1,70 +1,272 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi import APIRouter, UploadFile, File, HTTPException, Request
 from fastapi.responses import JSONResponse
-import os
-import shutil
-from app.services.resume_parser import resume_parser
-from app.database.mock_db import db
+from starlette.concurrency import run_in_threadpool
+from collections import deque
+from typing import Dict, Iterator, List, Tuple
+import zipfile
+from app.database import db
+from app.models.candidate import Candidate
+from app.services.ingest_queue import ingest_queue, QueueFullError
+from app.services.parse_cache import content_digest, parse_cache
+from app.services.profiler import profiler
+from app.utils.streaming_upload import MalformedUploadError, UploadTooLargeError, read_multipart_file
 from app.config import settings
 
 router = APIRouter()
 
+RESUME_EXTENSIONS = ('.pdf', '.docx')
 
-@router.post("/upload")
-async def upload_resume(file: UploadFile = File(...)):
+
+UPLOAD_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["file"],
+                    "properties": {"file": {"type": "string", "format": "binary"}}
+                }
+            }
+        }
+    }
+}
+
+
+def _too_large() -> HTTPException:
+    """Error for uploads over MAX_UPLOAD_SIZE"""
+    return HTTPException(
+        status_code=400,
+        detail=f"File too large. Maximum size is {settings.MAX_UPLOAD_SIZE / (1024*1024)}MB."
+    )
+
+
+@router.post("/upload", openapi_extra=UPLOAD_REQUEST_BODY)
+async def upload_resume(request: Request):
     """
-    Upload and parse resume
+    Upload a resume for parsing
 
-    Accepts PDF or DOCX files, extracts candidate information,
-    and stores in database
+    Accepts PDF or DOCX files and queues them for parsing in a worker
+    process. The body is streamed and size-checked as it arrives, and the
+    file is handed to the worker from memory without touching disk.
+    Returns a job id immediately; poll /api/upload/jobs/{job_id} for the
+    extracted candidate. A file identical to a stored resume resolves to
+    that candidate at once (`duplicate: true`). Responds 429 when the
+    queue is full.
     """
 
+    # Stream the file part, enforcing the size limit while reading
+    try:
+        filename, file_content = await read_multipart_file(request, "file", settings.MAX_UPLOAD_SIZE)
+    except UploadTooLargeError:
+        raise _too_large()
+    except MalformedUploadError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
     # Validate file type
-    if not file.filename.endswith(('.pdf', '.docx')):
+    if not filename.endswith(RESUME_EXTENSIONS):
         raise HTTPException(
             status_code=400,
             detail="Invalid file type. Only PDF and DOCX files are allowed."
         )
 
-    # Validate file size
-    file_content = await file.read()
-    if len(file_content) > settings.MAX_UPLOAD_SIZE:
+    try:
+        job = ingest_queue.submit(file_content, filename)
+
+    except QueueFullError as e:
         raise HTTPException(
-            status_code=400,
-            detail=f"File too large. Maximum size is {settings.MAX_UPLOAD_SIZE / (1024*1024)}MB."
+            status_code=429,
+            detail=str(e),
+            headers={"Retry-After": "5"}
         )
 
-    # Save file temporarily
-    file_path = os.path.join(settings.UPLOAD_DIR, file.filename)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error processing resume: {str(e)}"
+        )
 
-    try:
-        with open(file_path, 'wb') as f:
-            f.write(file_content)
-
-        # Parse resume
-        candidate = resume_parser.parse_resume(file_path, file.filename)
-
-        # Store in database
-        db.add_candidate(candidate)
-
-        return JSONResponse(
-            status_code=200,
-            content={
-                "success": True,
-                "data": {
-                    "candidateId": candidate.id,
-                    "candidate": candidate.model_dump(),
-                    "message": "Resume uploaded and parsed successfully"
-                }
+    return JSONResponse(
+        status_code=202,
+        content={
+            "success": True,
+            "data": {
+                **job.to_dict(),
+                "message": "Resume queued for parsing"
             }
-        )
+        }
+    )
+
+
+def _read_limited(f, name: str, summary: List[dict]):
+    """Read at most MAX_UPLOAD_SIZE bytes, recording oversized files"""
+    content = f.read(settings.MAX_UPLOAD_SIZE + 1)
+    if len(content) > settings.MAX_UPLOAD_SIZE:
+        summary.append({"filename": name, "status": "failed", "error": "File too large"})
+        return None
+    return content
+
+
+def _iter_resumes(files: List[UploadFile], summary: List[dict]) -> Iterator[Tuple[str, bytes]]:
+    """
+    Yield (name, bytes) for every resume in the upload
+
+    ZIP archives are read entry by entry straight from the uploaded file,
+    never extracted to disk. Unsupported, oversized and over-limit entries
+    are recorded in the summary instead.
+    """
+    count = 0
 
+    def accept(name: str) -> bool:
+        nonlocal count
+        if not name.endswith(RESUME_EXTENSIONS):
+            summary.append({"filename": name, "status": "skipped", "error": "Unsupported file type"})
+            return False
+        if count >= settings.BULK_UPLOAD_MAX_FILES:
+            summary.append({"filename": name, "status": "skipped", "error": "Bulk upload file limit reached"})
+            return False
+        count += 1
+        return True
+
+    for upload in files:
+        if upload.filename.endswith('.zip'):
+            try:
+                archive = zipfile.ZipFile(upload.file)
+            except zipfile.BadZipFile:
+                summary.append({"filename": upload.filename, "status": "failed", "error": "Invalid ZIP archive"})
+                continue
+
+            with archive:
+                for info in archive.infolist():
+                    name = f"{upload.filename}/{info.filename}"
+                    if info.is_dir() or not accept(name):
+                        continue
+                    if info.file_size > settings.MAX_UPLOAD_SIZE:
+                        summary.append({"filename": name, "status": "failed", "error": "File too large"})
+                        continue
+                    with archive.open(info) as entry:
+                        content = _read_limited(entry, name, summary)
+                    if content is not None:
+                        yield name, content
+
+        elif accept(upload.filename):
+            content = _read_limited(upload.file, upload.filename, summary)
+            if content is not None:
+                yield upload.filename, content
+
+
+def _ingest_bulk(files: List[UploadFile]) -> List[dict]:
+    """Parse every new resume in parallel, then store them in one write"""
+    summary: List[dict] = []
+    parsed: List[Tuple[str, str, Candidate]] = []
+    digests: deque = deque()
+    first_seen: Dict[str, str] = {}
+    repeats: List[Tuple[str, str]] = []
+
+    def unseen(resumes: Iterator[Tuple[str, bytes]]) -> Iterator[Tuple[str, bytes]]:
+        """Skip files already stored or repeated within this upload"""
+        for name, content in resumes:
+            digest = content_digest(content)
+            if digest in first_seen:
+                repeats.append((name, digest))
+                continue
+            existing = parse_cache.lookup(digest, len(content))
+            if existing is not None:
+                summary.append({"filename": name, "status": "duplicate", "candidateId": existing.id})
+                continue
+            first_seen[digest] = name
+            digests.append(digest)
+            yield name, content
+
+    for name, result in ingest_queue.parse_many(unseen(_iter_resumes(files, summary))):
+        digest = digests.popleft()
+        if isinstance(result, Exception):
+            summary.append({"filename": name, "status": "failed", "error": str(result)})
+        else:
+            parsed.append((name, digest, result))
+
+    if parsed:
+        db.add_candidates([candidate for _, _, candidate in parsed])
+    stored_ids = {}
+    for name, digest, candidate in parsed:
+        parse_cache.put(digest, candidate.id)
+        stored_ids[digest] = candidate.id
+        summary.append({"filename": name, "status": "stored", "candidateId": candidate.id})
+
+    for name, digest in repeats:
+        if digest in stored_ids:
+            summary.append({"filename": name, "status": "duplicate", "candidateId": stored_ids[digest]})
+        else:
+            summary.append({"filename": name, "status": "failed", "error": f"Same file as {first_seen[digest]}, which failed"})
+    return summary
+
+
+@router.post("/upload/bulk")
+async def upload_resumes_bulk(files: List[UploadFile] = File(...)):
+    """
+    Upload many resumes at once
+
+    Accepts any mix of PDF, DOCX and ZIP files. Resumes are parsed in
+    parallel worker processes and committed to the database in a single
+    batched write; files identical to an already stored resume are
+    reported as duplicates instead. The response summarizes the outcome
+    per file. Responds 429 when the ingestion queue has no free capacity.
+    """
+    try:
+        summary = await run_in_threadpool(profiler.run, _ingest_bulk, files)
+    except QueueFullError as e:
+        raise HTTPException(
+            status_code=429,
+            detail=str(e),
+            headers={"Retry-After": "5"}
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500,
-            detail=f"Error processing resume: {str(e)}"
+            detail=f"Error processing resumes: {str(e)}"
         )
 
-    finally:
-        # Clean up uploaded file
-        if os.path.exists(file_path):
-            os.remove(file_path)
+    counts = {status: 0 for status in ("stored", "duplicate", "failed", "skipped")}
+    for item in summary:
+        counts[item["status"]] += 1
+
+    return JSONResponse(
+        status_code=200,
+        content={
+            "success": True,
+            "data": {
+                "total": len(summary),
+                **counts,
+                "results": summary
+            }
+        }
+    )
+
+
+@router.get("/upload/jobs/{job_id}")
+async def get_upload_job(job_id: str):
+    """Get the status of a queued resume"""
+    job = ingest_queue.get(job_id)
+
+    if not job:
+        raise HTTPException(status_code=404, detail="Upload job not found")
+
+    return JSONResponse(
+        status_code=200,
+        content={
+            "success": True,
+            "data": job.to_dict()
+        }
+    )
+
+
+@router.get("/upload/queue")
+async def get_upload_queue():
+    """Get ingestion queue depth and capacity"""
+    return JSONResponse(
+        status_code=200,
+        content={
+            "success": True,
+            "data": ingest_queue.stats()
+        }
+    )
@@ -1,20 +1,49 @@
-from typing import List
-import random
+from itertools import islice
+from typing import Callable, Iterable, List, Optional, Sequence
+import numpy as np
+from app.config import settings
+from app.database.base import CandidateStore
 from app.models.job import JobDescription, MatchResult
 from app.models.candidate import Candidate
+from app.services.embeddings import job_profile_text
+from app.services.metrics import metrics
+from app.services.parallel_matcher import ShardedMatcher, parallel_matcher
+from app.services.profiler import profiler
+from app.services.vector_index import VectorIndex
+from app.services.match_scoring import (
+    CandidateFeatures,
+    TopK,
+    YEARS_PER_ROLE,
+    job_fingerprint,
+    offer_chunk,
+    parse_required_years,
+    rank_jobs,
+    rank_rows,
+    skill_union,
+    vocab_skill_hits,
+)
 
 
 class AIMatcher:
     """
     AI-powered candidate matching service
 
-    PROTOTYPE VERSION: Uses rule-based matching
-    FUTURE: Integrate OpenAI embeddings or HuggingFace models
+    Rule-based skill/experience scoring, plus offline semantic matching
+    over local embeddings (see match_semantic)
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        chunk_rows: int = settings.MATCH_CHUNK_ROWS,
+        batch_size: int = settings.MATCH_STREAM_BATCH,
+        parallel: Optional[ShardedMatcher] = parallel_matcher
+    ):
         self.use_ai = False  # Set to True when API keys are configured
+        self.chunk_rows = max(1, chunk_rows)  # Feature rows scored per slice
+        self.batch_size = max(1, batch_size)  # Candidates per streamed batch
+        self.parallel = parallel  # Process pool for large feature pools
 
+    @profiler.span("AIMatcher.calculate_skill_match")
     def calculate_skill_match(
         self,
         candidate_skills: List[str],
@@ -45,6 +74,7 @@ class AIMatcher:
         score = len(matched) / len(required_skills)
         return score, matched, missing
 
+    @profiler.span("AIMatcher.calculate_experience_match")
     def calculate_experience_match(
         self,
         candidate: Candidate,
@@ -52,17 +82,14 @@ class AIMatcher:
     ) -> float:
         """Calculate experience match (simplified)"""
         # Count years of experience
-        exp_years = len(candidate.experience) * 2  # Rough estimate
+        exp_years = len(candidate.experience) * YEARS_PER_ROLE  # Rough estimate
 
         # Extract required years from string (e.g., "3-5 years")
-        import re
-        numbers = re.findall(r'\d+', required_experience)
+        required_years = parse_required_years(required_experience)
 
-        if not numbers:
+        if required_years is None:
             return 0.7  # Default moderate match
 
-        required_years = int(numbers[0])
-
         if exp_years >= required_years:
             return 1.0
         elif exp_years >= required_years * 0.7:
@@ -70,6 +97,7 @@ class AIMatcher:
         else:
             return 0.5
 
+    @profiler.span("AIMatcher.generate_reasoning")
     def generate_reasoning(
         self,
         candidate: Candidate,
@@ -85,92 +113,235 @@ class AIMatcher:
         else:
             return f"Moderate match. {candidate.name} has some relevant skills but is missing several key requirements. Consider for roles with training opportunities."
 
+    def _match_result(
+        self,
+        candidate: Candidate,
+        job_description: JobDescription,
+        score: float,
+        raw_score: float,
+        matched_flags: np.ndarray,
+        candidate_data: Optional[dict] = None
+    ) -> MatchResult:
+        """MatchResult for a winner (only winners are dumped and explained)"""
+        matched_skills = [s for s, hit in zip(job_description.skills, matched_flags) if hit]
+        missing_skills = [s for s, hit in zip(job_description.skills, matched_flags) if not hit]
+
+        return MatchResult(
+            candidate=candidate_data if candidate_data is not None else candidate.model_dump(),
+            matchScore=score,
+            matchedSkills=matched_skills,
+            missingSkills=missing_skills,
+            reasoning=self.generate_reasoning(
+                candidate,
+                matched_skills,
+                missing_skills,
+                raw_score
+            )
+        )
+
+    @staticmethod
+    def _job_hash(job_description: JobDescription) -> int:
+        """Seed of the per-job jitter"""
+        return int(job_fingerprint(job_description.skills, job_description.experience)[:16], 16)
+
+    @profiler.span("AIMatcher.match_candidates")
+    @metrics.timed("score")
     def match_candidates(
         self,
-        candidates: List[Candidate],
+        candidates: Iterable[Candidate],
         job_description: JobDescription,
         top_n: int = 10
     ) -> List[MatchResult]:
         """
         Match candidates to job description
 
-        PROTOTYPE: Uses rule-based scoring
-        FUTURE: Use embeddings for semantic matching
-        """
-        results = []
-
-        for candidate in candidates:
-            # Calculate skill match
-            skill_score, matched_skills, missing_skills = self.calculate_skill_match(
-                candidate.skills,
-                job_description.skills
-            )
+        Rule-based scoring; see match_semantic for embedding similarity.
 
-            # Calculate experience match
-            exp_score = self.calculate_experience_match(
-                candidate,
-                job_description.experience
-            )
+        Candidates are consumed in batches, so a generator is never
+        materialized; see match_stream.
+        """
+        iterator = iter(candidates)
+        batches = iter(lambda: list(islice(iterator, self.batch_size)), [])
+        return self.match_stream(batches, job_description, top_n)
 
-            # Overall score (weighted average)
-            overall_score = (skill_score * 0.7) + (exp_score * 0.3)
+    @profiler.span("AIMatcher.match_store")
+    @metrics.timed("score")
+    def match_store(
+        self,
+        store: CandidateStore,
+        job_description: JobDescription,
+        top_n: int = 10
+    ) -> List[MatchResult]:
+        """Match every stored candidate, reading the store page by page"""
+        return self.match_stream(store.iter_candidates(self.batch_size), job_description, top_n)
 
-            # Add small random factor for prototype (simulates AI nuance)
-            overall_score = min(1.0, overall_score + random.uniform(-0.05, 0.05))
+    def match_stream(
+        self,
+        batches: Iterable[Sequence[Candidate]],
+        job_description: JobDescription,
+        top_n: int
+    ) -> List[MatchResult]:
+        """
+        Match a pool that arrives in batches
 
-            # Generate reasoning
-            reasoning = self.generate_reasoning(
-                candidate,
-                matched_skills,
-                missing_skills,
-                overall_score
+        Each batch is scored in one vectorized pass and only its best rows
+        are offered to a bounded heap, so memory holds one batch plus the
+        top N no matter how large the pool is. Ranking is identical to
+        scoring the whole pool at once.
+        """
+        job_hash = self._job_hash(job_description)
+        top = TopK(top_n)
+        offset = 0
+        for batch in batches:
+            if not batch:
+                continue
+            features = CandidateFeatures.from_candidates(batch)
+            offer_chunk(
+                top,
+                features,
+                batch,
+                job_description.skills,
+                job_description.experience,
+                job_hash,
+                offset
             )
+            offset += len(batch)
 
-            # Create match result
-            result = MatchResult(
-                candidate=candidate.model_dump(),
-                matchScore=round(overall_score, 2),
-                matchedSkills=matched_skills,
-                missingSkills=missing_skills,
-                reasoning=reasoning
-            )
+        return [
+            self._match_result(candidate, job_description, score, raw_score, matched_flags)
+            for score, _, (candidate, raw_score, matched_flags) in top.results()
+        ]
 
-            results.append(result)
+    @profiler.span("AIMatcher.match_features")
+    @metrics.timed("score")
+    def match_features(
+        self,
+        features: CandidateFeatures,
+        job_description: JobDescription,
+        top_n: int,
+        get_candidate: Callable[[str], Optional[Candidate]]
+    ) -> List[MatchResult]:
+        """
+        Match precomputed candidate features to a job description
+
+        Rows are scored in slices of chunk_rows, so per-request scratch
+        arrays stay bounded on large pools; pools of MATCH_PARALLEL_MIN_ROWS
+        or more are sharded across the parallel matcher's processes once
+        their snapshot is published. Only
+        the top N candidates are fetched with get_candidate and turned into
+        MatchResult objects.
+        """
+        job_hash = self._job_hash(job_description)
+        vocab_hits = vocab_skill_hits(features.vocab, job_description.skills)
+        rank_args = (features, job_description.skills, job_description.experience, job_hash, top_n)
+        top = None
+        if self.parallel is not None and self.parallel.enabled_for(features):
+            top = self.parallel.rank(*rank_args, vocab_hits)
+        if top is None:
+            top = rank_rows(*rank_args, self.chunk_rows, vocab_hits)
 
-        # Sort by match score (descending)
-        results.sort(key=lambda x: x.matchScore, reverse=True)
+        results = []
+        for score, _, (row, raw_score, matched_flags) in top.results():
+            candidate = get_candidate(features.ids[row])
+            if candidate is None:
+                continue  # Deleted while matching
+            results.append(self._match_result(candidate, job_description, score, raw_score, matched_flags))
 
-        # Return top N
-        return results[:top_n]
+        return results
 
-    def match_with_openai(self, candidates: List[Candidate], job_description: JobDescription):
+    @profiler.span("AIMatcher.match_batch")
+    @metrics.timed("score")
+    def match_batch(
+        self,
+        features: CandidateFeatures,
+        job_descriptions: Sequence[JobDescription],
+        top_n: int,
+        get_candidate: Callable[[str], Optional[Candidate]]
+    ) -> List[List[MatchResult]]:
         """
-        Use OpenAI for semantic matching (future implementation)
+        Match many job descriptions against the pool in one pass
 
-        TODO:
-        1. Generate embeddings for candidate profiles
-        2. Generate embedding for job description
-        3. Calculate cosine similarity
-        4. Use GPT for reasoning generation
+        Every job is scored in the same chunked (candidates x jobs) matrix
+        pass (sharded across processes for large pools), and each winner
+        is fetched and dumped once however many jobs it wins. Per-job
+        results are the same as match_features.
         """
-        # from openai import OpenAI
-        # client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        # ... implementation ...
-        pass
-
-    def match_with_huggingface(self, candidates: List[Candidate], job_description: JobDescription):
+        jobs = [(job.skills, job.experience) for job in job_descriptions]
+        job_hashes = [self._job_hash(job) for job in job_descriptions]
+        vocab_hits = vocab_skill_hits(features.vocab, skill_union(jobs))
+        tops = None
+        if self.parallel is not None and self.parallel.enabled_for(features):
+            tops = self.parallel.rank_jobs(features, jobs, job_hashes, top_n, vocab_hits)
+        if tops is None:
+            tops = rank_jobs(features, jobs, job_hashes, top_n, self.chunk_rows, vocab_hits)
+
+        # row -> (candidate, dumped candidate), shared by every job it wins
+        winners = {}
+        batch_results = []
+        for job_description, top in zip(job_descriptions, tops):
+            results = []
+            for score, _, (row, raw_score, matched_flags) in top.results():
+                if row not in winners:
+                    candidate = get_candidate(features.ids[row])
+                    winners[row] = (candidate, candidate.model_dump() if candidate is not None else None)
+                candidate, candidate_data = winners[row]
+                if candidate is None:
+                    continue  # Deleted while matching
+                results.append(self._match_result(
+                    candidate,
+                    job_description,
+                    score,
+                    raw_score,
+                    matched_flags,
+                    candidate_data
+                ))
+            batch_results.append(results)
+
+        return batch_results
+
+    @profiler.span("AIMatcher.match_semantic")
+    @metrics.timed("score")
+    def match_semantic(
+        self,
+        index: VectorIndex,
+        job_description: JobDescription,
+        top_n: int,
+        get_candidate: Callable[[str], Optional[Candidate]]
+    ) -> List[MatchResult]:
         """
-        Use HuggingFace models for matching (future implementation)
+        Match by embedding similarity (runs offline on CPU)
 
-        TODO:
-        1. Load sentence-transformers model
-        2. Generate embeddings
-        3. Calculate similarity scores
+        Candidate embeddings are computed once at upload by the vector
+        index; a request only embeds the job description and runs a top-k
+        search. Scores are the index's calibrated 0-1 similarity, so the
+        usual reasoning thresholds apply. Skill lists are still filled in
+        for the winners.
         """
-        # from sentence_transformers import SentenceTransformer
-        # model = SentenceTransformer('all-MiniLM-L6-v2')
-        # ... implementation ...
-        pass
+        results = []
+        for candidate_id, score in index.search(job_profile_text(job_description), top_n):
+            candidate = get_candidate(candidate_id)
+            if candidate is None:
+                continue  # Deleted while matching
+
+            _, matched_skills, missing_skills = self.calculate_skill_match(
+                candidate.skills,
+                job_description.skills
+            )
+
+            results.append(MatchResult(
+                candidate=candidate.model_dump(),
+                matchScore=round(score, 2),
+                matchedSkills=matched_skills,
+                missingSkills=missing_skills,
+                reasoning=self.generate_reasoning(
+                    candidate,
+                    matched_skills,
+                    missing_skills,
+                    score
+                )
+            ))
+
+        return results
 
 
 # Create matcher instance
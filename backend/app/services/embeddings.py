@@ -0,0 +1,106 @@
+import re
+import zlib
+from typing import Dict, List
+import numpy as np
+from app.config import settings
+from app.models.candidate import Candidate
+from app.models.job import JobDescription
+
+
+_token_pattern = re.compile(r'[a-z0-9][a-z0-9+#.]*')
+
+
+def candidate_profile_text(candidate: Candidate) -> str:
+    """Text used to embed a candidate"""
+    parts = [', '.join(candidate.skills), candidate.summary or '']
+    parts.extend(f"{e.position} {e.description or ''}" for e in candidate.experience)
+    parts.extend(f"{e.degree} {e.field or ''}" for e in candidate.education)
+    return '\n'.join(parts)
+
+
+def job_profile_text(job: JobDescription) -> str:
+    """Text used to embed a job description"""
+    parts = [job.title, ', '.join(job.skills), job.description, *job.requirements]
+    return '\n'.join(parts)
+
+
+class HashingEncoder:
+    """
+    Hashed term-frequency encoder (no model download, CPU only)
+
+    Words and comma-separated phrases (e.g. "machine learning") are hashed
+    into `dim` signed buckets with CRC32, which is stable across processes.
+    Document vectors hold sublinear TF and are L2-normalized; IDF is applied
+    to the query side at search time, so stored vectors never need to be
+    recomputed as the corpus grows.
+
+    Because of that asymmetry raw cosines are small: a profile sharing most
+    of a job's skills and wording reaches about a quarter of the job text's
+    own score, which is where similarity_full puts a full match.
+    """
+
+    uses_idf = True
+    similarity_floor = 0.0
+    similarity_full = 0.25
+
+    def __init__(self, dim: int):
+        self.dim = dim
+        self.name = f"hashing-tf-{dim}"
+
+    def _tokens(self, text: str) -> List[str]:
+        """Words plus multi-word phrases"""
+        text = text.lower()
+        tokens = _token_pattern.findall(text)
+        tokens.extend(
+            ' '.join(phrase.split())
+            for phrase in re.split(r'[,;\n]', text)
+            if len(phrase.split()) > 1
+        )
+        return tokens
+
+    def encode(self, text: str) -> np.ndarray:
+        """Embed one text as a float32 unit vector"""
+        counts: Dict[int, float] = {}
+        for token in self._tokens(text):
+            h = zlib.crc32(token.encode('utf-8'))
+            bucket = h % self.dim
+            sign = 1.0 if (h >> 31) & 1 else -1.0
+            counts[bucket] = counts.get(bucket, 0.0) + sign
+
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for bucket, count in counts.items():
+            if count:
+                vector[bucket] = np.copysign(1.0 + np.log(abs(count)), count)
+
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+
+class SentenceTransformerEncoder:
+    """Local sentence-transformers model (used when EMBEDDING_MODEL is set)"""
+
+    uses_idf = False
+    # Unrelated texts typically land around 0.2, close paraphrases above 0.7
+    similarity_floor = 0.2
+    similarity_full = 0.7
+
+    def __init__(self, model_name: str):
+        from sentence_transformers import SentenceTransformer
+
+        self.model = SentenceTransformer(model_name, device='cpu')
+        self.dim = self.model.get_sentence_embedding_dimension()
+        self.name = f"st-{model_name}"
+
+    def encode(self, text: str) -> np.ndarray:
+        """Embed one text as a float32 unit vector"""
+        return self.model.encode(text, normalize_embeddings=True).astype(np.float32)
+
+
+def get_encoder():
+    """Local model when configured and installed, hashed TF otherwise"""
+    if settings.EMBEDDING_MODEL:
+        try:
+            return SentenceTransformerEncoder(settings.EMBEDDING_MODEL)
+        except Exception as e:
+            print(f"Could not load embedding model '{settings.EMBEDDING_MODEL}', using hashing encoder: {e}")
+    return HashingEncoder(settings.EMBEDDING_DIM)
@@ -0,0 +1,261 @@
+import os
+import threading
+from typing import Dict, List, Optional
+import numpy as np
+from app.config import settings
+from app.database import db
+from app.database.base import CandidateStore
+from app.models.candidate import Candidate
+from app.services.match_scoring import CandidateFeatures, YEARS_PER_ROLE, stable_hash
+from app.utils.growable_array import GrowableArray
+
+
+class MatchFeatureCache:
+    """
+    Precomputed match features for every stored candidate
+
+    Features (skill vocabulary ids, estimated years of experience) are
+    derived once when a candidate is stored, so /api/match never has to
+    load or validate full candidate records. The cache listens to the
+    candidate store: inserts append a row, deletes tombstone it (rows are
+    compacted once a quarter of them are dead).
+
+    The arrays are persisted to MATCH_FEATURES_PATH together with the
+    store's fingerprint. On startup they are only reused while that
+    fingerprint still matches (records edited under the same id, or by
+    another process, change it); otherwise every row is re-derived.
+    Periodic saves run on a background thread, so inserts never wait for
+    the arrays to be written.
+    """
+
+    def __init__(self, store: CandidateStore, path: str):
+        self.store = store
+        self.path = path
+        self._lock = threading.RLock()
+        self._save_lock = threading.Lock()  # One writer of the .npz at a time
+        self._saving = False
+        self._reset()
+        saved_fingerprint = self._load()
+        if saved_fingerprint is not None and saved_fingerprint == store.fingerprint():
+            self.sync()
+        else:
+            self.rebuild()
+        store.add_listener(self)
+
+    def _reset(self):
+        """Drop all rows"""
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._vocab: Dict[str, int] = {}
+        self._indptr = GrowableArray(np.int64, [0])
+        self._indices = GrowableArray(np.int32)
+        self._exp_years = GrowableArray(np.float32)
+        self._id_hashes = GrowableArray(np.uint64)
+        self._alive = GrowableArray(np.bool_)
+        self._dead = 0
+        self._snapshot: Optional[CandidateFeatures] = None
+        self._unsaved = 0
+
+    def _append(self, candidate: Candidate):
+        """Derive and append features for one candidate"""
+        if candidate.id in self._rows:
+            self._remove(candidate.id)
+
+        skill_ids = [
+            self._vocab.setdefault(skill.lower(), len(self._vocab))
+            for skill in candidate.skills
+        ]
+        self._rows[candidate.id] = len(self._ids)
+        self._ids.append(candidate.id)
+        self._indices.extend(skill_ids)
+        self._indptr.extend([self._indices.size])
+        self._exp_years.extend([len(candidate.experience) * YEARS_PER_ROLE])
+        self._id_hashes.extend([stable_hash(candidate.id)])
+        self._alive.extend([True])
+
+    def _remove(self, candidate_id: str) -> bool:
+        """Tombstone a candidate's row"""
+        row = self._rows.pop(candidate_id, None)
+        if row is None:
+            return False
+        self._alive.view()[row] = False
+        self._dead += 1
+        return True
+
+    def _changed(self):
+        """Invalidate the snapshot and persist periodically"""
+        if self._dead > 1024 and self._dead * 4 > len(self._ids):
+            self._compact()
+        self._snapshot = None
+        self._unsaved += 1
+        if self._unsaved >= settings.MATCH_FEATURES_SAVE_EVERY:
+            self._save_in_background()
+
+    def _save_in_background(self):
+        """Start a save thread unless one is already running (lock held)"""
+        if self._saving:
+            return
+        self._saving = True
+        threading.Thread(target=self._background_save, daemon=True).start()
+
+    def _background_save(self):
+        """Save thread body"""
+        try:
+            self.save()
+        finally:
+            self._saving = False
+
+    def _compact(self):
+        """Rebuild the arrays without tombstoned rows"""
+        indptr = self._indptr.view()
+        indices = self._indices.view()
+        vocab = list(self._vocab)
+        rows = sorted(self._rows.values())
+
+        old_ids = self._ids
+        old_exp = self._exp_years.view()
+        old_hashes = self._id_hashes.view()
+        unsaved = self._unsaved
+        self._reset()
+        self._unsaved = unsaved
+
+        for row in rows:
+            skill_ids = [
+                self._vocab.setdefault(vocab[i], len(self._vocab))
+                for i in indices[indptr[row]:indptr[row + 1]]
+            ]
+            self._rows[old_ids[row]] = len(self._ids)
+            self._ids.append(old_ids[row])
+            self._indices.extend(skill_ids)
+            self._indptr.extend([self._indices.size])
+        self._exp_years.extend(old_exp[rows])
+        self._id_hashes.extend(old_hashes[rows])
+        self._alive.extend(np.ones(len(rows), dtype=bool))
+
+    def on_candidate_added(self, candidate: Candidate):
+        """Store listener: derive features for a new candidate"""
+        with self._lock:
+            self._append(candidate)
+            self._changed()
+
+    def on_candidate_deleted(self, candidate_id: str):
+        """Store listener: invalidate a deleted candidate"""
+        with self._lock:
+            if self._remove(candidate_id):
+                self._changed()
+
+    def on_store_reloaded(self):
+        """Store listener: storage changed on disk"""
+        # Records may have changed under the same ids, so reconciling by id
+        # is not enough
+        self.rebuild()
+
+    def rebuild(self):
+        """Re-derive every row from one full read of the store"""
+        with self._lock:
+            self._reset()
+            for candidate in self.store.get_all_candidates():
+                self._append(candidate)
+        self.save()
+
+    def sync(self):
+        """Reconcile cached rows with the candidate ids in the store"""
+        store_ids = self.store.get_candidate_ids()
+        with self._lock:
+            missing = [i for i in store_ids if i not in self._rows]
+            extra = self._rows.keys() - set(store_ids)
+            if not missing and not extra:
+                return
+
+            rebuild = len(missing) * 2 > len(store_ids)
+            if not rebuild:
+                for candidate_id in extra:
+                    self._remove(candidate_id)
+                for candidate_id in missing:
+                    candidate = self.store.get_candidate_by_id(candidate_id)
+                    if candidate is not None:
+                        self._append(candidate)
+                self._snapshot = None
+
+        if rebuild:
+            # Cheaper to rebuild from one full read than id by id
+            self.rebuild()
+        else:
+            self.save()
+
+    def snapshot(self) -> CandidateFeatures:
+        """Current features as arrays (shared until the next mutation)"""
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = CandidateFeatures(
+                    ids=list(self._ids),
+                    vocab=list(self._vocab),
+                    indptr=self._indptr.view(),
+                    indices=self._indices.view(),
+                    exp_years=self._exp_years.view(),
+                    id_hashes=self._id_hashes.view(),
+                    alive=self._alive.view().copy()
+                )
+            return self._snapshot
+
+    def save(self):
+        """Persist the arrays next to the store (written outside the lock)"""
+        # Taken before the rows are copied, so the rows are never older than
+        # the fingerprint saved with them
+        fingerprint = self.store.fingerprint()
+        with self._lock:
+            ids = list(self._ids)
+            vocab = list(self._vocab)
+            arrays = {
+                'indptr': self._indptr.view(),  # Append-only: views stay valid
+                'indices': self._indices.view(),
+                'exp_years': self._exp_years.view(),
+                'id_hashes': self._id_hashes.view(),
+                'alive': self._alive.view().copy(),  # Tombstoned in place
+            }
+            unsaved = self._unsaved
+
+        arrays['ids'] = np.asarray(ids, dtype=str)
+        arrays['vocab'] = np.asarray(vocab, dtype=str)
+        arrays['fingerprint'] = np.asarray(fingerprint or '')
+        try:
+            with self._save_lock:
+                if os.path.dirname(self.path):
+                    os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                tmp_path = self.path + '.tmp'
+                with open(tmp_path, 'wb') as f:
+                    np.savez(f, **arrays)
+                os.replace(tmp_path, self.path)
+            with self._lock:
+                self._unsaved = max(0, self._unsaved - unsaved)
+        except OSError as e:
+            print(f"Error saving match features: {e}")
+
+    def _load(self) -> Optional[str]:
+        """Load persisted arrays, if any; returns the store fingerprint saved with them"""
+        if not os.path.exists(self.path):
+            return None
+
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                fingerprint = str(data['fingerprint']) if 'fingerprint' in data.files else ''
+                ids = data['ids'].tolist()
+                alive = data['alive']
+                self._ids = ids
+                self._rows = {cid: row for row, cid in enumerate(ids) if alive[row]}
+                self._vocab = {skill: i for i, skill in enumerate(data['vocab'].tolist())}
+                self._indptr = GrowableArray(np.int64, data['indptr'])
+                self._indices = GrowableArray(np.int32, data['indices'])
+                self._exp_years = GrowableArray(np.float32, data['exp_years'])
+                self._id_hashes = GrowableArray(np.uint64, data['id_hashes'])
+                self._alive = GrowableArray(np.bool_, alive)
+                self._dead = len(ids) - len(self._rows)
+            return fingerprint or None
+        except Exception as e:
+            print(f"Error loading match features, rebuilding: {e}")
+            self._reset()
+            return None
+
+
+# Create feature cache instance
+feature_cache = MatchFeatureCache(db, settings.MATCH_FEATURES_PATH)
@@ -0,0 +1,295 @@
+import multiprocessing
+import os
+import queue
+import threading
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime
+from typing import Iterable, Iterator, Optional, Tuple, Union
+from app.config import settings
+from app.database import db
+from app.database.base import CandidateStore
+from app.models.candidate import Candidate
+from app.services.metrics import metrics
+from app.services.profiler import profiler
+from app.services.parse_cache import ResumeParseCache, content_digest, parse_cache
+from app.services.resume_parser import PdfTimeoutError, parse_resume_bytes
+
+
+class QueueFullError(Exception):
+    """Raised when the ingestion queue is at capacity"""
+
+
+class IngestJob:
+    """A resume waiting for, or done with, parsing"""
+
+    def __init__(self, filename: str, digest: str):
+        self.id = uuid.uuid4().hex
+        self.filename = filename
+        self.digest = digest
+        self.duplicate = False
+        self.status = "queued"
+        self.candidate: Optional[Candidate] = None
+        self.error: Optional[str] = None
+        self.createdAt = datetime.now().isoformat()
+        self.finishedAt: Optional[str] = None
+        self.future: Optional[Future] = None
+        self.profile_id: Optional[str] = None  # Profile session that submitted it
+
+    def to_dict(self) -> dict:
+        """Status payload"""
+        status = self.status
+        if status == "queued" and self.future is not None and self.future.running():
+            status = "parsing"
+
+        return {
+            "jobId": self.id,
+            "filename": self.filename,
+            "status": status,
+            "progress": {"queued": 0.0, "parsing": 0.5, "storing": 0.9}.get(status, 1.0),
+            "candidateId": self.candidate.id if self.candidate else None,
+            "candidate": self.candidate.model_dump() if self.candidate else None,
+            "duplicate": self.duplicate,
+            "error": self.error,
+            "createdAt": self.createdAt,
+            "finishedAt": self.finishedAt,
+        }
+
+
+class IngestQueue:
+    """
+    Bounded resume ingestion queue backed by a process pool
+
+    Parsing (PyPDF2 / python-docx) is CPU-bound, so it runs in worker
+    processes and scales with cores instead of blocking the event loop.
+    Parsed results are handed to a single writer thread that stores them
+    (and so runs the store listeners), keeping slow writes off the pool's
+    callback thread. At most
+    INGEST_QUEUE_SIZE jobs may be pending; submit() raises QueueFullError
+    beyond that so the route can apply backpressure.
+
+    Files already in the parse cache, or identical to one still being
+    parsed, are resolved to the existing candidate/job without a parse.
+    """
+
+    def __init__(
+        self,
+        store: CandidateStore,
+        cache: ResumeParseCache,
+        workers: int,
+        max_pending: int,
+        history: int
+    ):
+        self.store = store
+        self.cache = cache
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.history = history
+        self._lock = threading.Lock()
+        self._jobs: OrderedDict = OrderedDict()
+        self._pending = 0
+        self._in_flight = {}
+        self._parse_stats = {
+            "files": 0,
+            "seconds": 0.0,
+            "timeouts": 0,
+            "pdfPages": 0,
+            "pdfPageSeconds": 0.0,
+            "slowestPdfPageSeconds": 0.0,
+            "truncatedPdfs": 0,
+        }
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._results: queue.Queue = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Start the worker pool (and the writer thread) on first use"""
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_loop, name="ingest-writer", daemon=True)
+            self._writer.start()
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def submit(self, content: bytes, filename: str) -> IngestJob:
+        """Queue an in-memory upload for parsing"""
+        digest = content_digest(content)
+        existing = self.cache.lookup(digest, len(content))
+        if existing is not None:
+            job = IngestJob(filename, digest)
+            job.candidate = existing
+            job.duplicate = True
+            job.status = "done"
+            job.finishedAt = datetime.now().isoformat()
+            with self._lock:
+                self._jobs[job.id] = job
+                self._trim_history()
+            return job
+
+        with self._lock:
+            if digest in self._in_flight:
+                return self._in_flight[digest]
+            if self._pending >= self.max_pending:
+                raise QueueFullError(f"Ingestion queue is full ({self.max_pending} pending)")
+            self._pending += 1
+
+            job = IngestJob(filename, digest)
+            job.profile_id = profiler.current_session_id()
+            try:
+                job.future = self._get_executor().submit(
+                    parse_resume_bytes, content, filename, job.profile_id is not None
+                )
+            except Exception:
+                self._pending -= 1
+                raise
+            self._jobs[job.id] = job
+            self._in_flight[digest] = job
+            self._trim_history()
+
+        job.future.add_done_callback(lambda future: self._parsed(job, future))
+        return job
+
+    def _parsed(self, job: IngestJob, future: Future):
+        """Hand a finished parse to the writer (runs on the pool's callback thread)"""
+        job.status = "storing"
+        self._results.put((job, future))
+
+    def _write_loop(self):
+        """Writer thread: store parsed results one at a time"""
+        while True:
+            item = self._results.get()
+            if item is None:
+                return
+            try:
+                self._finish(*item)
+            except Exception as e:
+                print(f"Error finishing ingestion job: {e}")
+
+    def _finish(self, job: IngestJob, future: Future):
+        """Store the parsed candidate (runs on the writer thread)"""
+        try:
+            candidate = self._collect(future, job.profile_id)
+            self.store.add_candidate(candidate)
+            self.cache.put(job.digest, candidate.id)
+            job.candidate = candidate
+            job.status = "done"
+        except Exception as e:
+            job.error = f"Error processing resume: {str(e)}"
+            job.status = "failed"
+        finally:
+            job.finishedAt = datetime.now().isoformat()
+            with self._lock:
+                self._pending -= 1
+                self._in_flight.pop(job.digest, None)
+
+    def _collect(self, future: Future, profile_id: Optional[str] = None) -> Candidate:
+        """Unpack a worker result, recording its parse metrics"""
+        try:
+            result = future.result()
+        except PdfTimeoutError:
+            with self._lock:
+                self._parse_stats["timeouts"] += 1
+            raise
+
+        measured = result["metrics"]
+        pdf = measured["pdf"]
+        metrics.observe_stage("parse", measured["seconds"])
+        profiler.add_spans(profile_id, measured["spans"])
+        profiler.add_profile(profile_id, measured["profile"])
+        with self._lock:
+            stats = self._parse_stats
+            stats["files"] += 1
+            stats["seconds"] += measured["seconds"]
+            if pdf:
+                stats["pdfPages"] += pdf["pages"]
+                stats["pdfPageSeconds"] += sum(pdf["pageSeconds"])
+                stats["slowestPdfPageSeconds"] = max(stats["slowestPdfPageSeconds"], pdf["slowestPageSeconds"])
+                stats["truncatedPdfs"] += int(pdf["truncated"])
+        return Candidate(**result["candidate"])
+
+    def parse_many(
+        self,
+        items: Iterable[Tuple[str, bytes]]
+    ) -> Iterator[Tuple[str, Union[Candidate, Exception]]]:
+        """
+        Parse in-memory resumes in parallel, yielding results in order
+
+        Items are pulled lazily and at most two per worker are in flight,
+        so a large archive is never held in memory all at once. The window
+        is reserved from the pending capacity that single uploads share
+        (shrunk to what is free), so a bulk upload cannot starve the pool
+        past the 429 limit; QueueFullError is raised when nothing is free.
+        """
+        with self._lock:
+            executor = self._get_executor()
+            window = min(self.workers * 2, self.max_pending - self._pending)
+            if window <= 0:
+                raise QueueFullError(f"Ingestion queue is full ({self.max_pending} pending)")
+            self._pending += window
+        profile_id = profiler.current_session_id()
+        in_flight: deque = deque()
+
+        def drain_one():
+            name, future = in_flight.popleft()
+            try:
+                return name, self._collect(future, profile_id)
+            except Exception as e:
+                return name, e
+
+        try:
+            for name, content in items:
+                in_flight.append((name, executor.submit(parse_resume_bytes, content, name, profile_id is not None)))
+                if len(in_flight) >= window:
+                    yield drain_one()
+
+            while in_flight:
+                yield drain_one()
+        finally:
+            with self._lock:
+                self._pending -= window
+
+    def _trim_history(self):
+        """Forget the oldest finished jobs beyond the history limit"""
+        while len(self._jobs) > self.history:
+            oldest_id, oldest = next(iter(self._jobs.items()))
+            if oldest.finishedAt is None:
+                break
+            del self._jobs[oldest_id]
+
+    def get(self, job_id: str) -> Optional[IngestJob]:
+        """Look up a job"""
+        return self._jobs.get(job_id)
+
+    def stats(self) -> dict:
+        """Queue depth and capacity"""
+        return {
+            "pending": self._pending,
+            "capacity": self.max_pending,
+            "workers": self.workers,
+            "dedupe": self.cache.stats(),
+            "parsing": dict(self._parse_stats),
+        }
+
+    def shutdown(self):
+        """Stop the worker pool, then let the writer store what was parsed"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=False)
+            self._executor = None
+        if self._writer is not None:
+            self._results.put(None)
+            self._writer.join()
+            self._writer = None
+
+
+# Create ingestion queue instance
+ingest_queue = IngestQueue(
+    db,
+    parse_cache,
+    workers=settings.INGEST_WORKERS,
+    max_pending=settings.INGEST_QUEUE_SIZE,
+    history=settings.INGEST_JOB_HISTORY
+)
@@ -0,0 +1,109 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional
+from app.config import settings
+from app.database import db
+from app.database.base import CandidateStore
+from app.models.job import JobDescription, MatchResult
+from app.services.match_scoring import job_fingerprint
+
+
+class MatchCache:
+    """
+    LRU/TTL cache of ranked match results
+
+    Keys combine a canonical hash of the job fields that affect ranking,
+    the match mode and the store version, so entries can never outlive the
+    pool they were ranked against. The cache also clears itself when
+    candidates are added or removed. Each entry holds a ranked list at
+    least MATCH_CACHE_DEPTH deep, so paging through smaller topN values is
+    served from one scoring pass.
+    """
+
+    def __init__(self, store: CandidateStore, max_entries: int, ttl_seconds: float):
+        self.store = store
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        store.add_listener(self)
+
+    def key(self, job_description: JobDescription, mode: str) -> str:
+        """Cache key for a request against the current pool"""
+        if mode == "semantic":
+            fingerprint = job_fingerprint(
+                job_description.skills,
+                job_description.experience,
+                job_description.title,
+                job_description.description,
+                *job_description.requirements
+            )
+        else:
+            fingerprint = job_fingerprint(job_description.skills, job_description.experience)
+        return f"{mode}:{self.store.version}:{fingerprint}"
+
+    def get(self, key: str, top_n: int) -> Optional[List[MatchResult]]:
+        """Cached top N results, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                results, depth, created_at = entry
+                if time.monotonic() - created_at > self.ttl_seconds:
+                    del self._entries[key]
+                    self.evictions += 1
+                elif depth >= top_n:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return results[:top_n]
+            self.misses += 1
+            return None
+
+    def put(self, key: str, results: List[MatchResult], depth: int):
+        """Store results ranked for the given depth"""
+        with self._lock:
+            self._entries[key] = (results, depth, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+
+    def on_candidate_added(self, candidate):
+        """Store listener: rankings changed"""
+        self.clear()
+
+    def on_candidate_deleted(self, candidate_id: str):
+        """Store listener: rankings changed"""
+        self.clear()
+
+    def on_store_reloaded(self):
+        """Store listener: rankings changed"""
+        self.clear()
+
+    def stats(self) -> dict:
+        """Hit/miss counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hitRate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+# Create match cache instance
+match_cache = MatchCache(db, settings.MATCH_CACHE_SIZE, settings.MATCH_CACHE_TTL)
@@ -0,0 +1,400 @@
+import hashlib
+import heapq
+import json
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from app.models.candidate import Candidate
+from app.services.profiler import profiler
+
+
+SKILL_WEIGHT = 0.7
+EXPERIENCE_WEIGHT = 0.3
+YEARS_PER_ROLE = 2  # Rough estimate used by the rule-based matcher
+JITTER = 0.05  # Prototype noise (simulates AI nuance), deterministic per candidate/job
+
+_number_pattern = re.compile(r'\d+')
+
+
+def parse_required_years(required_experience: str) -> Optional[int]:
+    """Extract required years from a string like "3-5 years" """
+    numbers = _number_pattern.findall(required_experience)
+    return int(numbers[0]) if numbers else None
+
+
+def stable_hash(text: str) -> int:
+    """64-bit hash that is stable across processes (unlike hash())"""
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def job_fingerprint(skills: Sequence[str], experience: str, *extra: str) -> str:
+    """Canonical hash of the job fields that affect a ranking"""
+    canonical = json.dumps(
+        [[s.strip() for s in skills], experience.strip(), *(e.strip() for e in extra)],
+        separators=(',', ':')
+    )
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def deterministic_jitter(id_hashes: np.ndarray, job_hash: int) -> np.ndarray:
+    """
+    Uniform noise in [-JITTER, JITTER) seeded per (candidate, job)
+
+    Mixes the two hashes with splitmix64 so the same job always ranks the
+    same pool identically, which makes match results cacheable.
+    """
+    with np.errstate(over='ignore'):
+        x = id_hashes ^ np.uint64(job_hash)
+        x = x + np.uint64(0x9E3779B97F4A7C15)
+        x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        x = x ^ (x >> np.uint64(31))
+    unit = (x >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+    return (unit * 2.0 - 1.0) * JITTER
+
+
+class CandidateFeatures:
+    """
+    Array-backed matching features for a pool of candidates
+
+    Skills are encoded once against a vocabulary of lower-cased skill
+    strings as a CSR matrix (indptr/indices), so scoring a job touches each
+    distinct skill string once instead of once per candidate. Rows whose
+    `alive` flag is False (deleted candidates) never rank.
+    """
+
+    def __init__(
+        self,
+        ids: List[str],
+        vocab: List[str],
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        exp_years: np.ndarray,
+        id_hashes: np.ndarray,
+        alive: Optional[np.ndarray] = None
+    ):
+        self.ids = ids
+        self.vocab = vocab
+        self.indptr = indptr
+        self.indices = indices
+        self.exp_years = exp_years
+        self.id_hashes = id_hashes
+        self.alive = alive
+        self._entry_rows: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def count_alive(self) -> int:
+        """Number of rows that can be ranked"""
+        return len(self.ids) if self.alive is None else int(self.alive.sum())
+
+    @property
+    def entry_rows(self) -> np.ndarray:
+        """Row index of every entry in `indices` (computed once)"""
+        if self._entry_rows is None:
+            self._entry_rows = np.repeat(np.arange(len(self.ids)), np.diff(self.indptr))
+        return self._entry_rows
+
+    def rows(self, start: int, stop: int) -> 'CandidateFeatures':
+        """Features of rows [start, stop) sharing this vocabulary"""
+        stop = min(stop, len(self))
+        if start == 0 and stop == len(self):
+            return self
+        first, last = self.indptr[start], self.indptr[stop]
+        return CandidateFeatures(
+            ids=self.ids[start:stop],
+            vocab=self.vocab,
+            indptr=self.indptr[start:stop + 1] - first,
+            indices=self.indices[first:last],
+            exp_years=self.exp_years[start:stop],
+            id_hashes=self.id_hashes[start:stop],
+            alive=self.alive[start:stop] if self.alive is not None else None
+        )
+
+    @classmethod
+    def from_candidates(cls, candidates: Sequence[Candidate]) -> 'CandidateFeatures':
+        """Encode a list of candidates"""
+        vocab_ids: Dict[str, int] = {}
+        indptr = np.zeros(len(candidates) + 1, dtype=np.int64)
+        indices: List[int] = []
+
+        for row, candidate in enumerate(candidates):
+            for skill in candidate.skills:
+                indices.append(vocab_ids.setdefault(skill.lower(), len(vocab_ids)))
+            indptr[row + 1] = len(indices)
+
+        return cls(
+            ids=[c.id for c in candidates],
+            vocab=list(vocab_ids),
+            indptr=indptr,
+            indices=np.asarray(indices, dtype=np.int32),
+            exp_years=np.asarray(
+                [len(c.experience) * YEARS_PER_ROLE for c in candidates],
+                dtype=np.float32
+            ),
+            id_hashes=np.asarray([stable_hash(c.id) for c in candidates], dtype=np.uint64)
+        )
+
+
+def vocab_skill_hits(vocab: Sequence[str], required_skills: Sequence[str]) -> np.ndarray:
+    """
+    Boolean (vocab x required) matrix of skill matches
+
+    A candidate skill matches a required skill when either contains the
+    other, case-insensitively (same rule as AIMatcher.calculate_skill_match).
+    """
+    hits = np.zeros((len(vocab), len(required_skills)), dtype=bool)
+    for col, required in enumerate(required_skills):
+        required = required.lower()
+        hits[:, col] = [required in skill or skill in required for skill in vocab]
+    return hits
+
+
+def match_skill_matrix(
+    features: CandidateFeatures,
+    required_skills: Sequence[str],
+    vocab_hits: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Boolean (candidates x required) matrix of matched required skills
+
+    vocab_hits (from vocab_skill_hits) can be passed in when scoring
+    several row ranges of the same vocabulary.
+    """
+    matched = np.zeros((len(features), len(required_skills)), dtype=bool)
+    if not required_skills or len(features.indices) == 0:
+        return matched
+
+    if vocab_hits is None:
+        vocab_hits = vocab_skill_hits(features.vocab, required_skills)
+    entry_hits = vocab_hits[features.indices]
+    entries, cols = np.nonzero(entry_hits)
+    matched[features.entry_rows[entries], cols] = True
+    return matched
+
+
+def experience_scores(exp_years: np.ndarray, required_experience: str) -> np.ndarray:
+    """Vectorized AIMatcher.calculate_experience_match"""
+    required_years = parse_required_years(required_experience)
+    if required_years is None:
+        return np.full(len(exp_years), 0.7)
+
+    return np.where(
+        exp_years >= required_years,
+        1.0,
+        np.where(exp_years >= required_years * 0.7, 0.8, 0.5)
+    )
+
+
+@profiler.span("match_scoring.score_candidates")
+def score_candidates(
+    features: CandidateFeatures,
+    required_skills: Sequence[str],
+    required_experience: str,
+    vocab_hits: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return (overall scores before jitter, matched skill matrix)
+
+    Rows that are not alive score -inf.
+    """
+    matched = match_skill_matrix(features, required_skills, vocab_hits)
+    if required_skills:
+        skill_scores = matched.sum(axis=1) / len(required_skills)
+    else:
+        skill_scores = np.full(len(features), 0.5)
+
+    exp_scores = experience_scores(features.exp_years, required_experience)
+    scores = skill_scores * SKILL_WEIGHT + exp_scores * EXPERIENCE_WEIGHT
+    if features.alive is not None:
+        scores = np.where(features.alive, scores, -np.inf)
+    return scores, matched
+
+
+@profiler.span("match_scoring.top_k")
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k best finite scores, best first (ties keep pool order)"""
+    k = min(k, int(np.isfinite(scores).sum()))
+    if k <= 0:
+        return np.zeros(0, dtype=np.int64)
+
+    if k < len(scores):
+        # k-th best value; ties at the cut-off go to the earliest rows
+        kth = np.partition(scores, len(scores) - k)[len(scores) - k]
+        above = np.flatnonzero(scores > kth)
+        ties = np.flatnonzero(scores == kth)[:k - len(above)]
+        selected = np.concatenate([above, ties])
+    else:
+        selected = np.arange(len(scores))
+    return selected[np.lexsort((selected, -scores[selected]))]
+
+
+class TopK:
+    """
+    The k best (score, position) entries seen so far, in O(k) memory
+
+    Fed chunk by chunk, it ranks exactly like top_k over the whole pool:
+    higher scores first, ties to the earlier position.
+    """
+
+    def __init__(self, k: int):
+        self.k = k
+        # Min-heap keyed (score, -position): the root is the entry to evict
+        self._heap: List[Tuple[float, int, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def would_accept(self, score: float, position: int) -> bool:
+        """Whether push() would keep this entry"""
+        if len(self._heap) < self.k:
+            return self.k > 0
+        return (score, -position) > self._heap[0][:2]
+
+    def push(self, score: float, position: int, item: Any):
+        """Offer one entry"""
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, (score, -position, item))
+        elif self.k > 0 and (score, -position) > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, (score, -position, item))
+
+    def results(self) -> List[Tuple[float, int, Any]]:
+        """(score, position, item), best first"""
+        ranked = sorted(self._heap, key=lambda entry: entry[:2], reverse=True)
+        return [(score, -negated, item) for score, negated, item in ranked]
+
+
+def offer_scores(
+    top: TopK,
+    scores: np.ndarray,
+    matched: np.ndarray,
+    sources: Sequence,
+    offset: int
+):
+    """
+    Offer the best rows of one chunk's final (jittered) scores to `top`
+
+    Entries hold (sources[row], unrounded score, matched skill flags);
+    nothing else about the chunk outlives this call.
+    """
+    rounded = np.round(scores, 2)
+    for row in top_k(rounded, top.k):
+        score = float(rounded[row])
+        if not top.would_accept(score, offset + row):
+            break  # Rows come best first, so no later row gets in either
+        top.push(score, offset + row, (sources[row], float(scores[row]), matched[row].copy()))
+
+
+def offer_chunk(
+    top: TopK,
+    features: CandidateFeatures,
+    sources: Sequence,
+    required_skills: Sequence[str],
+    required_experience: str,
+    job_hash: int,
+    offset: int,
+    vocab_hits: Optional[np.ndarray] = None
+):
+    """Score one chunk of a pool for a job and offer its best rows to `top`"""
+    scores, matched = score_candidates(features, required_skills, required_experience, vocab_hits)
+
+    # Add small factor for prototype (simulates AI nuance); seeded per
+    # candidate and job so repeated requests rank identically
+    scores = np.minimum(1.0, scores + deterministic_jitter(features.id_hashes, job_hash))
+    offer_scores(top, scores, matched, sources, offset)
+
+
+def rank_rows(
+    features: CandidateFeatures,
+    required_skills: Sequence[str],
+    required_experience: str,
+    job_hash: int,
+    k: int,
+    chunk_rows: int,
+    vocab_hits: Optional[np.ndarray] = None,
+    start: int = 0,
+    stop: Optional[int] = None
+) -> TopK:
+    """
+    Best k of rows [start, stop), scored chunk_rows at a time
+
+    Entries hold the row number (not the id), so shards scored in other
+    processes can be merged and resolved by the caller.
+    """
+    stop = len(features) if stop is None else min(stop, len(features))
+    if vocab_hits is None:
+        vocab_hits = vocab_skill_hits(features.vocab, required_skills)
+
+    top = TopK(k)
+    for begin in range(start, stop, chunk_rows):
+        end = min(begin + chunk_rows, stop)
+        offer_chunk(
+            top,
+            features.rows(begin, end),
+            range(begin, end),
+            required_skills,
+            required_experience,
+            job_hash,
+            begin,
+            vocab_hits
+        )
+    return top
+
+
+def skill_union(jobs: Sequence[Tuple[Sequence[str], str]]) -> List[str]:
+    """Distinct required skills of several jobs, in first-seen order"""
+    return list(dict.fromkeys(skill for skills, _ in jobs for skill in skills))
+
+
+def rank_jobs(
+    features: CandidateFeatures,
+    jobs: Sequence[Tuple[Sequence[str], str]],
+    job_hashes: Sequence[int],
+    k: int,
+    chunk_rows: int,
+    vocab_hits: Optional[np.ndarray] = None,
+    start: int = 0,
+    stop: Optional[int] = None
+) -> List[TopK]:
+    """
+    Best k rows of [start, stop) for each (skills, experience) job
+
+    Every chunk is matched once against the union of the jobs' skills;
+    a (union x jobs) count matrix then turns that into per-job skill
+    scores with one matrix product, so J jobs cost one pass over the pool
+    instead of J. Scores are the same as score_candidates per job.
+    vocab_hits, if given, must be for skill_union(jobs).
+    """
+    stop = len(features) if stop is None else min(stop, len(features))
+    union = skill_union(jobs)
+    column = {skill: i for i, skill in enumerate(union)}
+    if vocab_hits is None:
+        vocab_hits = vocab_skill_hits(features.vocab, union)
+
+    # How often each union skill appears in each job's requirement list
+    # (float32 so the product runs in BLAS; the counts stay exact)
+    membership = np.zeros((len(union), len(jobs)), dtype=np.float32)
+    job_columns = []
+    for j, (skills, _) in enumerate(jobs):
+        job_columns.append([column[skill] for skill in skills])
+        for skill in skills:
+            membership[column[skill], j] += 1
+    lengths = np.asarray([len(skills) for skills, _ in jobs], dtype=np.int64)
+
+    tops = [TopK(k) for _ in jobs]
+    for begin in range(start, stop, chunk_rows):
+        end = min(begin + chunk_rows, stop)
+        chunk = features.rows(begin, end)
+        matched = match_skill_matrix(chunk, union, vocab_hits)
+        counts = matched.astype(np.float32) @ membership
+        skill_scores = np.where(lengths > 0, counts / np.maximum(lengths, 1), 0.5)
+        exp_scores = np.column_stack([experience_scores(chunk.exp_years, experience) for _, experience in jobs])
+        scores = skill_scores * SKILL_WEIGHT + exp_scores * EXPERIENCE_WEIGHT
+        if chunk.alive is not None:
+            scores[~chunk.alive] = -np.inf
+
+        for j, top in enumerate(tops):
+            jittered = np.minimum(1.0, scores[:, j] + deterministic_jitter(chunk.id_hashes, job_hashes[j]))
+            offer_scores(top, jittered, matched[:, job_columns[j]], range(begin, end), begin)
+    return tops
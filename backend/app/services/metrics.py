@@ -0,0 +1,202 @@
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import wraps
+from typing import Dict, Iterator, List, Sequence, Tuple
+from app.config import settings
+
+
+# Seconds; stages of a single request are usually well under a second
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# Bytes, 256 B to 16 MB in powers of four
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+INF_LABEL = 'le="+Inf"'
+
+
+def _escape(value: str) -> str:
+    """Escape a Prometheus label value"""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    """{name="value",...} (empty string when there are no labels)"""
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_number(value: float) -> str:
+    """Prometheus sample value"""
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Histogram:
+    """Bucketed observations per label set (rendered cumulatively)"""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str], buckets: Sequence[float]):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        # label values -> [count per bucket..., +Inf count, sum]
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, labels: Tuple[str, ...] = ()):
+        """Record one observation (caller holds the registry lock)"""
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def render(self) -> List[str]:
+        """Exposition lines"""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for labels, series in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                le = _format_labels(self.label_names, labels, f'le="{_format_number(bound)}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            cumulative += series[len(self.buckets)]
+            lines.append(f"{self.name}_bucket{_format_labels(self.label_names, labels, INF_LABEL)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.label_names, labels)} {_format_number(series[-1])}")
+            lines.append(f"{self.name}_count{_format_labels(self.label_names, labels)} {cumulative}")
+        return lines
+
+
+class Counter:
+    """Monotonic total per label set"""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str]):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, labels: Tuple[str, ...] = (), amount: float = 1):
+        """Increase a total (caller holds the registry lock)"""
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        """Exposition lines"""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        for labels, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.label_names, labels)} {_format_number(value)}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    In-process request and stage metrics in Prometheus text format
+
+    Requests are recorded by MetricsMiddleware, labelled by route
+    template (not raw path) so ids do not create new series. Internal
+    stages (parse, db_read, db_write, score, serialize) are timed with
+    stage() or @timed(); stages can nest (scoring loads its winners from
+    the store), so their times overlap rather than sum to the request.
+    """
+
+    def __init__(self, prefix: str = "recrutix", enabled: bool = True):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._started = time.time()
+
+        self.requests = Counter(
+            f"{prefix}_http_requests_total", "HTTP requests by route and status.", ("method", "route", "status")
+        )
+        self.request_seconds = Histogram(
+            f"{prefix}_http_request_duration_seconds", "HTTP request latency.", ("method", "route"), LATENCY_BUCKETS
+        )
+        self.request_bytes = Histogram(
+            f"{prefix}_http_request_size_bytes", "HTTP request body size.", ("method", "route"), SIZE_BUCKETS
+        )
+        self.response_bytes = Histogram(
+            f"{prefix}_http_response_size_bytes", "HTTP response body size.", ("method", "route"), SIZE_BUCKETS
+        )
+        self.stage_seconds = Histogram(
+            f"{prefix}_stage_duration_seconds", "Time spent in internal stages.", ("stage",), LATENCY_BUCKETS
+        )
+        self._in_flight_name = f"{prefix}_http_requests_in_flight"
+        self._uptime_name = f"{prefix}_uptime_seconds"
+
+    def request_started(self):
+        """Count a request as in flight"""
+        with self._lock:
+            self._in_flight += 1
+
+    def request_finished(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        seconds: float,
+        request_bytes: int,
+        response_bytes: int
+    ):
+        """Record a completed request"""
+        labels = (method, route)
+        with self._lock:
+            self._in_flight -= 1
+            self.requests.inc((method, route, str(status)))
+            self.request_seconds.observe(seconds, labels)
+            self.request_bytes.observe(request_bytes, labels)
+            self.response_bytes.observe(response_bytes, labels)
+
+    def observe_stage(self, stage: str, seconds: float):
+        """Record time spent in an internal stage"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.stage_seconds.observe(seconds, (stage,))
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as stage `name`"""
+        if not self.enabled:
+            yield
+            return
+        began = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe_stage(name, time.perf_counter() - began)
+
+    def timed(self, name: str):
+        """Decorator timing every call of a function as stage `name`"""
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                began = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.observe_stage(name, time.perf_counter() - began)
+            return wrapper
+        return decorator
+
+    def render(self) -> str:
+        """All metrics in Prometheus text exposition format"""
+        with self._lock:
+            lines = [
+                f"# HELP {self._in_flight_name} HTTP requests currently being served.",
+                f"# TYPE {self._in_flight_name} gauge",
+                f"{self._in_flight_name} {self._in_flight}",
+                f"# HELP {self._uptime_name} Seconds since the process started.",
+                f"# TYPE {self._uptime_name} gauge",
+                f"{self._uptime_name} {time.time() - self._started:.3f}",
+            ]
+            for metric in (self.requests, self.request_seconds, self.request_bytes, self.response_bytes, self.stage_seconds):
+                lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Create metrics registry instance
+metrics = MetricsRegistry(enabled=settings.METRICS_ENABLED)
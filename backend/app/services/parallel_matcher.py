@@ -0,0 +1,361 @@
+import multiprocessing
+import os
+import shutil
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+import numpy as np
+from app.config import settings
+from app.database.base import CandidateStore
+from app.services.match_scoring import CandidateFeatures, TopK, rank_jobs, rank_rows
+
+
+# Arrays a worker needs to score rows; ids and vocabulary stay in the parent
+SHARD_ARRAYS = ('indptr', 'indices', 'exp_years', 'id_hashes', 'alive')
+
+# Generations kept mapped per worker (the current one and the one before)
+MAPPED_GENERATIONS = 2
+
+_mapped: "OrderedDict[str, CandidateFeatures]" = OrderedDict()
+
+
+def _map_generation(path: str) -> CandidateFeatures:
+    """Memory-map a published generation (cached per worker process)"""
+    features = _mapped.get(path)
+    if features is None:
+        arrays = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode='r') for name in SHARD_ARRAYS}
+        features = CandidateFeatures(
+            ids=range(len(arrays['exp_years'])),  # Row numbers stand in for ids
+            vocab=[],  # Skill hits arrive precomputed per job
+            **arrays
+        )
+        _mapped[path] = features
+        while len(_mapped) > MAPPED_GENERATIONS:
+            _mapped.popitem(last=False)
+    return features
+
+
+def score_shard(
+    path: str,
+    start: int,
+    stop: int,
+    vocab_hits: np.ndarray,
+    required_skills: Sequence[str],
+    required_experience: str,
+    job_hash: int,
+    k: int,
+    chunk_rows: int
+) -> List[Tuple[float, int, tuple]]:
+    """
+    Best k rows of one shard (runs in a worker process)
+
+    Module-level so the pool pickles it by reference; only the job, the
+    shard bounds and the k winners cross the process boundary.
+    """
+    features = _map_generation(path)
+    top = rank_rows(
+        features,
+        required_skills,
+        required_experience,
+        job_hash,
+        k,
+        chunk_rows,
+        vocab_hits,
+        start,
+        stop
+    )
+    return top.results()
+
+
+def score_jobs_shard(
+    path: str,
+    start: int,
+    stop: int,
+    vocab_hits: np.ndarray,
+    jobs: List[Tuple[List[str], str]],
+    job_hashes: List[int],
+    k: int,
+    chunk_rows: int
+) -> List[List[Tuple[float, int, tuple]]]:
+    """Best k rows of one shard for each job (runs in a worker process)"""
+    features = _map_generation(path)
+    tops = rank_jobs(features, jobs, job_hashes, k, chunk_rows, vocab_hits, start, stop)
+    return [top.results() for top in tops]
+
+
+class ShardedMatcher:
+    """
+    Scores large pools across a process pool
+
+    The feature snapshot is published once per change as .npy files that
+    every worker memory-maps, so a request only sends the job and shard
+    bounds; the OS page cache shares the arrays between workers. Each
+    shard returns its own top K and the parent merges them with TopK,
+    which ranks exactly like scoring the pool in one process.
+
+    Publishing happens off the request path: once attached to a store, a
+    background thread republishes shortly after candidates change. A
+    request whose snapshot is not published yet is left to the caller to
+    score in-process. Every generation counts the requests scoring it and
+    is only deleted once it is neither current nor in use. A directory
+    that cannot be removed yet (Windows refuses while a worker still maps
+    its files) is logged and retried on every later publish.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        workers: int = settings.MATCH_WORKERS,
+        min_rows: int = settings.MATCH_PARALLEL_MIN_ROWS,
+        chunk_rows: int = settings.MATCH_CHUNK_ROWS,
+        publish_delay: float = settings.MATCH_SHARD_PUBLISH_DELAY
+    ):
+        self.directory = directory
+        self.workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self.min_rows = min_rows
+        self.chunk_rows = max(1, chunk_rows)
+        self.publish_delay = publish_delay
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._current: Optional[Tuple[CandidateFeatures, str]] = None
+        self._in_use: Dict[str, int] = {}  # Generation path -> requests scoring it
+        self._undeleted: Set[str] = set()  # Superseded generations to retry removing
+        self._lock = threading.Lock()
+        self._source: Optional[Callable[[], CandidateFeatures]] = None
+        self._stale = threading.Event()
+        self._closing = False
+        self._publisher: Optional[threading.Thread] = None
+
+    def enabled_for(self, features: CandidateFeatures) -> bool:
+        """Whether a pool is big enough to be worth sharding"""
+        return self.workers > 1 and self.min_rows > 0 and len(features) >= self.min_rows
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Start the worker pool on first use"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def attach(self, store: CandidateStore, source: Callable[[], CandidateFeatures]):
+        """
+        Publish `source()` in the background whenever the store changes
+
+        Generations left behind by an earlier process are removed first.
+        Called once at app startup, not at import: spawned workers import
+        this module too.
+        """
+        if os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                self._delete(os.path.join(self.directory, name))
+
+        self._source = source
+        store.add_listener(self)
+        self._publisher = threading.Thread(target=self._publish_loop, name="shard-publisher", daemon=True)
+        self._publisher.start()
+        self._stale.set()  # Publish the pool as it is now
+
+    def on_candidate_added(self, candidate):
+        """Store listener: republish soon"""
+        self._stale.set()
+
+    def on_candidate_deleted(self, candidate_id: str):
+        """Store listener: republish soon"""
+        self._stale.set()
+
+    def on_store_reloaded(self):
+        """Store listener: republish soon"""
+        self._stale.set()
+
+    def _publish_loop(self):
+        """Publisher thread: one publish per burst of store changes"""
+        while True:
+            self._stale.wait()
+            if self._closing:
+                return
+            time.sleep(self.publish_delay)  # Let a bulk upload settle
+            self._stale.clear()
+            if self._closing:
+                return
+            try:
+                features = self._source()
+                if self.enabled_for(features):
+                    self.publish(features)
+                else:
+                    self._retire()
+            except Exception as e:
+                print(f"Error publishing match shards: {e}")
+
+    def publish(self, features: CandidateFeatures) -> str:
+        """Write a snapshot for the workers and make it current"""
+        with self._lock:
+            if self._current is not None and self._current[0] is features:
+                return self._current[1]
+            retry, self._undeleted = self._undeleted, set()
+        for path in retry:
+            self._delete(path)
+
+        path = os.path.join(self.directory, uuid.uuid4().hex)
+        os.makedirs(path, exist_ok=True)
+        alive = features.alive if features.alive is not None else np.ones(len(features), dtype=bool)
+        for name, array in zip(SHARD_ARRAYS, (features.indptr, features.indices, features.exp_years, features.id_hashes, alive)):
+            np.save(os.path.join(path, f"{name}.npy"), np.ascontiguousarray(array))
+
+        self._retire((features, path))
+        return path
+
+    def _retire(self, current: Optional[Tuple[CandidateFeatures, str]] = None):
+        """Replace the current generation, deleting the old one if unused"""
+        with self._lock:
+            previous, self._current = self._current, current
+            if previous is None or previous[1] in self._in_use:
+                return  # Deleted by the last request scoring it
+        self._delete(previous[1])
+
+    def _delete(self, path: str):
+        """Remove a generation directory, or remember it for the next publish"""
+        try:
+            shutil.rmtree(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Could not remove match shards {path}, retrying on next publish: {e}")
+            with self._lock:
+                self._undeleted.add(path)
+
+    def _acquire(self, features: CandidateFeatures) -> Optional[str]:
+        """Pin the generation holding `features`, if it is the current one"""
+        with self._lock:
+            if self._current is None or self._current[0] is not features:
+                return None
+            path = self._current[1]
+            self._in_use[path] = self._in_use.get(path, 0) + 1
+            return path
+
+    def _release(self, path: str):
+        """Unpin a generation; delete it if it was superseded meanwhile"""
+        with self._lock:
+            self._in_use[path] -= 1
+            if self._in_use[path]:
+                return
+            del self._in_use[path]
+            if self._current is not None and self._current[1] == path:
+                return
+        self._delete(path)
+
+    def rank(
+        self,
+        features: CandidateFeatures,
+        required_skills: Sequence[str],
+        required_experience: str,
+        job_hash: int,
+        k: int,
+        vocab_hits: np.ndarray
+    ) -> Optional[TopK]:
+        """
+        Best k rows of the pool, scored shard by shard in the workers
+
+        None if this snapshot is not the published one.
+        """
+        path = self._acquire(features)
+        if path is None:
+            return None
+
+        futures = []
+        try:
+            executor = self._get_executor()
+            futures += [
+                executor.submit(
+                    score_shard,
+                    path,
+                    start,
+                    stop,
+                    vocab_hits,
+                    list(required_skills),
+                    required_experience,
+                    job_hash,
+                    k,
+                    self.chunk_rows
+                )
+                for start, stop in self._shards(len(features))
+            ]
+
+            top = TopK(k)
+            for future in futures:
+                for score, position, item in future.result():
+                    top.push(score, position, item)
+            return top
+        finally:
+            wait(futures)  # A failed shard must not unpin ones still running
+            self._release(path)
+
+    def rank_jobs(
+        self,
+        features: CandidateFeatures,
+        jobs: Sequence[Tuple[Sequence[str], str]],
+        job_hashes: Sequence[int],
+        k: int,
+        vocab_hits: np.ndarray
+    ) -> Optional[List[TopK]]:
+        """
+        Best k rows per job, every job scored in the same shard pass
+
+        None if this snapshot is not the published one.
+        """
+        path = self._acquire(features)
+        if path is None:
+            return None
+
+        futures = []
+        try:
+            executor = self._get_executor()
+            jobs = [(list(skills), experience) for skills, experience in jobs]
+            futures += [
+                executor.submit(
+                    score_jobs_shard,
+                    path,
+                    start,
+                    stop,
+                    vocab_hits,
+                    jobs,
+                    list(job_hashes),
+                    k,
+                    self.chunk_rows
+                )
+                for start, stop in self._shards(len(features))
+            ]
+
+            tops = [TopK(k) for _ in jobs]
+            for future in futures:
+                for top, entries in zip(tops, future.result()):
+                    for score, position, item in entries:
+                        top.push(score, position, item)
+            return tops
+        finally:
+            wait(futures)  # A failed shard must not unpin ones still running
+            self._release(path)
+
+    def _shards(self, rows: int) -> List[Tuple[int, int]]:
+        """Contiguous [start, stop) row ranges, one per worker"""
+        shard_rows = max(1, -(-rows // self.workers))
+        return [(start, min(start + shard_rows, rows)) for start in range(0, rows, shard_rows)]
+
+    def shutdown(self):
+        """Stop the publisher and the workers and remove published snapshots"""
+        self._closing = True
+        self._stale.set()
+        if self._publisher is not None:
+            self._publisher.join()
+            self._publisher = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        self._retire()
+
+
+# Create sharded matcher instance
+parallel_matcher = ShardedMatcher(settings.MATCH_SHARD_DIR)
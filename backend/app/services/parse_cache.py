@@ -0,0 +1,155 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+from app.config import settings
+from app.database import db
+from app.database.base import CandidateStore
+from app.models.candidate import Candidate
+
+
+def content_digest(content: bytes) -> str:
+    """SHA-256 hex digest of a resume file"""
+    return hashlib.sha256(content).hexdigest()
+
+
+class ResumeParseCache:
+    """
+    Content-addressed cache of parsed resumes
+
+    Maps the SHA-256 of an uploaded file to the candidate it was parsed
+    into. The stored candidate is the parse result, so a byte-identical
+    re-upload is answered from the store without queueing a parse and
+    without creating a second candidate. Entries are evicted LRU beyond
+    PARSE_CACHE_SIZE, dropped when their candidate is deleted, and
+    persisted to PARSE_CACHE_PATH.
+    """
+
+    def __init__(self, store: CandidateStore, path: str, max_entries: int):
+        self.store = store
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()
+        self._by_candidate = {}
+        self._unsaved = 0
+        self.hits = 0
+        self.misses = 0
+        self.bytes_skipped = 0
+        self._load()
+        self.sync()
+        store.add_listener(self)
+
+    def lookup(self, digest: str, size: int = 0) -> Optional[Candidate]:
+        """The stored candidate for a file digest, or None on a miss"""
+        with self._lock:
+            candidate_id = self._entries.get(digest)
+            if candidate_id is not None:
+                self._entries.move_to_end(digest)
+
+        candidate = self.store.get_candidate_by_id(candidate_id) if candidate_id else None
+        with self._lock:
+            if candidate is None:
+                if candidate_id is not None:
+                    self._discard(digest)
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.bytes_skipped += size
+        return candidate
+
+    def put(self, digest: str, candidate_id: str):
+        """Remember which candidate a file was parsed into"""
+        with self._lock:
+            self._discard(digest)
+            self._entries[digest] = candidate_id
+            self._by_candidate[candidate_id] = digest
+            while len(self._entries) > self.max_entries:
+                _, old_id = self._entries.popitem(last=False)
+                self._by_candidate.pop(old_id, None)
+            self._unsaved += 1
+            if self._unsaved >= 100:
+                self._save()
+
+    def _discard(self, digest: str):
+        """Forget one digest (lock held)"""
+        candidate_id = self._entries.pop(digest, None)
+        if candidate_id is not None and self._by_candidate.get(candidate_id) == digest:
+            del self._by_candidate[candidate_id]
+
+    def on_candidate_added(self, candidate: Candidate):
+        """Store listener: digests are recorded by the ingest path"""
+
+    def on_candidate_deleted(self, candidate_id: str):
+        """Store listener: a re-upload must be parsed again"""
+        with self._lock:
+            digest = self._by_candidate.get(candidate_id)
+            if digest is not None:
+                self._discard(digest)
+                self._unsaved += 1
+
+    def on_store_reloaded(self):
+        """Store listener: storage changed on disk"""
+        self.sync()
+
+    def sync(self):
+        """Drop digests whose candidates are no longer stored"""
+        store_ids = set(self.store.get_candidate_ids())
+        with self._lock:
+            stale = [d for d, cid in self._entries.items() if cid not in store_ids]
+            for digest in stale:
+                self._discard(digest)
+            if stale:
+                self._unsaved += len(stale)
+
+    def stats(self) -> dict:
+        """Dedupe counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "duplicates": self.hits,
+                "parsed": self.misses,
+                "hitRate": self.hits / lookups if lookups else 0.0,
+                "bytesSkipped": self.bytes_skipped,
+            }
+
+    def save(self):
+        """Persist the digest map"""
+        with self._lock:
+            self._save()
+
+    def _save(self):
+        """Write the digest map atomically (lock held)"""
+        try:
+            if os.path.dirname(self.path):
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(list(self._entries.items()), f)
+            os.replace(tmp_path, self.path)
+            self._unsaved = 0
+        except OSError as e:
+            print(f"Error saving parse cache: {e}")
+
+    def _load(self):
+        """Load the persisted digest map, if any"""
+        if not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, 'r') as f:
+                entries = json.load(f)
+            for digest, candidate_id in entries[-self.max_entries:]:
+                self._entries[digest] = candidate_id
+                self._by_candidate[candidate_id] = digest
+        except Exception as e:
+            print(f"Error loading parse cache: {e}")
+            self._entries.clear()
+            self._by_candidate.clear()
+
+
+# Create parse cache instance
+parse_cache = ResumeParseCache(db, settings.PARSE_CACHE_PATH, settings.PARSE_CACHE_SIZE)
@@ -0,0 +1,342 @@
+import cProfile
+import os
+import pstats
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from app.config import settings
+
+
+# Span name -> [calls, total seconds, slowest call seconds]
+SpanStats = Dict[str, List[float]]
+
+# Spans of the request (or worker parse) being captured in this context
+_current_spans: ContextVar[Optional[SpanStats]] = ContextVar("profiler_spans", default=None)
+_current_session: ContextVar[Optional[str]] = ContextVar("profiler_session", default=None)
+
+
+class ProfilerBusyError(Exception):
+    """Raised when a profiling session is already armed"""
+
+
+def _merge_spans(target: SpanStats, spans: SpanStats):
+    """Add span stats into target"""
+    for name, (calls, total, slowest) in spans.items():
+        entry = target.setdefault(name, [0, 0.0, 0.0])
+        entry[0] += calls
+        entry[1] += total
+        entry[2] = max(entry[2], slowest)
+
+
+class _CapturedProfile:
+    """Raw cProfile stats taken in another thread or process, loadable by pstats.Stats"""
+
+    def __init__(self, stats: dict):
+        self.stats = stats
+
+    def create_stats(self):
+        """Stats are already collected"""
+
+
+class ProfileSession:
+    """cProfile capture of the next N requests to one route"""
+
+    def __init__(self, method: str, route: str, requests: int):
+        self.id = uuid.uuid4().hex
+        self.method = method.upper()
+        self.route = route
+        self.requests = requests
+        self.captured = 0
+        self.status = "armed"
+        self.stats: Optional[pstats.Stats] = None
+        self.spans: SpanStats = {}
+        self.request_seconds: List[float] = []
+        self.stats_path: Optional[str] = None
+        self.createdAt = datetime.now().isoformat()
+        self.finishedAt: Optional[str] = None
+
+    def matches(self, method: str, route: str) -> bool:
+        """Whether a request to (method, route template) should be captured"""
+        return self.status == "armed" and self.method == method and self.route == route
+
+    def top_functions(self, limit: int) -> List[dict]:
+        """Functions with the most cumulative time"""
+        if self.stats is None:
+            return []
+        rows = sorted(self.stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:limit]
+        return [
+            {
+                "function": pstats.func_std_string(func),
+                "calls": calls,
+                "primitiveCalls": primitive,
+                "totalSeconds": round(total, 6),
+                "cumulativeSeconds": round(cumulative, 6),
+            }
+            for func, (primitive, calls, total, cumulative, _) in rows
+        ]
+
+    def to_dict(self, limit: int = 30) -> dict:
+        """Status and summary payload"""
+        return {
+            "profileId": self.id,
+            "method": self.method,
+            "route": self.route,
+            "status": self.status,
+            "requests": self.requests,
+            "captured": self.captured,
+            "requestSeconds": [round(s, 6) for s in self.request_seconds],
+            "spans": [
+                {"name": name, "calls": calls, "totalSeconds": round(total, 6), "maxSeconds": round(slowest, 6)}
+                for name, (calls, total, slowest) in sorted(self.spans.items(), key=lambda item: -item[1][1])
+            ],
+            "functions": self.top_functions(limit),
+            "statsFile": self.stats_path,
+            "createdAt": self.createdAt,
+            "finishedAt": self.finishedAt,
+        }
+
+
+class Profiler:
+    """
+    Runtime-toggleable request profiler
+
+    An admin arms a session for a route; ProfilerMiddleware then runs the
+    next N matching requests under cProfile (one at a time) and the
+    session keeps the merged pstats plus the named spans hit along the way.
+    Finished sessions are dumped to a .prof file for snakeviz/pstats.
+
+    While nothing is armed, the middleware and @span wrappers only check
+    a boolean, so the cost when off is one attribute read per call.
+    cProfile follows the thread it was enabled on (for async routes that
+    includes other coroutines interleaved on the event loop). Work handed
+    to a thread pool through run(), or to a resume parser process, is
+    profiled where it runs and merged into the same session; the sharded
+    matcher's scoring processes still show up only as time waiting on
+    their results.
+    """
+
+    def __init__(self, directory: str, history: int = 20):
+        self.directory = directory
+        self.history = history
+        self.armed = False  # A session is waiting for requests
+        self.active = False  # Some context is collecting spans
+        self._session: Optional[ProfileSession] = None
+        self._sessions: "OrderedDict[str, ProfileSession]" = OrderedDict()
+        self._capturing = False
+        self._collectors = 0
+        self._lock = threading.Lock()
+
+    def start(self, method: str, route: str, requests: int) -> ProfileSession:
+        """Arm a session for the next `requests` calls to a route"""
+        with self._lock:
+            if self._session is not None:
+                raise ProfilerBusyError(f"Profile {self._session.id} is still capturing {self._session.route}")
+            session = ProfileSession(method, route, requests)
+            self._session = session
+            self._sessions[session.id] = session
+            while len(self._sessions) > self.history:
+                self._sessions.popitem(last=False)
+            self.armed = True
+            return session
+
+    def get(self, session_id: str) -> Optional[ProfileSession]:
+        """Session by id (recent ones only)"""
+        with self._lock:
+            return self._sessions.get(session_id)
+
+    def recent(self) -> List[ProfileSession]:
+        """Recent sessions, newest first"""
+        with self._lock:
+            return list(reversed(self._sessions.values()))
+
+    def cancel(self, session_id: str) -> Optional[ProfileSession]:
+        """Stop a session early, keeping whatever it captured"""
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is not None and session is self._session:
+                self._finish(session, "cancelled")
+            return session
+
+    def claim(self, method: str, route: str) -> Optional[ProfileSession]:
+        """Armed session for this request, if it should be captured now"""
+        with self._lock:
+            session = self._session
+            if session is None or self._capturing or not session.matches(method, route):
+                return None
+            self._capturing = True
+            return session
+
+    @contextmanager
+    def capture(self, session: ProfileSession) -> Iterator[None]:
+        """Run the enclosed request under cProfile for a claimed session"""
+        profile = cProfile.Profile()
+        session_token = _current_session.set(session.id)
+        began = time.perf_counter()
+        try:
+            with self.collect_spans() as spans:
+                profile.enable()
+                try:
+                    yield
+                finally:
+                    profile.disable()
+        finally:
+            _current_session.reset(session_token)
+            self._release(session, profile, spans, time.perf_counter() - began)
+
+    def _release(self, session: ProfileSession, profile: cProfile.Profile, spans: SpanStats, seconds: float):
+        """Merge one captured request into its session"""
+        with self._lock:
+            self._capturing = False
+            if session.status != "armed":
+                return
+            if session.stats is None:
+                session.stats = pstats.Stats(profile)
+            else:
+                session.stats.add(profile)
+            _merge_spans(session.spans, spans)
+            session.request_seconds.append(seconds)
+            session.captured += 1
+            if session.captured >= session.requests:
+                self._finish(session, "done")
+
+    def _finish(self, session: ProfileSession, status: str):
+        """Disarm and persist a session (caller holds the lock)"""
+        session.status = status
+        session.finishedAt = datetime.now().isoformat()
+        self._session = None
+        self.armed = False
+        if session.stats is not None:
+            self._dump(session)
+
+    def _dump(self, session: ProfileSession):
+        """Write a session's stats to its .prof file (caller holds the lock)"""
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, f"{session.id}.prof")
+            session.stats.dump_stats(path)
+            session.stats_path = path
+        except Exception as e:
+            print(f"Error saving profile: {e}")
+
+    @contextmanager
+    def record(self) -> Iterator[dict]:
+        """
+        Run the enclosed block under its own cProfile
+
+        The yielded dict is filled with the raw stats on exit; it stays
+        empty if another profiler already covers this thread (cProfile is
+        process-wide from Python 3.12).
+        """
+        captured: dict = {}
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            yield captured
+            return
+        try:
+            yield captured
+        finally:
+            profile.disable()
+            profile.create_stats()
+            captured.update(profile.stats)
+
+    def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Call func, profiling it into the session capturing this request
+
+        Wrap callables handed to a thread pool with it; context variables
+        (and so the session) follow run_in_threadpool into the worker.
+        """
+        session_id = _current_session.get()
+        if session_id is None:
+            return func(*args)
+
+        captured: dict = {}
+        try:
+            with self.record() as captured:
+                return func(*args)
+        finally:
+            self.add_profile(session_id, captured)
+
+    def add_profile(self, session_id: Optional[str], stats: Optional[dict]):
+        """Merge raw cProfile stats taken elsewhere (see record) into a session"""
+        if not session_id or not stats:
+            return
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                return
+            captured = pstats.Stats(_CapturedProfile(stats))
+            if session.stats is None:
+                session.stats = captured
+            else:
+                session.stats.add(captured)
+            if session.status != "armed":
+                # Late arrival (e.g. a queued parse): refresh the dump
+                self._dump(session)
+
+    def current_session_id(self) -> Optional[str]:
+        """Session capturing the current request, if any"""
+        return _current_session.get()
+
+    def add_spans(self, session_id: Optional[str], spans: Optional[SpanStats]):
+        """Merge spans collected elsewhere (e.g. a parser process) into a session"""
+        if not session_id or not spans:
+            return
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                _merge_spans(session.spans, spans)
+
+    @contextmanager
+    def collect_spans(self) -> Iterator[SpanStats]:
+        """Record @span timings made in this context into a fresh dict"""
+        spans: SpanStats = {}
+        token = _current_spans.set(spans)
+        with self._lock:
+            self._collectors += 1
+            self.active = True
+        try:
+            yield spans
+        finally:
+            _current_spans.reset(token)
+            with self._lock:
+                self._collectors -= 1
+                self.active = self._collectors > 0
+
+    def span(self, name: str):
+        """Decorator marking a function as a named span"""
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.active:
+                    return func(*args, **kwargs)
+                spans = _current_spans.get()
+                if spans is None:
+                    return func(*args, **kwargs)
+                began = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    elapsed = time.perf_counter() - began
+                    entry = spans.get(name)
+                    if entry is None:
+                        spans[name] = [1, elapsed, elapsed]
+                    else:
+                        entry[0] += 1
+                        entry[1] += elapsed
+                        if elapsed > entry[2]:
+                            entry[2] = elapsed
+            return wrapper
+        return decorator
+
+
+# Create profiler instance
+profiler = Profiler(settings.PROFILE_DIR, settings.PROFILE_HISTORY)
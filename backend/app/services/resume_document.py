@@ -0,0 +1,83 @@
+import re
+from typing import Dict, List, Tuple
+
+
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_PATTERN = re.compile(r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+YEAR_PATTERN = re.compile(r'(19|20)\d{2}')
+ROLE_PATTERN = re.compile(r'engineer|developer|manager|lead|architect', re.IGNORECASE)
+DEGREE_PATTERN = re.compile(r'Bachelor|Master|PhD|B\.S\.|M\.S\.|B\.Tech|M\.Tech')
+
+# Heading text -> section name; 'other' headings only end the previous section
+SECTION_HEADINGS = {
+    'experience': 'experience',
+    'work experience': 'experience',
+    'professional experience': 'experience',
+    'employment': 'experience',
+    'employment history': 'experience',
+    'work history': 'experience',
+    'education': 'education',
+    'academic background': 'education',
+    'education and training': 'education',
+    'skills': 'skills',
+    'technical skills': 'skills',
+    'core competencies': 'skills',
+    'summary': 'summary',
+    'professional summary': 'summary',
+    'profile': 'summary',
+    'objective': 'summary',
+    'projects': 'other',
+    'certifications': 'other',
+    'languages': 'other',
+    'interests': 'other',
+    'awards': 'other',
+    'publications': 'other',
+    'references': 'other',
+}
+HEADING_PATTERN = re.compile(
+    r'(?:' + '|'.join(sorted((re.escape(h) for h in SECTION_HEADINGS), key=len, reverse=True)) + r')\s*:?',
+    re.IGNORECASE
+)
+MAX_HEADING_LENGTH = 40
+
+
+class ResumeDocument:
+    """
+    Resume text tokenized once and shared by every extractor
+
+    Holds the non-empty stripped lines and the line ranges of detected
+    sections (experience, education, skills, summary), found in the same
+    pass. Extractors scan section_lines(name), which falls back to the
+    whole document when a resume has no such heading.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.lines: List[str] = []
+        self.sections: Dict[str, List[Tuple[int, int]]] = {}
+
+        current = None
+        start = 0
+        for raw in text.splitlines():
+            line = raw.strip()
+            if not line:
+                continue
+            if len(line) <= MAX_HEADING_LENGTH and HEADING_PATTERN.fullmatch(line):
+                if current is not None:
+                    self.sections.setdefault(current, []).append((start, len(self.lines)))
+                current = SECTION_HEADINGS[line.rstrip(':').strip().lower()]
+                start = len(self.lines) + 1
+            self.lines.append(line)
+
+        if current is not None:
+            self.sections.setdefault(current, []).append((start, len(self.lines)))
+
+    def section_lines(self, name: str) -> List[str]:
+        """Lines under a section's headings, or every line if it has none"""
+        ranges = self.sections.get(name)
+        if not ranges:
+            return self.lines
+        lines: List[str] = []
+        for start, end in ranges:
+            lines.extend(self.lines[start:end])
+        return lines
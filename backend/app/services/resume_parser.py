@@ -1,112 +1,238 @@
 import PyPDF2
 import docx
-import re
-from typing import Dict, List
+import io
+import multiprocessing
+import signal
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FuturesTimeoutError
+from contextlib import contextmanager, nullcontext
+from typing import BinaryIO, List, Optional, Tuple, Union
+from app.config import settings
 from app.models.candidate import Candidate, ExperienceItem, EducationItem
+from app.services.profiler import profiler
+from app.services.resume_document import (
+    DEGREE_PATTERN, EMAIL_PATTERN, PHONE_PATTERN, ROLE_PATTERN, YEAR_PATTERN, ResumeDocument
+)
+from app.services.skill_taxonomy import SkillMatcher, skill_matcher
+
+
+class PdfTimeoutError(Exception):
+    """Raised when PDF text extraction exceeds PDF_TIMEOUT"""
+
+
+@contextmanager
+def _time_limit(seconds: float):
+    """
+    Interrupt the block after `seconds` with PdfTimeoutError
+
+    Uses SIGALRM, which is only available on POSIX and in the main thread
+    (where pool workers run their tasks); elsewhere the page loop's
+    deadline checks are the only guard.
+    """
+    if seconds <= 0 or not hasattr(signal, 'setitimer') or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    def on_alarm(signum, frame):
+        raise PdfTimeoutError(f"PDF extraction exceeded {seconds}s")
+
+    previous = signal.signal(signal.SIGALRM, on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _extract_pdf_pages(content: bytes, start: int, stop: int) -> List[Tuple[str, float]]:
+    """(text, seconds) for a range of pages (runs in a page worker)"""
+    reader = PyPDF2.PdfReader(io.BytesIO(content))
+    pages = []
+    for i in range(start, stop):
+        began = time.perf_counter()
+        pages.append((reader.pages[i].extract_text() or "", time.perf_counter() - began))
+    return pages
+
+
+_page_executor: Optional[ProcessPoolExecutor] = None
+
+
+def _get_page_executor() -> ProcessPoolExecutor:
+    """Start the page-level worker pool on first use"""
+    global _page_executor
+    if _page_executor is None:
+        _page_executor = ProcessPoolExecutor(
+            max_workers=settings.PDF_PAGE_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _page_executor
 
 
 class ResumeParser:
     """Parse resumes and extract candidate information"""
 
-    def __init__(self):
-        self.email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        self.phone_pattern = r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
+    def __init__(self, matcher: SkillMatcher = skill_matcher):
+        self.skill_matcher = matcher
+        self.last_pdf_stats: Optional[dict] = None
+
+    @profiler.span("ResumeParser.parse_pdf")
+    def parse_pdf(self, source: Union[str, BinaryIO]) -> str:
+        """
+        Extract text from PDF (file path or binary file object)
+
+        Reads at most PDF_MAX_PAGES pages and PDF_MAX_CHARS characters and
+        gives up with PdfTimeoutError after PDF_TIMEOUT seconds. Documents
+        of PDF_PARALLEL_MIN_PAGES+ pages are split across page workers.
+        Per-page timings are left in last_pdf_stats.
+        """
+        began = time.perf_counter()
+        deadline = began + settings.PDF_TIMEOUT if settings.PDF_TIMEOUT > 0 else None
+        self.last_pdf_stats = None
+        pages: List[Tuple[str, float]] = []
+        total_pages = 0
 
-    def parse_pdf(self, file_path: str) -> str:
-        """Extract text from PDF"""
-        text = ""
         try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text()
+            with _time_limit(settings.PDF_TIMEOUT):
+                pdf_reader = PyPDF2.PdfReader(source)
+                total_pages = len(pdf_reader.pages)
+                page_count = min(total_pages, settings.PDF_MAX_PAGES)
+
+                if 0 < settings.PDF_PARALLEL_MIN_PAGES <= page_count:
+                    pages = self._extract_parallel(source, page_count, deadline)
+                else:
+                    chars = 0
+                    for page in pdf_reader.pages[:page_count]:
+                        if deadline is not None and time.perf_counter() > deadline:
+                            raise PdfTimeoutError(f"PDF extraction exceeded {settings.PDF_TIMEOUT}s")
+                        page_began = time.perf_counter()
+                        page_text = page.extract_text() or ""
+                        pages.append((page_text, time.perf_counter() - page_began))
+                        chars += len(page_text)
+                        if chars >= settings.PDF_MAX_CHARS:
+                            break
+        except PdfTimeoutError:
+            raise
         except Exception as e:
             print(f"Error parsing PDF: {e}")
-        return text
 
-    def parse_docx(self, file_path: str) -> str:
-        """Extract text from DOCX"""
-        text = ""
+        text = "".join(page_text for page_text, _ in pages)
+        page_seconds = [seconds for _, seconds in pages]
+        self.last_pdf_stats = {
+            "pages": len(pages),
+            "totalPages": total_pages,
+            "truncated": len(pages) < total_pages or len(text) > settings.PDF_MAX_CHARS,
+            "seconds": time.perf_counter() - began,
+            "pageSeconds": page_seconds,
+            "slowestPageSeconds": max(page_seconds, default=0.0),
+        }
+        return text[:settings.PDF_MAX_CHARS]
+
+    def _extract_parallel(
+        self,
+        source: Union[str, BinaryIO],
+        page_count: int,
+        deadline: Optional[float]
+    ) -> List[Tuple[str, float]]:
+        """Extract page ranges in the page worker pool, in page order"""
+        if isinstance(source, str):
+            with open(source, 'rb') as f:
+                content = f.read()
+        else:
+            source.seek(0)
+            content = source.read()
+
+        executor = _get_page_executor()
+        step = -(-page_count // settings.PDF_PAGE_WORKERS)
+        futures = [
+            executor.submit(_extract_pdf_pages, content, start, min(start + step, page_count))
+            for start in range(0, page_count, step)
+        ]
+
+        pages: List[Tuple[str, float]] = []
+        try:
+            for future in futures:
+                remaining = None if deadline is None else max(0.0, deadline - time.perf_counter())
+                pages.extend(future.result(timeout=remaining))
+        except FuturesTimeoutError:
+            raise PdfTimeoutError(f"PDF extraction exceeded {settings.PDF_TIMEOUT}s")
+        finally:
+            for future in futures:
+                future.cancel()
+        return pages
+
+    @profiler.span("ResumeParser.parse_docx")
+    def parse_docx(self, source: Union[str, BinaryIO]) -> str:
+        """Extract text from DOCX (file path or binary file object)"""
+        parts = []
         try:
-            doc = docx.Document(file_path)
+            doc = docx.Document(source)
             for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
+                parts.append(paragraph.text)
         except Exception as e:
             print(f"Error parsing DOCX: {e}")
-        return text
+        return "".join(part + "\n" for part in parts)
 
-    def extract_email(self, text: str) -> str:
+    @staticmethod
+    def _document(text: Union[str, ResumeDocument]) -> ResumeDocument:
+        """Tokenize raw text (extractors also accept a prepared document)"""
+        return text if isinstance(text, ResumeDocument) else ResumeDocument(text)
+
+    @profiler.span("ResumeParser.extract_email")
+    def extract_email(self, text: Union[str, ResumeDocument]) -> str:
         """Extract email address"""
-        emails = re.findall(self.email_pattern, text)
+        emails = EMAIL_PATTERN.findall(self._document(text).text)
         return emails[0] if emails else "noemail@example.com"
 
-    def extract_phone(self, text: str) -> str:
+    @profiler.span("ResumeParser.extract_phone")
+    def extract_phone(self, text: Union[str, ResumeDocument]) -> str:
         """Extract phone number"""
-        phones = re.findall(self.phone_pattern, text)
+        phones = PHONE_PATTERN.findall(self._document(text).text)
         return phones[0] if phones else ""
 
-    def extract_name(self, text: str) -> str:
+    @profiler.span("ResumeParser.extract_name")
+    def extract_name(self, text: Union[str, ResumeDocument]) -> str:
         """Extract candidate name (first few lines usually contain name)"""
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        lines = self._document(text).lines
 
         # Name is usually in the first 3 lines
         for line in lines[:3]:
             # Skip lines with email or phone
-            if '@' not in line and not re.search(self.phone_pattern, line):
+            if '@' not in line and not PHONE_PATTERN.search(line):
                 # Name should be relatively short
                 if len(line) < 50 and len(line.split()) <= 4:
                     return line
 
         return lines[0] if lines else "Unknown"
 
-    def extract_skills(self, text: str) -> List[str]:
-        """Extract skills from resume text"""
-        # Common tech skills (this is a simplified version)
-        common_skills = [
-            'Python', 'Java', 'JavaScript', 'TypeScript', 'React', 'Angular', 'Vue',
-            'Node.js', 'Express', 'FastAPI', 'Django', 'Flask', 'Spring Boot',
-            'SQL', 'PostgreSQL', 'MySQL', 'MongoDB', 'Redis',
-            'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes',
-            'Git', 'CI/CD', 'Agile', 'Scrum',
-            'HTML', 'CSS', 'Tailwind', 'Bootstrap',
-            'REST', 'GraphQL', 'Microservices',
-            'Machine Learning', 'AI', 'Deep Learning', 'NLP',
-            'Data Analysis', 'Pandas', 'NumPy', 'TensorFlow',
-            'Leadership', 'Communication', 'Problem Solving'
-        ]
-
-        found_skills = []
-        text_lower = text.lower()
-
-        for skill in common_skills:
-            if skill.lower() in text_lower:
-                found_skills.append(skill)
-
-        return found_skills[:15]  # Limit to top 15 skills
+    @profiler.span("ResumeParser.extract_skills")
+    def extract_skills(self, text: Union[str, ResumeDocument]) -> List[str]:
+        """Extract skills from resume text (single pass over the taxonomy automaton)"""
+        # Skills are named throughout a resume, not only under a Skills heading
+        return self.skill_matcher.extract(self._document(text).text, limit=15)  # Limit to top 15 skills
 
-    def extract_experience(self, text: str) -> List[ExperienceItem]:
+    @profiler.span("ResumeParser.extract_experience")
+    def extract_experience(self, text: Union[str, ResumeDocument]) -> List[ExperienceItem]:
         """Extract work experience (basic extraction)"""
         # This is a simplified version - real implementation would use NLP
         experiences = []
 
-        # Look for common experience patterns
-        lines = text.split('\n')
+        # Only the experience section, when the resume has one
+        lines = self._document(text).section_lines('experience')
 
         # Simple heuristic: find company/position patterns
         for i, line in enumerate(lines):
-            line_lower = line.lower()
-            if any(word in line_lower for word in ['engineer', 'developer', 'manager', 'lead', 'architect']):
+            if ROLE_PATTERN.search(line):
                 # Try to find company name nearby
                 company = "Company Name"
                 duration = "2020 - Present"
 
-                if i + 1 < len(lines):
-                    next_line = lines[i + 1].strip()
-                    if len(next_line) < 50:
-                        company = next_line
+                if i + 1 < len(lines) and len(lines[i + 1]) < 50:
+                    company = lines[i + 1]
 
                 experiences.append(ExperienceItem(
-                    position=line.strip(),
+                    position=line,
                     company=company,
                     duration=duration,
                     description="Experience description"
@@ -126,26 +252,24 @@ class ResumeParser:
 
         return experiences
 
-    def extract_education(self, text: str) -> List[EducationItem]:
+    @profiler.span("ResumeParser.extract_education")
+    def extract_education(self, text: Union[str, ResumeDocument]) -> List[EducationItem]:
         """Extract education information"""
         education_list = []
 
-        # Look for degree keywords
-        degrees = ['Bachelor', 'Master', 'PhD', 'B.S.', 'M.S.', 'B.Tech', 'M.Tech']
-        lines = text.split('\n')
-
-        for i, line in enumerate(lines):
-            if any(degree in line for degree in degrees):
+        # Look for degree keywords in the education section, when present
+        for line in self._document(text).section_lines('education'):
+            if DEGREE_PATTERN.search(line):
                 institution = "University"
                 year = "2020"
 
                 # Try to extract year
-                year_match = re.search(r'(19|20)\d{2}', line)
+                year_match = YEAR_PATTERN.search(line)
                 if year_match:
                     year = year_match.group()
 
                 education_list.append(EducationItem(
-                    degree=line.strip(),
+                    degree=line,
                     institution=institution,
                     year=year
                 ))
@@ -163,31 +287,42 @@ class ResumeParser:
 
         return education_list
 
-    def parse_resume(self, file_path: str, filename: str) -> Candidate:
-        """Main parsing method"""
+    @profiler.span("ResumeParser.extract_summary")
+    def extract_summary(self, text: Union[str, ResumeDocument]) -> str:
+        """Extract summary (summary section, else first paragraph after name)"""
+        document = self._document(text)
+        if document.sections.get('summary'):
+            lines = document.section_lines('summary')
+        else:
+            lines = document.lines[1:5]  # Look in first few lines
+
+        for line in lines:
+            if len(line) > 50 and '@' not in line:
+                return line
+        return ""
+
+    @profiler.span("ResumeParser.parse_resume")
+    def parse_resume(self, source: Union[str, BinaryIO], filename: str) -> Candidate:
+        """Main parsing method (file path or binary file object)"""
         # Extract text based on file type
         if filename.endswith('.pdf'):
-            text = self.parse_pdf(file_path)
+            text = self.parse_pdf(source)
         elif filename.endswith('.docx'):
-            text = self.parse_docx(file_path)
+            text = self.parse_docx(source)
         else:
             raise ValueError("Unsupported file format")
 
+        # Tokenize once; every extractor shares the lines and sections
+        document = ResumeDocument(text)
+
         # Extract information
-        name = self.extract_name(text)
-        email = self.extract_email(text)
-        phone = self.extract_phone(text)
-        skills = self.extract_skills(text)
-        experience = self.extract_experience(text)
-        education = self.extract_education(text)
-
-        # Create summary (first paragraph after name)
-        lines = [l.strip() for l in text.split('\n') if l.strip()]
-        summary = ""
-        for line in lines[1:5]:  # Look in first few lines
-            if len(line) > 50 and '@' not in line:
-                summary = line
-                break
+        name = self.extract_name(document)
+        email = self.extract_email(document)
+        phone = self.extract_phone(document)
+        skills = self.extract_skills(document)
+        experience = self.extract_experience(document)
+        education = self.extract_education(document)
+        summary = self.extract_summary(document)
 
         # Create candidate object
         candidate = Candidate(
@@ -207,3 +342,29 @@ class ResumeParser:
 
 # Create parser instance
 resume_parser = ResumeParser()
+
+
+def parse_resume_bytes(content: bytes, filename: str, profiled: bool = False) -> dict:
+    """
+    Parse an in-memory resume in a worker process
+
+    Module-level so a process pool can pickle it by reference; returns
+    plain dicts because they are cheaper to send back than a model:
+    {"candidate": ..., "metrics": {"seconds": ..., "pdf": last_pdf_stats,
+    "spans": profiler spans and "profile": raw cProfile stats when
+    profiled is set, else None}}.
+    """
+    began = time.perf_counter()
+    resume_parser.last_pdf_stats = None
+    with profiler.collect_spans() if profiled else nullcontext() as spans:
+        with profiler.record() if profiled else nullcontext() as profile:
+            candidate = resume_parser.parse_resume(io.BytesIO(content), filename)
+    return {
+        "candidate": candidate.model_dump(),
+        "metrics": {
+            "seconds": time.perf_counter() - began,
+            "pdf": resume_parser.last_pdf_stats,
+            "spans": spans,
+            "profile": profile,
+        },
+    }
@@ -0,0 +1,166 @@
+import json
+from typing import Dict, List, Optional
+from app.config import settings
+
+
+# Canonical skill -> aliases (matched case-insensitively). Short or common
+# words ('node', 'ml', 'js') and products that merely contain a skill
+# ('github') are left out: they match ordinary resume text too often.
+DEFAULT_TAXONOMY: Dict[str, List[str]] = {
+    'Python': ['python3'],
+    'Java': [],
+    'JavaScript': ['ecmascript'],
+    'TypeScript': [],
+    'React': ['react.js', 'reactjs'],
+    'Angular': ['angularjs', 'angular.js'],
+    'Vue': ['vue.js', 'vuejs'],
+    'Node.js': ['nodejs'],
+    'Express': ['express.js', 'expressjs'],
+    'FastAPI': [],
+    'Django': [],
+    'Flask': [],
+    'Spring Boot': ['springboot'],
+    'SQL': [],
+    'PostgreSQL': ['postgres', 'psql'],
+    'MySQL': [],
+    'MongoDB': ['mongo'],
+    'Redis': [],
+    'AWS': ['amazon web services'],
+    'Azure': ['microsoft azure'],
+    'GCP': ['google cloud', 'google cloud platform'],
+    'Docker': [],
+    'Kubernetes': ['k8s'],
+    'Git': [],
+    'CI/CD': ['continuous integration', 'continuous delivery'],
+    'Agile': [],
+    'Scrum': [],
+    'HTML': ['html5'],
+    'CSS': ['css3'],
+    'Tailwind': ['tailwindcss', 'tailwind css'],
+    'Bootstrap': [],
+    'REST': ['restful', 'rest api', 'rest apis'],
+    'GraphQL': [],
+    'Microservices': ['microservice'],
+    'Machine Learning': [],
+    'AI': ['artificial intelligence'],
+    'Deep Learning': [],
+    'NLP': ['natural language processing'],
+    'Data Analysis': ['data analytics'],
+    'Pandas': [],
+    'NumPy': [],
+    'TensorFlow': [],
+    'Leadership': [],
+    'Communication': [],
+    'Problem Solving': ['problem-solving'],
+}
+
+
+def _is_word_char(ch: str) -> bool:
+    """Characters that continue a word"""
+    return ch.isalnum() or ch == '_'
+
+
+class SkillMatcher:
+    """
+    Aho-Corasick automaton over every skill name and alias
+
+    Built once per taxonomy; extract() finds all skills in one pass over
+    the text, so its cost depends on the text length and not on the size
+    of the taxonomy. Matches must start and end on word boundaries ("AI"
+    does not match inside "maintain"). Results are canonical names in
+    taxonomy order.
+    """
+
+    def __init__(self, taxonomy: Dict[str, List[str]]):
+        self.skills = list(taxonomy)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[tuple]] = [[]]
+
+        for index, (skill, aliases) in enumerate(taxonomy.items()):
+            for pattern in {skill, *aliases}:
+                self._add(self._normalize(pattern), index)
+        self._build_failure_links()
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """Lower-case and collapse whitespace"""
+        return ' '.join(text.lower().split())
+
+    def _add(self, pattern: str, index: int):
+        """Insert one pattern into the trie"""
+        if not pattern:
+            return
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append((index, len(pattern)))
+
+    def _build_failure_links(self):
+        """Breadth-first failure links, merging outputs along them"""
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def extract(self, text: str, limit: Optional[int] = None) -> List[str]:
+        """Canonical skills mentioned in the text"""
+        text = self._normalize(text)
+        goto, fail, out = self._goto, self._fail, self._out
+        last = len(text) - 1
+        found = set()
+        state = 0
+
+        for pos, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not out[state]:
+                continue
+            if pos < last and _is_word_char(text[pos + 1]):
+                continue
+            for index, length in out[state]:
+                start = pos - length + 1
+                if start == 0 or not _is_word_char(text[start - 1]):
+                    found.add(index)
+
+        skills = [self.skills[i] for i in sorted(found)]
+        return skills[:limit] if limit is not None else skills
+
+
+def load_taxonomy(path: str) -> Dict[str, List[str]]:
+    """
+    Load a taxonomy JSON file
+
+    Either an object of canonical skill -> list of aliases, or a plain
+    list of skill names. Falls back to the built-in taxonomy on error.
+    """
+    if not path:
+        return DEFAULT_TAXONOMY
+
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+        if isinstance(data, list):
+            return {skill: [] for skill in data}
+        return {skill: list(aliases or []) for skill, aliases in data.items()}
+    except Exception as e:
+        print(f"Error loading skill taxonomy: {e}")
+        return DEFAULT_TAXONOMY
+
+
+# Create skill matcher instance
+skill_matcher = SkillMatcher(load_taxonomy(settings.SKILL_TAXONOMY_PATH))
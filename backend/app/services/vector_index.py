@@ -0,0 +1,408 @@
+import json
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from app.config import settings
+from app.database import db
+from app.database.base import CandidateStore
+from app.models.candidate import Candidate
+from app.services.embeddings import candidate_profile_text, get_encoder
+from app.services.match_scoring import stable_hash
+from app.utils.growable_array import GrowableArray
+
+
+SEARCH_CHUNK_ROWS = 65536
+
+
+class _IVFIndex:
+    """
+    Inverted-file approximate index (spherical k-means coarse quantizer)
+
+    Rows are assigned to their nearest centroid; a query only scores the
+    rows of its `nprobe` nearest centroids.
+    """
+
+    def __init__(self, vectors: np.ndarray, alive: np.ndarray, seed: int = 0):
+        rng = np.random.default_rng(seed)
+        live_rows = np.flatnonzero(alive)
+        n_lists = max(1, int(np.sqrt(len(live_rows))))
+        sample = vectors[rng.choice(live_rows, min(len(live_rows), n_lists * 32), replace=False)]
+
+        centroids = sample[rng.choice(len(sample), n_lists, replace=False)]
+        for _ in range(10):
+            nearest = np.argmax(sample @ centroids.T, axis=1)
+            for i in range(n_lists):
+                members = sample[nearest == i]
+                if len(members):
+                    c = members.sum(axis=0)
+                    centroids[i] = c / (np.linalg.norm(c) or 1.0)
+
+        self.centroids = centroids.astype(np.float32)
+        self.assignment = np.empty(0, dtype=np.int32)
+        self.assign(vectors)
+        self.built_rows = len(vectors)
+
+    def assign(self, vectors: np.ndarray):
+        """Assign rows that were appended since the last call"""
+        start = len(self.assignment)
+        parts = [self.assignment]
+        for lo in range(start, len(vectors), SEARCH_CHUNK_ROWS):
+            chunk = np.asarray(vectors[lo:lo + SEARCH_CHUNK_ROWS])
+            parts.append(np.argmax(chunk @ self.centroids.T, axis=1).astype(np.int32))
+        self.assignment = np.concatenate(parts)
+
+    def candidate_rows(self, query: np.ndarray, nprobe: int) -> np.ndarray:
+        """Rows in the lists closest to the query"""
+        probes = np.argsort(-(self.centroids @ query))[:nprobe]
+        return np.flatnonzero(np.isin(self.assignment, probes))
+
+
+class VectorIndex:
+    """
+    Candidate embedding index for offline semantic matching
+
+    Every candidate is embedded once, when the store reports the insert,
+    and appended to a float32 matrix on disk (`<EMBEDDINGS_PATH>.f32`) that
+    is memory-mapped for search; ids are kept in a parallel append-only
+    file. Deletes tombstone rows. Queries are scored with batched matrix
+    products, switching to an IVF approximate index once the pool holds
+    SEMANTIC_ANN_MIN_POOL live vectors. The IVF index is (re)built on a
+    background thread when the pool crosses that size or doubles; searches
+    stay exact until it is ready.
+
+    Each row also records a hash of the profile text it embeds
+    (`<EMBEDDINGS_PATH>.digests`). Persisted rows are trusted on startup
+    only while the store fingerprint saved in the meta file matches;
+    otherwise, and whenever the store reloads, every record is re-hashed
+    and only candidates whose text changed are embedded again.
+    """
+
+    def __init__(self, store: CandidateStore, path: str):
+        self.store = store
+        self.encoder = get_encoder()
+        self.vectors_path = path + '.f32'
+        self.ids_path = path + '.ids'
+        self.digests_path = path + '.digests'
+        self.meta_path = path + '.meta.json'
+        self._lock = threading.RLock()
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._digests = GrowableArray(np.uint64)  # Profile text hash per row
+        self._alive = GrowableArray(np.bool_)
+        self._df = np.zeros(self.encoder.dim, dtype=np.int64)
+        self._matrix: Optional[np.ndarray] = None
+        self._ivf: Optional[_IVFIndex] = None
+        self._ivf_building = False
+        self._generation = 0  # Bumped whenever the files are rewritten
+        saved_fingerprint = self._load()
+        if saved_fingerprint is not None and saved_fingerprint == store.fingerprint():
+            self.sync()
+        else:
+            self.verify()
+        store.add_listener(self)
+
+    def _meta(self, fingerprint: Optional[str]) -> dict:
+        """Contents of the meta file"""
+        return {'encoder': self.encoder.name, 'dim': self.encoder.dim, 'fingerprint': fingerprint}
+
+    def _load(self) -> Optional[str]:
+        """
+        Open persisted vectors if they were built by the same encoder
+
+        Returns the store fingerprint they were saved for (None if unknown).
+        """
+        try:
+            with open(self.meta_path) as f:
+                meta = json.load(f)
+            fingerprint = meta.get('fingerprint')
+            if meta != self._meta(fingerprint):
+                raise ValueError("encoder changed")
+            with open(self.ids_path) as f:
+                ids = f.read().splitlines()
+            rows = os.path.getsize(self.vectors_path) // (4 * self.encoder.dim)
+            digests = np.fromfile(self.digests_path, dtype=np.uint64)
+        except (OSError, ValueError):
+            self._rewrite([], np.zeros((0, self.encoder.dim), dtype=np.float32), [])
+            return None
+
+        if not len(ids) == rows == len(digests):
+            # Crash between the appends: drop the half-written rows
+            rows = min(rows, len(ids), len(digests))
+            ids = ids[:rows]
+            digests = digests[:rows]
+            os.truncate(self.vectors_path, rows * 4 * self.encoder.dim)
+            os.truncate(self.digests_path, rows * 8)
+            with open(self.ids_path, 'w') as f:
+                f.write(''.join(i + '\n' for i in ids))
+            fingerprint = None
+
+        self._ids = ids
+        self._digests = GrowableArray(np.uint64, digests)
+        alive = np.zeros(len(ids), dtype=bool)
+        for row, candidate_id in enumerate(ids):
+            previous = self._rows.get(candidate_id)
+            if previous is not None:
+                alive[previous] = False
+            self._rows[candidate_id] = row
+            alive[row] = True
+        self._alive = GrowableArray(np.bool_, alive)
+        self._recount_df()
+        return fingerprint
+
+    @staticmethod
+    def _replace_file(path: str, payload: bytes):
+        """Atomically replace a file's contents"""
+        with open(path + '.tmp', 'wb') as f:
+            f.write(payload)
+        os.replace(path + '.tmp', path)
+
+    def _rewrite(self, ids: List[str], vectors: np.ndarray, digests: np.ndarray):
+        """Replace the on-disk files with the given rows"""
+        if os.path.dirname(self.vectors_path):
+            os.makedirs(os.path.dirname(self.vectors_path), exist_ok=True)
+        self._replace_file(self.meta_path, json.dumps(self._meta(None)).encode('utf-8'))
+        for path, payload in (
+            (self.vectors_path, np.ascontiguousarray(vectors, dtype=np.float32).tobytes()),
+            (self.ids_path, ''.join(i + '\n' for i in ids).encode('utf-8')),
+            (self.digests_path, np.asarray(digests, dtype=np.uint64).tobytes()),
+        ):
+            self._replace_file(path, payload)
+
+        self._ids = list(ids)
+        self._rows = {cid: row for row, cid in enumerate(ids)}
+        self._digests = GrowableArray(np.uint64, np.asarray(digests, dtype=np.uint64))
+        self._alive = GrowableArray(np.bool_, np.ones(len(ids), dtype=bool))
+        self._matrix = None
+        self._ivf = None
+        self._generation += 1
+        self._recount_df()
+
+    def _recount_df(self):
+        """Recompute document frequencies from the live vectors"""
+        self._df = np.zeros(self.encoder.dim, dtype=np.int64)
+        matrix = self._mapped()
+        for lo in range(0, len(self._ids), SEARCH_CHUNK_ROWS):
+            chunk = np.asarray(matrix[lo:lo + SEARCH_CHUNK_ROWS])
+            alive = self._alive.view()[lo:lo + SEARCH_CHUNK_ROWS]
+            self._df += (chunk[alive] != 0).sum(axis=0)
+
+    def _mapped(self) -> np.ndarray:
+        """Memory-mapped view of all rows"""
+        rows = len(self._ids)
+        if self._matrix is None or len(self._matrix) != rows:
+            if rows == 0:
+                self._matrix = np.zeros((0, self.encoder.dim), dtype=np.float32)
+            else:
+                self._matrix = np.memmap(
+                    self.vectors_path, dtype=np.float32, mode='r', shape=(rows, self.encoder.dim)
+                )
+        return self._matrix
+
+    def _append(self, candidates: List[Candidate]):
+        """Embed candidates and append them to the on-disk matrix"""
+        texts = [candidate_profile_text(c) for c in candidates]
+        vectors = np.stack([self.encoder.encode(text) for text in texts])
+        digests = np.array([stable_hash(text) for text in texts], dtype=np.uint64)
+        with open(self.vectors_path, 'ab') as f:
+            f.write(vectors.astype(np.float32).tobytes())
+        with open(self.digests_path, 'ab') as f:
+            f.write(digests.tobytes())
+        with open(self.ids_path, 'a') as f:
+            f.write(''.join(c.id + '\n' for c in candidates))
+
+        for candidate in candidates:
+            self._remove(candidate.id)
+        start = len(self._ids)
+        self._ids.extend(c.id for c in candidates)
+        self._rows.update((c.id, start + i) for i, c in enumerate(candidates))
+        self._digests.extend(digests)
+        self._alive.extend(np.ones(len(candidates), dtype=bool))
+        self._df += (vectors != 0).sum(axis=0)
+        self._maybe_build_ivf()
+
+    def _remove(self, candidate_id: str) -> bool:
+        """Tombstone a candidate's row"""
+        row = self._rows.pop(candidate_id, None)
+        if row is None:
+            return False
+        self._alive.view()[row] = False
+        self._df -= np.asarray(self._mapped()[row]) != 0
+        return True
+
+    def _maybe_compact(self):
+        """Drop tombstoned rows once a quarter of the matrix is dead"""
+        dead = len(self._ids) - len(self._rows)
+        if dead > 1024 and dead * 4 > len(self._ids):
+            rows = np.flatnonzero(self._alive.view())
+            self._rewrite(
+                [self._ids[r] for r in rows],
+                np.asarray(self._mapped()[rows]),
+                self._digests.view()[rows]
+            )
+            self._maybe_build_ivf()
+
+    def _maybe_build_ivf(self):
+        """Start a background IVF build once the pool is large enough (caller holds the lock)"""
+        if self._ivf_building or len(self._rows) < settings.SEMANTIC_ANN_MIN_POOL:
+            return
+        if self._ivf is not None and len(self._ids) <= 2 * self._ivf.built_rows:
+            return
+        self._ivf_building = True
+        threading.Thread(target=self._build_ivf, args=(self._generation,), daemon=True).start()
+
+    def _build_ivf(self, generation: int):
+        """Cluster the current rows outside the lock, then swap the index in"""
+        try:
+            with self._lock:
+                matrix = self._mapped()
+                alive = self._alive.view().copy()
+            ivf = _IVFIndex(matrix, alive)
+        except Exception as e:
+            print(f"Error building semantic ANN index: {e}")
+            with self._lock:
+                self._ivf_building = False
+            return
+
+        with self._lock:
+            if generation == self._generation:
+                self._ivf = ivf
+            self._ivf_building = False
+            # Rows may have doubled again (or been rewritten) meanwhile
+            self._maybe_build_ivf()
+
+    def on_candidate_added(self, candidate: Candidate):
+        """Store listener: embed a new candidate"""
+        with self._lock:
+            self._append([candidate])
+
+    def on_candidate_deleted(self, candidate_id: str):
+        """Store listener: drop a deleted candidate"""
+        with self._lock:
+            if self._remove(candidate_id):
+                self._maybe_compact()
+
+    def on_store_reloaded(self):
+        """Store listener: storage changed on disk"""
+        # Records may have changed under the same ids
+        self.verify()
+
+    def _embed(self, candidates: Iterable[Candidate]):
+        """Append candidates in bounded batches (lock held)"""
+        batch = []
+        for candidate in candidates:
+            batch.append(candidate)
+            if len(batch) >= 1024:
+                self._append(batch)
+                batch = []
+        if batch:
+            self._append(batch)
+
+    def sync(self):
+        """Reconcile embedded rows with the candidate ids in the store"""
+        store_ids = self.store.get_candidate_ids()
+        with self._lock:
+            missing = [i for i in store_ids if i not in self._rows]
+            for candidate_id in self._rows.keys() - set(store_ids):
+                self._remove(candidate_id)
+            self._embed(
+                candidate for candidate in map(self.store.get_candidate_by_id, missing)
+                if candidate is not None
+            )
+            self._maybe_compact()
+        self.save()
+
+    def verify(self):
+        """Re-embed candidates whose profile text no longer matches their row"""
+        candidates = self.store.get_all_candidates()
+        hashes = [stable_hash(candidate_profile_text(c)) for c in candidates]
+        with self._lock:
+            digests = self._digests.view()
+            stale = [
+                candidate for candidate, digest in zip(candidates, hashes)
+                if self._rows.get(candidate.id) is None or digests[self._rows[candidate.id]] != digest
+            ]
+            for candidate_id in self._rows.keys() - {c.id for c in candidates}:
+                self._remove(candidate_id)
+            self._embed(stale)
+            self._maybe_compact()
+        self.save()
+
+    def save(self):
+        """Record the store fingerprint the persisted rows are current for"""
+        # Read before the lock: rows only ever move ahead of it, and a
+        # mismatch on startup just means a verify()
+        fingerprint = self.store.fingerprint()
+        with self._lock:
+            try:
+                self._replace_file(self.meta_path, json.dumps(self._meta(fingerprint)).encode('utf-8'))
+            except OSError as e:
+                print(f"Error saving embeddings metadata: {e}")
+
+    def _query_vector(self, text: str) -> np.ndarray:
+        """Embed a query, weighting hashed terms by IDF"""
+        query = self.encoder.encode(text)
+        if self.encoder.uses_idf:
+            n_docs = len(self._rows)
+            idf = np.log((1 + n_docs) / (1 + self._df)) + 1.0
+            query = query * (idf * idf).astype(np.float32)
+            norm = np.linalg.norm(query)
+            query = query / norm if norm else query
+        return query
+
+    def _ann_rows(self, query: np.ndarray) -> Optional[np.ndarray]:
+        """Rows to score via the approximate index, or None for exact search"""
+        if self._ivf is None or len(self._rows) < settings.SEMANTIC_ANN_MIN_POOL:
+            return None
+
+        # Rows appended since the build go to their nearest existing list
+        self._ivf.assign(self._mapped())
+        return self._ivf.candidate_rows(query, settings.SEMANTIC_ANN_NPROBE)
+
+    def _calibrate(self, similarities: np.ndarray, ceiling: float) -> np.ndarray:
+        """
+        Map cosine similarities onto a 0-1 match score
+
+        Similarity is first taken relative to `ceiling` (what the job text
+        itself would score as a candidate profile), then stretched between
+        the encoder's similarity_floor and similarity_full and clipped.
+        """
+        if ceiling <= 0:
+            return np.zeros_like(similarities)
+        floor, full = self.encoder.similarity_floor, self.encoder.similarity_full
+        return np.clip((similarities / ceiling - floor) / (full - floor), 0.0, 1.0)
+
+    def search(self, text: str, k: int) -> List[Tuple[str, float]]:
+        """Top-k (candidate id, calibrated 0-1 similarity score), best first"""
+        with self._lock:
+            if not self._rows or k <= 0:
+                return []
+            query = self._query_vector(text)
+            ceiling = float(self.encoder.encode(text) @ query)
+            matrix = self._mapped()
+            alive = self._alive.view()
+            ids = self._ids
+            rows = self._ann_rows(query)
+
+        best_rows = np.zeros(0, dtype=np.int64)
+        best_scores = np.zeros(0, dtype=np.float32)
+        if rows is None:
+            rows = np.arange(len(ids))
+        rows = rows[alive[rows]]
+
+        for lo in range(0, len(rows), SEARCH_CHUNK_ROWS):
+            chunk_rows = rows[lo:lo + SEARCH_CHUNK_ROWS]
+            scores = np.asarray(matrix[chunk_rows]) @ query
+            best_rows = np.concatenate([best_rows, chunk_rows])
+            best_scores = np.concatenate([best_scores, scores])
+            if len(best_scores) > k:
+                keep = np.argpartition(-best_scores, k - 1)[:k]
+                best_rows, best_scores = best_rows[keep], best_scores[keep]
+
+        order = np.lexsort((best_rows, -best_scores))
+        calibrated = self._calibrate(best_scores, ceiling)
+        return [(ids[best_rows[i]], float(calibrated[i])) for i in order]
+
+
+# Create vector index instance
+vector_index = VectorIndex(db, settings.EMBEDDINGS_PATH)
@@ -0,0 +1,24 @@
+import numpy as np
+
+
+class GrowableArray:
+    """Append-only NumPy buffer with amortized O(1) appends"""
+
+    def __init__(self, dtype, values=()):
+        self._data = np.asarray(values, dtype=dtype)
+        self.size = len(self._data)
+
+    def extend(self, values):
+        """Append values, doubling capacity when full"""
+        values = np.asarray(values, dtype=self._data.dtype)
+        end = self.size + len(values)
+        if end > len(self._data):
+            grown = np.empty(max(end, 2 * len(self._data), 1024), dtype=self._data.dtype)
+            grown[:self.size] = self._data[:self.size]
+            self._data = grown
+        self._data[self.size:end] = values
+        self.size = end
+
+    def view(self) -> np.ndarray:
+        """The filled part of the buffer (no copy)"""
+        return self._data[:self.size]
@@ -0,0 +1,54 @@
+import time
+from app.services.metrics import MetricsRegistry, metrics
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording latency, body sizes and in-flight requests
+
+    Written against raw ASGI rather than BaseHTTPMiddleware so streamed
+    uploads and NDJSON exports pass through untouched; bytes are counted
+    as the messages go by.
+    """
+
+    def __init__(self, app, registry: MetricsRegistry = metrics):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.registry.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        sizes = {"request": 0, "response": 0}
+        status = 500
+
+        async def counting_receive():
+            message = await receive()
+            if message["type"] == "http.request":
+                sizes["request"] += len(message.get("body", b""))
+            return message
+
+        async def counting_send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                sizes["response"] += len(message.get("body", b""))
+            await send(message)
+
+        self.registry.request_started()
+        began = time.perf_counter()
+        try:
+            await self.app(scope, counting_receive, counting_send)
+        finally:
+            # The router stores the matched route in the shared scope
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            self.registry.request_finished(
+                scope["method"],
+                route,
+                status,
+                time.perf_counter() - began,
+                sizes["request"],
+                sizes["response"]
+            )
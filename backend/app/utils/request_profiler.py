@@ -0,0 +1,39 @@
+from typing import Optional
+from starlette.routing import Match
+from app.services.profiler import Profiler, profiler
+
+
+def route_template(scope) -> Optional[str]:
+    """Path template of the route a request will be dispatched to"""
+    app = scope.get("app")
+    for route in getattr(app, "routes", []):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return getattr(route, "path", None)
+    return None
+
+
+class ProfilerMiddleware:
+    """
+    ASGI middleware running requests of an armed profile under cProfile
+
+    Routes are only resolved while a session is armed; otherwise requests
+    go straight through.
+    """
+
+    def __init__(self, app, instance: Profiler = profiler):
+        self.app = app
+        self.profiler = instance
+
+    async def __call__(self, scope, receive, send):
+        if not self.profiler.armed or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        session = self.profiler.claim(scope["method"], route_template(scope))
+        if session is None:
+            await self.app(scope, receive, send)
+            return
+
+        with self.profiler.capture(session):
+            await self.app(scope, receive, send)
@@ -0,0 +1,106 @@
+import json
+import math
+from typing import Any, List, Optional, Set
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+from app.models.candidate import Candidate
+from app.models.job import BatchMatchResult, MatchResult
+from app.services.metrics import metrics
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+# Pydantic serializes model lists straight to JSON bytes in Rust
+candidate_list = TypeAdapter(List[Candidate])
+match_result_list = TypeAdapter(List[MatchResult])
+batch_match_result_list = TypeAdapter(List[BatchMatchResult])
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def _float_text(value: float) -> str:
+    """A float the way orjson writes it (null when not finite)"""
+    if not math.isfinite(value):
+        return 'null'
+    text = repr(value)
+    if 'e' not in text:
+        return text
+    mantissa, exponent = text.split('e')
+    if int(exponent) == -5:  # orjson only switches to an exponent below 1e-5
+        sign = '-' if mantissa.startswith('-') else ''
+        return f"{sign}0.0000{mantissa.lstrip('-').replace('.', '')}"
+    return f"{mantissa}e{int(exponent)}"
+
+
+def _encode(obj: Any) -> str:
+    """Stdlib fallback that writes the same text as orjson for plain JSON types"""
+    if isinstance(obj, str):
+        return json.dumps(obj, ensure_ascii=False)
+    if obj is None:
+        return 'null'
+    if isinstance(obj, bool):
+        return 'true' if obj else 'false'
+    if isinstance(obj, int):
+        return int.__repr__(obj)
+    if isinstance(obj, float):
+        return _float_text(obj)
+    if isinstance(obj, dict):
+        for key in obj:
+            if not isinstance(key, str):
+                raise TypeError("Dict key must be str")
+        return '{' + ','.join(f"{_encode(key)}:{_encode(value)}" for key, value in obj.items()) + '}'
+    if isinstance(obj, (list, tuple)):
+        return '[' + ','.join(_encode(item) for item in obj) + ']'
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Compact JSON bytes (orjson when installed, stdlib otherwise)
+
+    Both paths produce the same bytes, including float formatting, so
+    files written under one backend read back identically under the other.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return _encode(obj).encode('utf-8')
+
+
+def loads(data) -> Any:
+    """Parse JSON from bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@metrics.timed("serialize")
+def dump_candidates(candidates: List[Candidate], include: Optional[Set[str]] = None) -> bytes:
+    """JSON array of candidates, optionally projected to some fields"""
+    return candidate_list.dump_json(candidates, include={'__all__': include} if include else None)
+
+
+@metrics.timed("serialize")
+def dump_match_results(results: List[MatchResult]) -> bytes:
+    """JSON array of match results"""
+    return match_result_list.dump_json(results)
+
+
+@metrics.timed("serialize")
+def dump_batch_match_results(results: List[BatchMatchResult]) -> bytes:
+    """JSON array of per-job match results"""
+    return batch_match_result_list.dump_json(results)
+
+
+def envelope(data: bytes, status_code: int = 200, **extra) -> Response:
+    """
+    {"success": true, "data": <data>, **extra} around pre-serialized data
+
+    The payload is spliced in as bytes, so large lists are never turned
+    into dicts or re-encoded.
+    """
+    body = b'{"success":true,"data":' + data
+    body += (b',' + dumps(extra)[1:]) if extra else b'}'
+    return Response(content=body, status_code=status_code, media_type="application/json")
@@ -0,0 +1,95 @@
+from typing import List, Optional, Tuple
+from fastapi import Request
+from multipart.multipart import MultipartParser, parse_options_header
+
+
+# Allowance for multipart boundaries and part headers on top of the file
+MULTIPART_OVERHEAD = 16 * 1024
+
+
+class UploadTooLargeError(Exception):
+    """Raised as soon as an upload exceeds the size limit"""
+
+
+class MalformedUploadError(Exception):
+    """Raised when the request is not a usable multipart upload"""
+
+
+async def read_multipart_file(request: Request, field_name: str, max_size: int) -> Tuple[str, bytes]:
+    """
+    Stream one file field out of a multipart request into memory
+
+    The body is parsed chunk by chunk as it arrives, so MAX_UPLOAD_SIZE is
+    enforced without buffering the whole request first (and a too-large
+    Content-Length is rejected before reading anything). Nothing is
+    written to disk. Returns (filename, content).
+    """
+    content_type, params = parse_options_header(request.headers.get('content-type', ''))
+    if content_type != b'multipart/form-data' or b'boundary' not in params:
+        raise MalformedUploadError("Expected a multipart/form-data upload")
+
+    content_length = request.headers.get('content-length')
+    if content_length and content_length.isdigit() and int(content_length) > max_size + MULTIPART_OVERHEAD:
+        raise UploadTooLargeError()
+
+    header_field = bytearray()
+    header_value = bytearray()
+    headers = {}
+    chunks: List[bytes] = []
+    state = {'capturing': False, 'size': 0, 'filename': None, 'done': False}
+
+    def on_part_begin():
+        headers.clear()
+
+    def on_header_field(data: bytes, start: int, end: int):
+        header_field.extend(data[start:end])
+
+    def on_header_value(data: bytes, start: int, end: int):
+        header_value.extend(data[start:end])
+
+    def on_header_end():
+        headers[bytes(header_field).lower()] = bytes(header_value)
+        header_field.clear()
+        header_value.clear()
+
+    def on_headers_finished():
+        _, disposition = parse_options_header(headers.get(b'content-disposition', b''))
+        state['capturing'] = (
+            not state['done']
+            and disposition.get(b'name') == field_name.encode()
+            and b'filename' in disposition
+        )
+        if state['capturing']:
+            state['filename'] = disposition[b'filename'].decode('utf-8', errors='replace')
+
+    def on_part_data(data: bytes, start: int, end: int):
+        if not state['capturing']:
+            return
+        state['size'] += end - start
+        if state['size'] > max_size:
+            raise UploadTooLargeError()
+        chunks.append(data[start:end])
+
+    def on_part_end():
+        if state['capturing']:
+            state['capturing'] = False
+            state['done'] = True
+
+    parser = MultipartParser(params[b'boundary'], {
+        'on_part_begin': on_part_begin,
+        'on_header_field': on_header_field,
+        'on_header_value': on_header_value,
+        'on_header_end': on_header_end,
+        'on_headers_finished': on_headers_finished,
+        'on_part_data': on_part_data,
+        'on_part_end': on_part_end,
+    })
+
+    async for chunk in request.stream():
+        parser.write(chunk)
+    parser.finalize()
+
+    filename: Optional[str] = state['filename']
+    if not state['done'] or not filename:
+        raise MalformedUploadError(f"Missing file field '{field_name}'")
+    return filename, b''.join(chunks)
@@ -0,0 +1,96 @@
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def percentiles(samples: Iterable[float]) -> Dict[str, float]:
+    """Summary of latency samples in milliseconds"""
+    values = np.asarray(list(samples), dtype=np.float64) * 1000.0
+    if not len(values):
+        return {"count": 0}
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {
+        "count": int(len(values)),
+        "meanMs": float(values.mean()),
+        "p50Ms": float(p50),
+        "p95Ms": float(p95),
+        "p99Ms": float(p99),
+        "maxMs": float(values.max()),
+    }
+
+
+def _psutil_memory():
+    """psutil memory info of this process, if psutil is installed"""
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info()
+
+
+def max_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process so far (None if unknown)"""
+    if resource is not None:
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports KiB, macOS bytes
+        return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+    memory = _psutil_memory()
+    peak = getattr(memory, 'peak_wset', None)  # Windows peak working set
+    return peak / (1024 * 1024) if peak is not None else None
+
+
+def current_rss_mb() -> Optional[float]:
+    """Resident set size right now (None if unknown)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        pass
+    memory = _psutil_memory()
+    return memory.rss / (1024 * 1024) if memory is not None else max_rss_mb()
+
+
+def format_mb(value: Optional[float]) -> str:
+    """Memory figure for reports"""
+    return f"{value:.0f} MB" if value is not None else "n/a"
+
+
+def git_commit() -> str:
+    """Current commit, so results can be compared between revisions"""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def write_results(path: str, benchmark: str, config: dict, results: list):
+    """Write a results file with enough context to compare runs"""
+    payload = {
+        "benchmark": benchmark,
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpuCount": os.cpu_count(),
+        "config": config,
+        "results": results,
+        "maxRssMb": max_rss_mb(),
+    }
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(payload, f, indent=2)
+    print(f"Results written to {path}")
@@ -0,0 +1,162 @@
+"""
+Synthetic resume corpus
+
+Generates deterministic PDF and DOCX resumes of varying sizes without
+network access or extra dependencies: DOCX through python-docx, PDF
+through a minimal writer that PyPDF2 can extract text from. Also
+generates already-parsed candidates for seeding a store, and match
+feature arrays for pools too large to build from Candidate objects.
+"""
+import io
+import random
+from typing import Dict, Iterator, List, Tuple
+import docx
+import numpy as np
+from app.models.candidate import Candidate, EducationItem, ExperienceItem
+from app.services.match_scoring import YEARS_PER_ROLE, CandidateFeatures, stable_hash
+from app.services.skill_taxonomy import DEFAULT_TAXONOMY
+
+
+FIRST_NAMES = ['Jane', 'John', 'Priya', 'Wei', 'Carlos', 'Amara', 'Olga', 'Kenji', 'Fatima', 'Liam']
+LAST_NAMES = ['Doe', 'Smith', 'Patel', 'Zhang', 'Garcia', 'Okafor', 'Ivanova', 'Sato', 'Khan', 'Murphy']
+ROLES = ['Software Engineer', 'Backend Developer', 'Engineering Manager', 'Tech Lead', 'Solutions Architect']
+COMPANIES = ['Acme Corp', 'Globex', 'Initech', 'Umbrella Labs', 'Stark Industries', 'Wayne Enterprises']
+DEGREES = ['B.S. Computer Science', 'M.S. Software Engineering', 'B.Tech Information Technology', 'PhD Machine Learning']
+FILLER = [
+    'Designed and shipped services handling millions of requests per day',
+    'Mentored junior engineers and ran weekly design reviews',
+    'Reduced infrastructure cost by consolidating batch workloads',
+    'Migrated legacy monoliths to event-driven components',
+    'Owned on-call rotation and incident postmortems',
+    'Partnered with product managers to scope quarterly roadmaps',
+]
+
+# Experience entries (and filler bullets) per resume
+SIZES: Dict[str, int] = {'small': 2, 'medium': 8, 'large': 40}
+LINES_PER_PAGE = 45
+
+
+def resume_lines(rng: random.Random, size: str) -> List[str]:
+    """Text lines of one synthetic resume"""
+    skills = list(DEFAULT_TAXONOMY)
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    lines = [
+        name,
+        f"{name.lower().replace(' ', '.')}@example.com  +1 555-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+        "Summary",
+        f"{rng.choice(ROLES)} with {rng.randint(2, 20)} years of experience building reliable software systems.",
+        "Experience",
+    ]
+    for _ in range(SIZES[size]):
+        start = rng.randint(2000, 2020)
+        lines.append(rng.choice(ROLES))
+        lines.append(rng.choice(COMPANIES))
+        lines.append(f"{start} - {start + rng.randint(1, 4)}")
+        lines.extend(rng.choice(FILLER) + f" using {rng.choice(skills)}." for _ in range(3))
+    lines.append("Education")
+    lines.append(f"{rng.choice(DEGREES)} {rng.randint(1995, 2020)}")
+    lines.append("State University")
+    lines.append("Skills")
+    lines.append(", ".join(rng.sample(skills, 12)))
+    return lines
+
+
+def _pdf_escape(text: str) -> str:
+    """Escape a string for a PDF literal"""
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def make_pdf(lines: List[str]) -> bytes:
+    """Minimal multi-page PDF (Helvetica text, one line per row)"""
+    pages = [lines[i:i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)] or [[]]
+    objects: List[bytes] = [b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    pages_ref = 2 + 2 * len(pages)
+    kids = []
+
+    for page in pages:
+        stream = "BT /F1 10 Tf 50 760 Td 14 TL " + " ".join(f"({_pdf_escape(line)}) '" for line in page) + " ET"
+        data = stream.encode('latin-1', errors='replace')
+        objects.append(b"<< /Length %d >>\nstream\n" % len(data) + data + b"\nendstream")
+        objects.append(
+            b"<< /Type /Page /Parent %d 0 R /Resources << /Font << /F1 1 0 R >> >> "
+            b"/MediaBox [0 0 612 792] /Contents %d 0 R >>" % (pages_ref, len(objects))
+        )
+        kids.append(len(objects))
+
+    objects.append(b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(b"%d 0 R" % k for k in kids), len(kids)))
+    objects.append(b"<< /Type /Catalog /Pages %d 0 R >>" % pages_ref)
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    out.write(b"".join(b"%010d 00000 n \n" % offset for offset in offsets))
+    out.write(b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, len(objects), xref))
+    return out.getvalue()
+
+
+def make_docx(lines: List[str]) -> bytes:
+    """DOCX with one paragraph per line"""
+    document = docx.Document()
+    for line in lines:
+        document.add_paragraph(line)
+    out = io.BytesIO()
+    document.save(out)
+    return out.getvalue()
+
+
+def generate(count: int, size: str, fmt: str, seed: int = 0) -> List[Tuple[str, bytes]]:
+    """(filename, content) for `count` resumes of one size and format"""
+    rng = random.Random(f"{seed}:{size}:{fmt}")
+    make = make_pdf if fmt == 'pdf' else make_docx
+    return [(f"resume_{size}_{i}.{fmt}", make(resume_lines(rng, size))) for i in range(count)]
+
+
+def make_candidates(count: int, seed: int = 0, start: int = 0) -> Iterator[Candidate]:
+    """Synthetic parsed candidates with unique, sortable ids"""
+    rng = random.Random(f"{seed}:candidates:{start}")
+    skills = list(DEFAULT_TAXONOMY)
+    for i in range(start, start + count):
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        yield Candidate(
+            id=f"bench{i:09d}",
+            name=name,
+            email=f"{name.lower().replace(' ', '.')}{i}@example.com",
+            location="Location Not Specified",
+            skills=rng.sample(skills, rng.randint(3, 12)),
+            experience=[
+                ExperienceItem(
+                    position=rng.choice(ROLES),
+                    company=rng.choice(COMPANIES),
+                    duration="2020 - Present",
+                    description=rng.choice(FILLER)
+                )
+                for _ in range(rng.randint(1, 4))
+            ],
+            education=[EducationItem(institution="State University", degree=rng.choice(DEGREES), year="2015")],
+            summary=f"{rng.choice(ROLES)} with {rng.randint(2, 20)} years of experience.",
+            resumeUrl=f"resume_{i}.pdf"
+        )
+
+
+def make_features(count: int, seed: int = 0) -> CandidateFeatures:
+    """Match features of `count` synthetic candidates, built as arrays"""
+    rng = np.random.default_rng(seed)
+    vocab = [skill.lower() for skill in DEFAULT_TAXONOMY]
+    lengths = rng.integers(3, 13, size=count)
+    indptr = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum(lengths, out=indptr[1:])
+    ids = [f"bench{i:09d}" for i in range(count)]
+    return CandidateFeatures(
+        ids=ids,
+        vocab=vocab,
+        indptr=indptr,
+        indices=rng.integers(0, len(vocab), size=int(indptr[-1]), dtype=np.int32),
+        exp_years=(rng.integers(1, 5, size=count) * YEARS_PER_ROLE).astype(np.float32),
+        id_hashes=np.asarray([stable_hash(i) for i in ids], dtype=np.uint64),
+        alive=np.ones(count, dtype=bool)
+    )
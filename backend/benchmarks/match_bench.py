@@ -0,0 +1,133 @@
+"""
+Sharded matching benchmark
+
+Scores synthetic feature pools with 1..N worker processes and reports
+latency percentiles, throughput and speedup over in-process scoring, to
+check how /api/match scales with cores; then times ranking every job in
+one batch pass (/api/match/batch) against ranking them one by one.
+
+Run from backend/:
+    python -m benchmarks.match_bench --pools 1000000 --workers 1,2,4,8,16
+"""
+import argparse
+import random
+import tempfile
+import time
+from typing import List
+from app.config import settings
+from app.services.match_scoring import job_fingerprint, rank_jobs, rank_rows, skill_union, vocab_skill_hits
+from app.services.parallel_matcher import ShardedMatcher
+from app.services.skill_taxonomy import DEFAULT_TAXONOMY
+from benchmarks.common import percentiles, write_results
+from benchmarks.corpus import make_features
+
+
+def make_jobs(count: int, seed: int) -> List[tuple]:
+    """(skills, experience) pairs"""
+    rng = random.Random(seed)
+    skills = list(DEFAULT_TAXONOMY)
+    return [(rng.sample(skills, 5), f"{rng.randint(1, 10)}+ years") for _ in range(count)]
+
+
+def bench_workers(features, jobs, workers: int, top_n: int, chunk_rows: int, directory: str) -> dict:
+    """Latency and throughput of ranking every job with `workers` processes"""
+    matcher = ShardedMatcher(directory, workers=workers, min_rows=1, chunk_rows=chunk_rows)
+
+    def rank(skills, experience):
+        job_hash = int(job_fingerprint(skills, experience)[:16], 16)
+        vocab_hits = vocab_skill_hits(features.vocab, skills)
+        if workers > 1:
+            return matcher.rank(features, skills, experience, job_hash, top_n, vocab_hits)
+        return rank_rows(features, skills, experience, job_hash, top_n, chunk_rows, vocab_hits)
+
+    try:
+        began = time.perf_counter()
+        matcher.publish(features)
+        rank(*jobs[0])  # Starts the workers
+        warmup = time.perf_counter() - began
+
+        samples = []
+        began = time.perf_counter()
+        for skills, experience in jobs:
+            start = time.perf_counter()
+            rank(skills, experience)
+            samples.append(time.perf_counter() - start)
+        elapsed = time.perf_counter() - began
+    finally:
+        matcher.shutdown()
+
+    return {
+        "workers": workers,
+        "warmupSeconds": warmup,
+        "latency": percentiles(samples),
+        "perSecond": len(jobs) / elapsed if elapsed else 0.0,
+    }
+
+
+def bench_batch(features, jobs, top_n: int, chunk_rows: int, repeat: int = 3) -> dict:
+    """In-process time of one rank_jobs pass vs one rank_rows call per job"""
+    job_hashes = [int(job_fingerprint(skills, experience)[:16], 16) for skills, experience in jobs]
+
+    def sequential():
+        for (skills, experience), job_hash in zip(jobs, job_hashes):
+            rank_rows(features, skills, experience, job_hash, top_n, chunk_rows)
+
+    def batch():
+        vocab_hits = vocab_skill_hits(features.vocab, skill_union(jobs))
+        rank_jobs(features, jobs, job_hashes, top_n, chunk_rows, vocab_hits)
+
+    timings = {}
+    for name, fn in (("sequential", sequential), ("batch", batch)):
+        samples = []
+        for _ in range(repeat):
+            began = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - began)
+        timings[name] = percentiles(samples)
+    timings["jobs"] = len(jobs)
+    timings["speedup"] = timings["sequential"]["p50Ms"] / timings["batch"]["p50Ms"]
+    return timings
+
+
+def main():
+    """Run every pool size and worker count and write the results file"""
+    arg_parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    arg_parser.add_argument('--pools', default='100000,1000000', help="Comma-separated pool sizes")
+    arg_parser.add_argument('--workers', default='1,2,4', help="Comma-separated worker counts")
+    arg_parser.add_argument('--requests', type=int, default=20)
+    arg_parser.add_argument('--top-n', type=int, default=50)
+    arg_parser.add_argument('--chunk-rows', type=int, default=settings.MATCH_CHUNK_ROWS)
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--output', default='benchmarks/results/match.json')
+    args = arg_parser.parse_args()
+
+    jobs = make_jobs(args.requests, args.seed)
+    results = []
+    with tempfile.TemporaryDirectory(prefix="recrutix-shards-") as directory:
+        for pool in (int(p) for p in args.pools.split(',')):
+            features = make_features(pool, args.seed)
+            baseline = None
+            print(f"\n== {pool:,} candidates")
+            for workers in (int(w) for w in args.workers.split(',')):
+                result = bench_workers(features, jobs, workers, args.top_n, args.chunk_rows, directory)
+                baseline = baseline or result["perSecond"]
+                result.update(pool=pool, speedup=result["perSecond"] / baseline if baseline else 0.0)
+                results.append(result)
+                print(
+                    f"  {workers:>3} workers: p50 {result['latency']['p50Ms']:9.2f} ms  "
+                    f"p95 {result['latency']['p95Ms']:9.2f} ms  {result['perSecond']:8.1f}/s  "
+                    f"x{result['speedup']:.2f}"
+                )
+
+            batch = bench_batch(features, jobs, args.top_n, args.chunk_rows)
+            results.append({"pool": pool, "batch": batch})
+            print(
+                f"  batch of {batch['jobs']} jobs: {batch['batch']['p50Ms']:9.2f} ms vs "
+                f"{batch['sequential']['p50Ms']:9.2f} ms one by one  x{batch['speedup']:.2f}"
+            )
+
+    write_results(args.output, "match", vars(args), results)
+
+
+if __name__ == '__main__':
+    main()
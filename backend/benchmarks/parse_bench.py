@@ -0,0 +1,127 @@
+"""
+Resume parsing benchmark
+
+Measures ResumeParser throughput, latency percentiles per stage (text
+extraction, tokenizing, each extractor) and peak memory over a synthetic
+corpus, and writes the numbers to a JSON file for comparison between
+commits.
+
+Run from backend/:
+    python -m benchmarks.parse_bench --count 50 --output benchmarks/results/parse.json
+"""
+import argparse
+import gc
+import io
+import time
+import tracemalloc
+from typing import Dict, List
+from app.services.resume_document import ResumeDocument
+from app.services.resume_parser import ResumeParser
+from benchmarks.common import format_mb, max_rss_mb, percentiles, write_results
+from benchmarks.corpus import SIZES, generate
+
+
+EXTRACTORS = [
+    'extract_name',
+    'extract_email',
+    'extract_phone',
+    'extract_skills',
+    'extract_experience',
+    'extract_education',
+    'extract_summary',
+]
+
+
+def bench_stages(parser: ResumeParser, corpus, fmt: str) -> Dict[str, dict]:
+    """Latency of every parse stage, timed separately per document"""
+    timings: Dict[str, List[float]] = {'extract_text': [], 'tokenize': []}
+    timings.update({name: [] for name in EXTRACTORS})
+    extract_text = parser.parse_pdf if fmt == 'pdf' else parser.parse_docx
+
+    for _, content in corpus:
+        began = time.perf_counter()
+        text = extract_text(io.BytesIO(content))
+        timings['extract_text'].append(time.perf_counter() - began)
+
+        began = time.perf_counter()
+        document = ResumeDocument(text)
+        timings['tokenize'].append(time.perf_counter() - began)
+
+        for name in EXTRACTORS:
+            began = time.perf_counter()
+            getattr(parser, name)(document)
+            timings[name].append(time.perf_counter() - began)
+
+    return {stage: percentiles(samples) for stage, samples in timings.items()}
+
+
+def bench_end_to_end(parser: ResumeParser, corpus) -> dict:
+    """Whole parse_resume calls: latency and throughput"""
+    samples = []
+    began = time.perf_counter()
+    for filename, content in corpus:
+        start = time.perf_counter()
+        parser.parse_resume(io.BytesIO(content), filename)
+        samples.append(time.perf_counter() - start)
+    elapsed = time.perf_counter() - began
+    return {
+        "latency": percentiles(samples),
+        "docsPerSecond": len(corpus) / elapsed if elapsed else 0.0,
+        "mbPerSecond": sum(len(c) for _, c in corpus) / (1024 * 1024) / elapsed if elapsed else 0.0,
+    }
+
+
+def bench_memory(parser: ResumeParser, corpus) -> float:
+    """Peak traced Python allocation (MB) while parsing the corpus once"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        for filename, content in corpus:
+            parser.parse_resume(io.BytesIO(content), filename)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / (1024 * 1024)
+
+
+def main():
+    """Run the benchmark matrix"""
+    arg_parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    arg_parser.add_argument('--count', type=int, default=50, help="Resumes per format and size")
+    arg_parser.add_argument('--sizes', default=','.join(SIZES), help="Comma-separated sizes")
+    arg_parser.add_argument('--formats', default='pdf,docx', help="Comma-separated formats")
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--output', default='benchmarks/results/parse.json')
+    args = arg_parser.parse_args()
+
+    parser = ResumeParser()
+    results = []
+    for fmt in args.formats.split(','):
+        for size in args.sizes.split(','):
+            corpus = generate(args.count, size, fmt, args.seed)
+            parser.parse_resume(io.BytesIO(corpus[0][1]), corpus[0][0])  # Warm up
+
+            end_to_end = bench_end_to_end(parser, corpus)
+            result = {
+                "format": fmt,
+                "size": size,
+                "docs": len(corpus),
+                "meanBytes": sum(len(c) for _, c in corpus) / len(corpus),
+                **end_to_end,
+                "stages": bench_stages(parser, corpus, fmt),
+                "peakTracedMb": bench_memory(parser, corpus),
+            }
+            results.append(result)
+            print(
+                f"{fmt:>4} {size:>6}: {end_to_end['docsPerSecond']:8.1f} docs/s  "
+                f"p50 {end_to_end['latency']['p50Ms']:7.2f} ms  "
+                f"p99 {end_to_end['latency']['p99Ms']:7.2f} ms  "
+                f"peak {result['peakTracedMb']:6.1f} MB"
+            )
+
+    write_results(args.output, "parse", vars(args), results)
+    print(f"Max RSS: {format_mb(max_rss_mb())}")
+
+
+if __name__ == '__main__':
+    main()
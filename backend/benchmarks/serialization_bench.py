@@ -0,0 +1,115 @@
+"""
+JSON serialization benchmark
+
+Compares the previous encoding path (model_dump() into dicts, then the
+stdlib json module, indented on disk) with app.utils.serialization
+(pydantic straight to JSON bytes, compact on disk) for candidate list
+responses, match responses and snapshot reads/writes.
+
+Run from backend/:
+    python -m benchmarks.serialization_bench --counts 1000,10000,100000
+"""
+import argparse
+import json
+import time
+from typing import Callable, List
+from app.models.candidate import Candidate
+from app.models.job import MatchResult
+from app.utils import serialization
+from benchmarks.common import percentiles, write_results
+from benchmarks.corpus import make_candidates
+
+
+def _measure(fn: Callable[[], object], repeat: int) -> dict:
+    """Latency percentiles of `repeat` calls"""
+    samples = []
+    for _ in range(repeat):
+        began = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - began)
+    return percentiles(samples)
+
+
+def _match_results(candidates: List[Candidate]) -> List[MatchResult]:
+    """Match results shaped like /api/match output"""
+    return [
+        MatchResult(
+            candidate=c.model_dump(),
+            matchScore=80.0,
+            matchedSkills=c.skills[:3],
+            missingSkills=[],
+            reasoning="Strong skill overlap"
+        )
+        for c in candidates
+    ]
+
+
+def bench_count(count: int, repeat: int, seed: int) -> dict:
+    """Before/after timings for one pool size"""
+    candidates = list(make_candidates(count, seed))
+    matches = _match_results(candidates[:100])
+    snapshot_before = json.dumps([c.model_dump() for c in candidates], indent=2)
+    snapshot_after = serialization.dump_candidates(candidates)
+
+    cases = {
+        "candidates response": (
+            lambda: json.dumps({"success": True, "data": [c.model_dump() for c in candidates]}).encode(),
+            lambda: serialization.envelope(serialization.dump_candidates(candidates)).body,
+        ),
+        "match response (100)": (
+            lambda: json.dumps({"success": True, "data": [m.model_dump() for m in matches]}).encode(),
+            lambda: serialization.envelope(serialization.dump_match_results(matches)).body,
+        ),
+        "snapshot write": (
+            lambda: json.dumps([c.model_dump() for c in candidates], indent=2).encode(),
+            lambda: serialization.dump_candidates(candidates),
+        ),
+        "snapshot read": (
+            lambda: [Candidate(**record) for record in json.loads(snapshot_before)],
+            lambda: serialization.candidate_list.validate_json(snapshot_after),
+        ),
+    }
+
+    result = {
+        "count": count,
+        "snapshotBytesBefore": len(snapshot_before.encode()),
+        "snapshotBytesAfter": len(snapshot_after),
+    }
+    for name, (before, after) in cases.items():
+        result[name] = {"before": _measure(before, repeat), "after": _measure(after, repeat)}
+    return result
+
+
+def _print_result(result: dict):
+    """One line per case with the p50 speedup"""
+    print(
+        f"\n== {result['count']:,} candidates (snapshot {result['snapshotBytesBefore'] / 1e6:.1f} MB -> "
+        f"{result['snapshotBytesAfter'] / 1e6:.1f} MB)"
+    )
+    for name, stats in result.items():
+        if isinstance(stats, dict):
+            before, after = stats['before']['p50Ms'], stats['after']['p50Ms']
+            print(f"  {name:<22} before {before:9.2f} ms  after {after:9.2f} ms  x{before / after if after else 0:5.1f}")
+
+
+def main():
+    """Run every pool size and write the results file"""
+    arg_parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    arg_parser.add_argument('--counts', default='1000,10000', help="Comma-separated pool sizes")
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--output', default='benchmarks/results/serialization.json')
+    args = arg_parser.parse_args()
+
+    print(f"Serializer backend: {serialization.BACKEND}")
+    results = []
+    for count in (int(c) for c in args.counts.split(',')):
+        result = bench_count(count, args.repeat, args.seed)
+        _print_result(result)
+        results.append(result)
+
+    write_results(args.output, "serialization", {**vars(args), "backend": serialization.BACKEND}, results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,225 @@
+"""
+Matching and store scalability benchmark
+
+Seeds a fresh store with synthetic candidates at each scale point and
+reports latency percentiles, throughput and RSS for AIMatcher and the
+/api/match, /api/candidates, /search and /stats routes (driven in-process
+through FastAPI's test client).
+
+Every scale point runs in its own subprocess with its own data directory,
+so module-level singletons (store, caches, indexes) start empty and RSS is
+not inherited from the previous point.
+
+Run from backend/:
+    python -m benchmarks.store_bench --scales 1000,10000,100000 --backend json
+    python -m benchmarks.store_bench --full --backend sqlite --requests 20
+
+--full adds the 1M point, which runs for tens of minutes. The json
+backend keeps every record in memory, so that point needs more than
+6 GB of free RAM.
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, List
+from benchmarks.common import current_rss_mb, format_mb, percentiles, write_results
+
+RESULT_PREFIX = "BENCH_RESULT "
+SEED_BATCH = 10000
+DEFAULT_SCALES = '1000,10000,100000'
+FULL_SCALES = DEFAULT_SCALES + ',1000000'
+
+
+def _measure(fn: Callable[[int], None], requests: int) -> dict:
+    """Call fn(i) `requests` times; latency percentiles and throughput"""
+    samples = []
+    began = time.perf_counter()
+    for i in range(requests):
+        start = time.perf_counter()
+        fn(i)
+        samples.append(time.perf_counter() - start)
+    elapsed = time.perf_counter() - began
+    return {**percentiles(samples), "perSecond": requests / elapsed if elapsed else 0.0}
+
+
+def _peak_traced_mb(fn: Callable[[], object]) -> float:
+    """Peak traced Python allocation (MB) during one call"""
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / (1024 * 1024)
+
+
+def run_scale(scale: int, requests: int, list_requests: int, seed: int) -> dict:
+    """Seed `scale` candidates and measure (runs inside the worker process)"""
+    # The app creates its singletons on import, so only import it here
+    from fastapi.testclient import TestClient
+    from app.database import db
+    from app.main import app
+    from app.models.job import JobDescription
+    from app.services.ai_matcher import ai_matcher
+    from app.services.skill_taxonomy import DEFAULT_TAXONOMY
+    from benchmarks.corpus import make_candidates
+
+    began = time.perf_counter()
+    for start in range(0, scale, SEED_BATCH):
+        db.add_candidates(list(make_candidates(min(SEED_BATCH, scale - start), seed, start)))
+    seed_seconds = time.perf_counter() - began
+    rss_after_seed = current_rss_mb()
+
+    rng = random.Random(seed)
+    skills = list(DEFAULT_TAXONOMY)
+    jobs = [
+        {
+            "title": "Backend Engineer",
+            "description": "Build and operate APIs",
+            "requirements": [],
+            "skills": rng.sample(skills, 5),
+            "experience": f"{rng.randint(1, 10)}+ years",
+        }
+        for _ in range(requests)
+    ]
+    client = TestClient(app)
+
+    def check(response):
+        if response.status_code != 200:
+            raise RuntimeError(f"{response.request.url} returned {response.status_code}")
+
+    results = {
+        "scale": scale,
+        "seedSeconds": seed_seconds,
+        "rssAfterSeedMb": rss_after_seed,
+        "get_all_candidates": _measure(lambda i: db.get_all_candidates(), list_requests),
+    }
+
+    candidates = db.get_all_candidates()
+    results["AIMatcher.match_candidates"] = _measure(
+        lambda i: ai_matcher.match_candidates(candidates, JobDescription(**jobs[i]), 10),
+        min(requests, list_requests)
+    )
+    del candidates
+
+    # Streaming from the store keeps one page plus the top N in memory
+    results["AIMatcher.match_store"] = _measure(
+        lambda i: ai_matcher.match_store(db, JobDescription(**jobs[i]), 10),
+        min(requests, list_requests)
+    )
+    results["matchStorePeakMb"] = _peak_traced_mb(lambda: ai_matcher.match_store(db, JobDescription(**jobs[0]), 10))
+
+    results["POST /api/match (cold)"] = _measure(
+        lambda i: check(client.post("/api/match", json={"jobDescription": jobs[i], "topN": 10})),
+        requests
+    )
+    results["POST /api/match (cached)"] = _measure(
+        lambda i: check(client.post("/api/match", json={"jobDescription": jobs[0], "topN": 10})),
+        requests
+    )
+    results["GET /api/candidates"] = _measure(
+        lambda i: check(client.get("/api/candidates")),
+        list_requests
+    )
+    queries = ["python", "kubernetes", "jane", "smith", "machine learning"]
+    results["GET /api/candidates/search"] = _measure(
+        lambda i: check(client.get("/api/candidates/search", params={"q": queries[i % len(queries)], "limit": 20})),
+        requests
+    )
+    results["GET /api/candidates/stats"] = _measure(
+        lambda i: check(client.get("/api/candidates/stats")),
+        requests
+    )
+    results["rssMb"] = current_rss_mb()
+    return results
+
+
+def run_worker(args):
+    """Entry point of one scale-point subprocess"""
+    result = run_scale(args.worker_scale, args.requests, args.list_requests, args.seed)
+    print(RESULT_PREFIX + json.dumps(result), flush=True)
+
+
+def run_scale_subprocess(scale: int, args) -> dict:
+    """Run one scale point in a fresh interpreter with its own data dir"""
+    with tempfile.TemporaryDirectory(prefix="recrutix-bench-") as data_dir:
+        env = dict(
+            os.environ,
+            MOCK_DB_PATH=os.path.join(data_dir, "candidates.json"),
+            MATCH_FEATURES_PATH=os.path.join(data_dir, "match_features.npz"),
+            EMBEDDINGS_PATH=os.path.join(data_dir, "embeddings"),
+            PARSE_CACHE_PATH=os.path.join(data_dir, "parse_cache.json"),
+            MATCH_SHARD_DIR=os.path.join(data_dir, "match_shards"),
+            PROFILE_DIR=os.path.join(data_dir, "profiles"),
+            UPLOAD_DIR=os.path.join(data_dir, "uploads"),
+            DATABASE_URL=f"sqlite:///{os.path.join(data_dir, 'bench.db')}" if args.backend == "sqlite" else "",
+        )
+        completed = subprocess.run(
+            [
+                sys.executable, "-m", "benchmarks.store_bench",
+                "--worker-scale", str(scale),
+                "--requests", str(args.requests),
+                "--list-requests", str(args.list_requests),
+                "--seed", str(args.seed),
+            ],
+            env=env, capture_output=True, text=True
+        )
+
+    for line in completed.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX):])
+    raise RuntimeError(
+        f"Scale {scale} failed (exit status {completed.returncode}; negative means killed by "
+        f"that signal, e.g. -9 when out of memory):\n{completed.stderr[-4000:]}"
+    )
+
+
+def _print_result(result: dict):
+    """One line per measured operation"""
+    print(f"\n== {result['scale']:,} candidates (seeded in {result['seedSeconds']:.1f}s, RSS {format_mb(result['rssMb'])})")
+    for name, stats in result.items():
+        if isinstance(stats, dict):
+            print(
+                f"  {name:<30} p50 {stats['p50Ms']:9.2f} ms  p95 {stats['p95Ms']:9.2f} ms  "
+                f"p99 {stats['p99Ms']:9.2f} ms  {stats['perSecond']:9.1f}/s"
+            )
+
+
+def main():
+    """Run every scale point and write the results file"""
+    arg_parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    arg_parser.add_argument('--scales', default=DEFAULT_SCALES, help="Comma-separated pool sizes")
+    arg_parser.add_argument('--full', action='store_true', help=f"Run every scale up to 1M ({FULL_SCALES})")
+    arg_parser.add_argument('--backend', choices=['json', 'sqlite'], default='json')
+    arg_parser.add_argument('--requests', type=int, default=50, help="Requests per cheap operation")
+    arg_parser.add_argument('--list-requests', type=int, default=5, help="Requests per full-pool operation")
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--output', default='benchmarks/results/store.json')
+    arg_parser.add_argument('--worker-scale', type=int, help=argparse.SUPPRESS)
+    args = arg_parser.parse_args()
+
+    if args.worker_scale is not None:
+        run_worker(args)
+        return
+
+    if args.full:
+        args.scales = FULL_SCALES
+
+    results: List[dict] = []
+    for scale in (int(s) for s in args.scales.split(',')):
+        result = run_scale_subprocess(scale, args)
+        _print_result(result)
+        results.append(result)
+
+    config = {k: v for k, v in vars(args).items() if k != 'worker_scale'}
+    write_results(args.output, "store", config, results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,17 @@
+import os
+import tempfile
+
+# Point every writable path at a scratch directory before the app (and its
+# module-level stores and caches) is imported
+_data_dir = tempfile.mkdtemp(prefix="recrutix-tests-")
+for name, value in {
+    "DATABASE_URL": "",
+    "MOCK_DB_PATH": "candidates.json",
+    "PARSE_CACHE_PATH": "parse_cache.json",
+    "MATCH_FEATURES_PATH": "match_features.npz",
+    "EMBEDDINGS_PATH": "embeddings",
+    "MATCH_SHARD_DIR": "match_shards",
+    "PROFILE_DIR": "profiles",
+    "UPLOAD_DIR": "uploads",
+}.items():
+    os.environ[name] = os.path.join(_data_dir, value) if value else value
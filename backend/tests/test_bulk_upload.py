@@ -0,0 +1,116 @@
+import io
+import zipfile
+import docx
+import pytest
+from fastapi.testclient import TestClient
+from app.config import settings
+from app.database import db
+from app.main import app
+from app.services.ingest_queue import ingest_queue
+
+
+def make_docx(name: str, email: str) -> bytes:
+    document = docx.Document()
+    for line in [name, email, "Skills: Python, SQL", "Experience", "Engineer at Acme"]:
+        document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def make_zip(entries: dict) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, content in entries.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def client():
+    before = set(db.get_candidate_ids())
+    yield TestClient(app)
+    for candidate_id in set(db.get_candidate_ids()) - before:
+        db.delete_candidate(candidate_id)
+
+
+def upload(client, *files):
+    response = client.post(
+        "/api/upload/bulk",
+        files=[("files", (name, content, "application/octet-stream")) for name, content in files]
+    )
+    assert response.status_code == 200, response.text
+    return response.json()["data"]
+
+
+def by_file(data) -> dict:
+    return {item["filename"]: item for item in data["results"]}
+
+
+def test_multi_file_form_stores_resumes_in_one_batch(client):
+    data = upload(
+        client,
+        ("first.docx", make_docx("Bulk First", "bulk.first@example.com")),
+        ("second.docx", make_docx("Bulk Second", "bulk.second@example.com")),
+        ("notes.txt", b"not a resume"),
+    )
+    assert (data["total"], data["stored"], data["skipped"]) == (3, 2, 1)
+    results = by_file(data)
+    stored = db.get_candidate_by_id(results["first.docx"]["candidateId"])
+    assert stored.email == "bulk.first@example.com"
+    assert results["notes.txt"]["error"] == "Unsupported file type"
+
+
+def test_zip_entries_are_parsed_and_repeats_reported_as_duplicates(client):
+    resume = make_docx("Zip Person", "zip.person@example.com")
+    archive = make_zip({
+        "team/a.docx": resume,
+        "team/copy.docx": resume,
+        "team/b.docx": make_docx("Zip Other", "zip.other@example.com"),
+        "team/readme.md": b"# resumes",
+    })
+    data = upload(client, ("team.zip", archive))
+    results = by_file(data)
+    assert (data["stored"], data["duplicate"], data["skipped"]) == (2, 1, 1)
+    assert results["team.zip/team/copy.docx"]["candidateId"] == results["team.zip/team/a.docx"]["candidateId"]
+
+    # Uploading the same files again creates nothing new
+    again = upload(client, ("a.docx", resume))
+    assert again["duplicate"] == 1
+    assert by_file(again)["a.docx"]["candidateId"] == results["team.zip/team/a.docx"]["candidateId"]
+
+
+def test_bad_archive_and_oversized_entries_fail_per_file(client, monkeypatch):
+    monkeypatch.setattr(settings, "MAX_UPLOAD_SIZE", 64)
+    data = upload(
+        client,
+        ("broken.zip", b"PK not really a zip"),
+        ("big.zip", make_zip({"big.docx": b"x" * 65})),
+        ("big.docx", b"x" * 65),
+    )
+    results = by_file(data)
+    assert results["broken.zip"]["error"] == "Invalid ZIP archive"
+    assert results["big.zip/big.docx"]["error"] == "File too large"
+    assert results["big.docx"]["error"] == "File too large"
+    assert data["failed"] == 3
+
+
+def test_file_limit_skips_the_rest(client, monkeypatch):
+    monkeypatch.setattr(settings, "BULK_UPLOAD_MAX_FILES", 1)
+    data = upload(
+        client,
+        ("one.docx", make_docx("Limit One", "limit.one@example.com")),
+        ("two.docx", make_docx("Limit Two", "limit.two@example.com")),
+    )
+    assert by_file(data)["two.docx"]["error"] == "Bulk upload file limit reached"
+    assert (data["stored"], data["skipped"]) == (1, 1)
+
+
+def test_no_free_capacity_answers_429(client, monkeypatch):
+    monkeypatch.setattr(ingest_queue, "max_pending", 0)
+    response = client.post(
+        "/api/upload/bulk",
+        files=[("files", ("a.docx", make_docx("Full", "full@example.com"), "application/octet-stream"))]
+    )
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "5"
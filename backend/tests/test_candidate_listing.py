@@ -0,0 +1,82 @@
+import json
+import pytest
+from fastapi.testclient import TestClient
+from app.config import settings
+from app.database.mock_db import MockDatabase
+from app.database.sqlite_db import SQLiteDatabase
+from app.main import app
+from app.models.candidate import Candidate
+from app.routes import candidates as candidate_routes
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def client(request, tmp_path, monkeypatch):
+    if request.param == "json":
+        monkeypatch.setattr(settings, "MOCK_DB_PATH", str(tmp_path / "candidates.json"))
+        store = MockDatabase()
+    else:
+        store = SQLiteDatabase(str(tmp_path / "candidates.db"))
+    store.add_candidates([
+        Candidate(id=f"c{i}", name=f"Candidate {i}", email=f"c{i}@example.com", skills=["Python"], matchScore=i / 10)
+        for i in range(5)
+    ])
+    monkeypatch.setattr(candidate_routes, "db", store)
+    return TestClient(app)
+
+
+def ids(response) -> list:
+    assert response.status_code == 200, response.text
+    return [c["id"] for c in response.json()["data"]]
+
+
+def test_without_paging_returns_the_whole_pool(client):
+    response = client.get("/api/candidates")
+    assert ids(response) == ["c0", "c1", "c2", "c3", "c4"]
+    assert "nextCursor" not in response.json()
+
+
+def test_cursor_pages_through_the_pool(client):
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2}
+        if cursor is not None:
+            params["cursor"] = cursor
+        response = client.get("/api/candidates", params=params)
+        seen += ids(response)
+        cursor = response.json()["nextCursor"]
+        if cursor is None:
+            break
+    assert seen == ["c0", "c1", "c2", "c3", "c4"]
+
+
+@pytest.mark.parametrize("cursor", ["abc", "-1", "1e3"])
+def test_bad_cursor_is_400(client, cursor):
+    response = client.get("/api/candidates", params={"cursor": cursor, "limit": 2})
+    assert response.status_code == 400
+    assert "Invalid cursor" in response.json()["detail"]
+    assert client.get("/api/candidates", params={"cursor": cursor, "format": "ndjson"}).status_code == 400
+
+
+def test_fields_project_each_candidate(client):
+    response = client.get("/api/candidates", params={"fields": "name, matchScore", "limit": 1})
+    assert response.json()["data"] == [{"id": "c0", "name": "Candidate 0", "matchScore": 0.0}]
+
+
+def test_unknown_fields_are_400(client):
+    response = client.get("/api/candidates", params={"fields": "name,password"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Unknown fields: password"
+
+
+def test_ndjson_streams_every_candidate_after_the_cursor(client, monkeypatch):
+    monkeypatch.setattr(candidate_routes, "EXPORT_BATCH_SIZE", 2)
+    _, cursor = candidate_routes.db.get_candidates_page(None, 1)
+    response = client.get("/api/candidates", params={"format": "ndjson", "cursor": cursor, "fields": "email"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines == [{"id": f"c{i}", "email": f"c{i}@example.com"} for i in range(1, 5)]
+
+
+def test_unknown_format_is_rejected(client):
+    assert client.get("/api/candidates", params={"format": "xml"}).status_code == 422
@@ -0,0 +1,96 @@
+import threading
+import time
+import numpy as np
+import pytest
+from app.config import settings
+from app.database.mock_db import MockDatabase
+from app.database.sqlite_db import SQLiteDatabase
+from app.models.candidate import Candidate, ExperienceItem
+from app.services.feature_cache import MatchFeatureCache
+
+
+def test_reload_rederives_records_updated_under_the_same_id(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "MOCK_DB_PATH", str(tmp_path / "candidates.json"))
+    db = MockDatabase()
+    db.add_candidate(Candidate(id="c1", name="Ada", email="ada@example.com", skills=["Python"]))
+    cache = MatchFeatureCache(db, str(tmp_path / "features.npz"))
+
+    # Another process rewrites the same id with new skills and experience
+    other = MockDatabase()
+    other.add_candidate(Candidate(
+        id="c1",
+        name="Ada",
+        email="ada@example.com",
+        skills=["Rust", "Go"],
+        experience=[ExperienceItem(company="Acme", position="Engineer", duration="2y")]
+    ))
+    db.refresh()
+
+    features = cache.snapshot()
+    assert features.count_alive() == 1
+    row = features.ids.index("c1")
+    skills = {features.vocab[i] for i in features.indices[features.indptr[row]:features.indptr[row + 1]]}
+    assert features.alive[row]
+    assert skills == {"rust", "go"}
+    assert features.exp_years[row] > 0
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def open_store(request, tmp_path, monkeypatch):
+    """Factory for store instances over the same files (one per 'process')"""
+    monkeypatch.setattr(settings, "MOCK_DB_PATH", str(tmp_path / "candidates.json"))
+    if request.param == "json":
+        return MockDatabase
+    return lambda: SQLiteDatabase(str(tmp_path / "candidates.db"))
+
+
+def skills_of(features, candidate_id):
+    row = features.ids.index(candidate_id)
+    return {features.vocab[i] for i in features.indices[features.indptr[row]:features.indptr[row + 1]]}
+
+
+def test_restart_rebuilds_when_the_store_changed_while_down(open_store, tmp_path):
+    path = str(tmp_path / "features.npz")
+    store = open_store()
+    store.add_candidate(Candidate(id="c1", name="Ada", email="ada@example.com", skills=["Python"]))
+    MatchFeatureCache(store, path).save()
+
+    # Another process edits the record under the same id
+    open_store().add_candidate(Candidate(id="c1", name="Ada", email="ada@example.com", skills=["Rust"]))
+
+    restarted = MatchFeatureCache(open_store(), path)
+    assert skills_of(restarted.snapshot(), "c1") == {"rust"}
+
+
+def test_restart_reuses_features_saved_for_the_same_content(open_store, tmp_path, monkeypatch):
+    path = str(tmp_path / "features.npz")
+    store = open_store()
+    cache = MatchFeatureCache(store, path)
+    store.add_candidate(Candidate(id="c1", name="Ada", email="ada@example.com", skills=["Python"]))
+    store.delete_candidate("c1")
+    store.add_candidate(Candidate(id="c2", name="Bob", email="bob@example.com", skills=["Go"]))
+    cache.save()
+
+    def fail():
+        raise AssertionError("features were rebuilt")
+
+    monkeypatch.setattr(MatchFeatureCache, "rebuild", lambda self: fail())
+    restarted = MatchFeatureCache(open_store(), path)
+    assert skills_of(restarted.snapshot(), "c2") == {"go"}
+
+
+def test_periodic_save_runs_off_the_writer_thread(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "MOCK_DB_PATH", str(tmp_path / "candidates.json"))
+    monkeypatch.setattr(settings, "MATCH_FEATURES_SAVE_EVERY", 1)
+    store = MockDatabase()
+    cache = MatchFeatureCache(store, str(tmp_path / "features.npz"))
+    writer = threading.current_thread()
+    saved_on = []
+    monkeypatch.setattr(np, "savez", lambda f, **arrays: saved_on.append(threading.current_thread()))
+
+    store.add_candidate(Candidate(id="c1", name="Ada", email="ada@example.com", skills=["Python"]))
+    deadline = time.monotonic() + 5
+    while not saved_on and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert saved_on and writer not in saved_on
+    assert cache.snapshot().count_alive() == 1
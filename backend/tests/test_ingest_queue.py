@@ -0,0 +1,81 @@
+import io
+import time
+import docx
+import pytest
+from fastapi.testclient import TestClient
+from app.database.sqlite_db import SQLiteDatabase
+from app.main import app
+from app.services.ingest_queue import IngestQueue, QueueFullError, ingest_queue
+from app.services.parse_cache import ResumeParseCache
+
+
+def make_docx(name: str = "Ada Lovelace", email: str = "ada@example.com") -> bytes:
+    document = docx.Document()
+    for line in [name, email, "Skills: Python, SQL, Docker", "Experience", "Engineer at Acme"]:
+        document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def wait_for(job, timeout: float = 60.0):
+    deadline = time.monotonic() + timeout
+    while job.finishedAt is None and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return job
+
+
+@pytest.fixture
+def queue(tmp_path):
+    store = SQLiteDatabase(str(tmp_path / "candidates.db"))
+    cache = ResumeParseCache(store, str(tmp_path / "parse_cache.json"), 100)
+    ingest = IngestQueue(store, cache, workers=1, max_pending=2, history=10)
+    yield ingest
+    ingest.shutdown()
+
+
+def test_submitted_resume_is_parsed_and_stored(queue):
+    job = queue.submit(make_docx(), "ada.docx")
+    assert job.to_dict()["status"] in ("queued", "parsing")
+    assert queue.get(job.id) is job
+
+    wait_for(job)
+    status = job.to_dict()
+    assert status["status"] == "done", status["error"]
+    assert status["progress"] == 1.0
+    assert status["candidate"]["email"] == "ada@example.com"
+    assert queue.store.get_candidate_by_id(status["candidateId"]) is not None
+    assert queue.stats()["pending"] == 0
+    assert queue.stats()["parsing"]["files"] == 1
+
+
+def test_identical_file_in_flight_shares_the_job(queue):
+    content = make_docx()
+    first = queue.submit(content, "a.docx")
+    assert queue.submit(content, "b.docx") is first
+    wait_for(first)
+    assert len(queue.store.get_candidate_ids()) == 1
+
+
+def test_submit_beyond_capacity_raises(queue):
+    queue._pending = queue.max_pending
+    with pytest.raises(QueueFullError):
+        queue.submit(make_docx(), "ada.docx")
+    with pytest.raises(QueueFullError):
+        list(queue.parse_many([("ada.docx", make_docx())]))
+    queue._pending = 0
+
+
+def test_full_queue_answers_429(monkeypatch):
+    monkeypatch.setattr(ingest_queue, "max_pending", 0)
+    response = TestClient(app).post(
+        "/api/upload",
+        files={"file": ("ada.docx", make_docx(), "application/octet-stream")}
+    )
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "5"
+    assert "full" in response.json()["detail"]
+
+
+def test_unknown_job_is_404():
+    assert TestClient(app).get("/api/upload/jobs/missing").status_code == 404
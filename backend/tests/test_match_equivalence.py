@@ -0,0 +1,120 @@
+import random
+import numpy as np
+import pytest
+from app.models.candidate import Candidate, ExperienceItem
+from app.models.job import JobDescription
+from app.services.ai_matcher import AIMatcher
+from app.services.match_scoring import (
+    EXPERIENCE_WEIGHT,
+    SKILL_WEIGHT,
+    CandidateFeatures,
+    deterministic_jitter,
+    stable_hash,
+)
+from app.services.parallel_matcher import ShardedMatcher
+
+
+SKILLS = ["Python", "python3", "Java", "JavaScript", "React", "React Native", "SQL", "MySQL", "Go", "Docker", "AWS"]
+TOP_N = 15
+
+JOBS = [
+    JobDescription(title="Backend", description="", skills=["Python", "SQL", "Docker"], experience="5+ years"),
+    JobDescription(title="Frontend", description="", skills=["JavaScript", "React"], experience="2-4 years"),
+    JobDescription(title="Generalist", description="", skills=[], experience="any"),
+    JobDescription(title="JVM", description="", skills=["Java", "AWS", "Go", "MySQL"], experience="8 years"),
+]
+
+
+@pytest.fixture(scope="module")
+def pool():
+    rng = random.Random(7)
+    candidates = [
+        Candidate(
+            id=f"c{i:04d}",
+            name=f"Candidate {i}",
+            email=f"c{i}@example.com",
+            skills=[s if rng.random() < 0.5 else s.upper() for s in rng.sample(SKILLS, rng.randint(0, 5))],
+            experience=[
+                ExperienceItem(company="Acme", position="Engineer", duration="2y")
+                for _ in range(rng.randint(0, 5))
+            ]
+        )
+        for i in range(300)
+    ]
+    alive = np.array([i % 11 != 3 for i in range(len(candidates))])
+    features = CandidateFeatures.from_candidates(candidates)
+    features.alive = alive
+    return candidates, features
+
+
+def scalar_ranking(candidates, alive, job, top_n):
+    """One candidate at a time with AIMatcher's scalar helpers"""
+    matcher = AIMatcher(parallel=None)
+    job_hash = AIMatcher._job_hash(job)
+    scored = []
+    for position, candidate in enumerate(candidates):
+        if not alive[position]:
+            continue
+        skill_score, matched, missing = matcher.calculate_skill_match(candidate.skills, job.skills)
+        score = (
+            skill_score * SKILL_WEIGHT
+            + matcher.calculate_experience_match(candidate, job.experience) * EXPERIENCE_WEIGHT
+        )
+        jitter = deterministic_jitter(np.asarray([stable_hash(candidate.id)], dtype=np.uint64), job_hash)[0]
+        score = float(np.round(min(1.0, score + jitter), 2))
+        scored.append((-score, position, (candidate.id, score, matched, missing)))
+    scored.sort(key=lambda entry: entry[:2])
+    return [entry[2] for entry in scored[:top_n]]
+
+
+def summarize(results):
+    return [
+        (result.candidate["id"], result.matchScore, result.matchedSkills, result.missingSkills)
+        for result in results
+    ]
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 7, 64, 100000])
+def test_match_features_matches_scalar_path(pool, chunk_rows):
+    candidates, features = pool
+    by_id = {c.id: c for c in candidates}
+    matcher = AIMatcher(chunk_rows=chunk_rows, parallel=None)
+    for job in JOBS:
+        expected = scalar_ranking(candidates, features.alive, job, TOP_N)
+        assert summarize(matcher.match_features(features, job, TOP_N, by_id.get)) == expected
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 13, 100000])
+def test_match_batch_matches_scalar_path(pool, chunk_rows):
+    candidates, features = pool
+    by_id = {c.id: c for c in candidates}
+    batched = AIMatcher(chunk_rows=chunk_rows, parallel=None).match_batch(features, JOBS, TOP_N, by_id.get)
+    for job, results in zip(JOBS, batched):
+        assert summarize(results) == scalar_ranking(candidates, features.alive, job, TOP_N)
+
+
+@pytest.mark.parametrize("batch_size", [1, 17, 1000])
+def test_streamed_matching_matches_scalar_path(pool, batch_size):
+    candidates, _ = pool
+    matcher = AIMatcher(batch_size=batch_size, parallel=None)
+    everyone = np.ones(len(candidates), dtype=bool)
+    for job in JOBS:
+        expected = scalar_ranking(candidates, everyone, job, TOP_N)
+        assert summarize(matcher.match_candidates(iter(candidates), job, TOP_N)) == expected
+
+
+def test_sharded_matching_matches_scalar_path(pool, tmp_path):
+    candidates, features = pool
+    by_id = {c.id: c for c in candidates}
+    sharded = ShardedMatcher(str(tmp_path), workers=3, min_rows=1, chunk_rows=16)
+    try:
+        sharded.publish(features)
+        matcher = AIMatcher(chunk_rows=16, parallel=sharded)
+        for job in JOBS:
+            expected = scalar_ranking(candidates, features.alive, job, TOP_N)
+            assert summarize(matcher.match_features(features, job, TOP_N, by_id.get)) == expected
+
+        for job, results in zip(JOBS, matcher.match_batch(features, JOBS, TOP_N, by_id.get)):
+            assert summarize(results) == scalar_ranking(candidates, features.alive, job, TOP_N)
+    finally:
+        sharded.shutdown()
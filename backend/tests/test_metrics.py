@@ -0,0 +1,70 @@
+import re
+from fastapi.testclient import TestClient
+from app.main import app
+from app.services.metrics import MetricsRegistry
+
+
+def sample(text: str, name: str, **labels) -> float:
+    """Value of one series in an exposition, 0 when absent"""
+    for line in text.splitlines():
+        match = re.fullmatch(rf"{name}\{{(.*)\}} (\S+)", line)
+        if match and all(f'{key}="{value}"' in match.group(1).split(",") for key, value in labels.items()):
+            return float(match.group(2))
+    return 0.0
+
+
+def test_requests_are_labelled_by_route_template():
+    client = TestClient(app)
+    before = client.get("/api/metrics").text
+    client.get("/api/candidates/metrics-a")
+    client.get("/api/candidates/metrics-b")
+    client.get("/no/such/path")
+    response = client.get("/api/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    assert "metrics-a" not in text and "/no/such/path" not in text
+
+    name = "recrutix_http_requests_total"
+    by_id = dict(method="GET", route="/api/candidates/{candidate_id}", status="404")
+    assert sample(text, name, **by_id) - sample(before, name, **by_id) == 2
+    unmatched = dict(method="GET", route="unmatched", status="404")
+    assert sample(text, name, **unmatched) - sample(before, name, **unmatched) == 1
+    assert sample(text, "recrutix_http_request_duration_seconds_count", method="GET", route="/api/metrics") >= 1
+
+
+def test_stage_and_size_metrics_are_recorded():
+    client = TestClient(app)
+    client.get("/api/candidates", params={"limit": 1})
+    text = client.get("/api/metrics").text
+    assert sample(text, "recrutix_stage_duration_seconds_count", stage="db_read") > 0
+    assert sample(text, "recrutix_stage_duration_seconds_count", stage="serialize") > 0
+    assert sample(text, "recrutix_http_response_size_bytes_count", method="GET", route="/api/candidates") > 0
+    assert "recrutix_http_requests_in_flight 1" in text  # The scrape itself
+
+
+def test_histograms_render_cumulative_buckets():
+    registry = MetricsRegistry(prefix="t")
+    registry.request_started()
+    registry.request_finished("GET", '/a"b', 200, 0.003, 0, 5000)
+    registry.request_finished("GET", '/a"b', 200, 20.0, 300, 100)
+    text = registry.render()
+
+    route = '/a\\"b'  # Quotes in label values are escaped
+    assert sample(text, "t_http_requests_total", route=route, status="200") == 2
+    assert sample(text, "t_http_request_duration_seconds_bucket", route=route, le="0.001") == 0
+    assert sample(text, "t_http_request_duration_seconds_bucket", route=route, le="0.005") == 1
+    assert sample(text, "t_http_request_duration_seconds_bucket", route=route, le="10") == 1
+    assert sample(text, "t_http_request_duration_seconds_bucket", route=route, le="+Inf") == 2
+    assert sample(text, "t_http_request_duration_seconds_sum", route=route) == 20.003
+    assert sample(text, "t_http_response_size_bytes_bucket", route=route, le="4096") == 1
+    assert "t_http_requests_in_flight -1" in text
+
+
+def test_disabled_registry_records_nothing():
+    registry = MetricsRegistry(prefix="off", enabled=False)
+    with registry.stage("score"):
+        pass
+    registry.timed("score")(lambda: None)()
+    assert "off_stage_duration_seconds_count" not in registry.render()
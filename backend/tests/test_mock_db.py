@@ -0,0 +1,91 @@
+import pytest
+from app.config import settings
+from app.database.mock_db import MockDatabase
+from app.models.candidate import Candidate
+
+
+def make_candidate(number: int) -> Candidate:
+    return Candidate(
+        id=f"c{number}",
+        name=f"Candidate {number}",
+        email=f"candidate{number}@example.com",
+        skills=["Python"],
+        uploadedAt="2026-01-15T10:00:00"
+    )
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    path = tmp_path / "candidates.json"
+    monkeypatch.setattr(settings, "MOCK_DB_PATH", str(path))
+    monkeypatch.setattr(settings, "MOCK_DB_COMPACT_THRESHOLD", 1000)
+    return path
+
+
+def test_wal_replay(db_path):
+    db = MockDatabase()
+    db.add_candidates([make_candidate(i) for i in range(3)])
+    db.delete_candidate("c1")
+    db.add_candidate(make_candidate(3))
+
+    reopened = MockDatabase()
+    assert reopened.get_candidate_ids() == ["c0", "c2", "c3"]
+    assert [c.id for c in reopened.get_candidates_by_email("CANDIDATE2@example.com")] == ["c2"]
+
+
+def test_torn_tail_is_dropped_and_cut_off(db_path):
+    db = MockDatabase()
+    db.add_candidates([make_candidate(0), make_candidate(1)])
+    with open(db.log_path, "ab") as f:
+        f.write(b'{"op":"add","candidate":{"id":"c9"')
+
+    reopened = MockDatabase()
+    assert reopened.get_candidate_ids() == ["c0", "c1"]
+    assert reopened.corrupt_log_entries == 0
+
+    # The next append must not be glued onto the partial line
+    reopened.add_candidate(make_candidate(2))
+    assert MockDatabase().get_candidate_ids() == ["c0", "c1", "c2"]
+
+
+def test_corrupt_line_in_the_middle_is_skipped(db_path):
+    db = MockDatabase()
+    db.add_candidate(make_candidate(0))
+    with open(db.log_path, "ab") as f:
+        f.write(b'{"op":"add","cand\n')
+    db.add_candidate(make_candidate(1))
+
+    reopened = MockDatabase()
+    assert reopened.get_candidate_ids() == ["c0", "c1"]
+    assert reopened.corrupt_log_entries == 1
+
+
+def test_replay_after_compaction(db_path):
+    db = MockDatabase()
+    db.add_candidates([make_candidate(i) for i in range(4)])
+    db.delete_candidate("c0")
+    db.compact()
+
+    with open(db.log_path, "rb") as f:
+        assert f.read() == b""
+    db.add_candidate(make_candidate(4))
+
+    reopened = MockDatabase()
+    assert reopened.get_candidate_ids() == ["c1", "c2", "c3", "c4"]
+
+
+def test_refresh_during_compaction_does_not_reload(db_path):
+    db = MockDatabase()
+    db.add_candidates([make_candidate(i) for i in range(3)])
+    version = db.version
+    write_db = db._write_db
+
+    def write_then_read(candidates):
+        path = write_db(candidates)
+        db.get_all_candidates()  # Lands between the snapshot write and the swap
+        return path
+
+    db._write_db = write_then_read
+    db.compact()
+    db.get_all_candidates()
+    assert db.version == version
@@ -0,0 +1,96 @@
+import os
+import shutil
+import time
+from app.models.candidate import Candidate
+from app.services.match_scoring import CandidateFeatures
+from app.services import parallel_matcher
+from app.services.parallel_matcher import ShardedMatcher
+
+
+def make_features(count: int) -> CandidateFeatures:
+    return CandidateFeatures.from_candidates([
+        Candidate(id=f"c{i}", name=f"Candidate {i}", email=f"c{i}@example.com", skills=["Python"])
+        for i in range(count)
+    ])
+
+
+class StubStore:
+    def __init__(self):
+        self.listeners = []
+
+    def add_listener(self, listener):
+        self.listeners.append(listener)
+
+
+def wait_until(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_pinned_generation_outlives_newer_publishes(tmp_path):
+    sharded = ShardedMatcher(str(tmp_path), workers=2, min_rows=1)
+    first = make_features(4)
+    old_path = sharded.publish(first)
+    pinned = sharded._acquire(first)
+    assert pinned == old_path
+
+    # Two newer generations while a request still scores the first one
+    middle_path = sharded.publish(make_features(5))
+    newest_path = sharded.publish(make_features(6))
+    assert os.path.isdir(old_path)
+    assert sharded._acquire(first) is None  # Superseded: callers score in-process
+    assert not os.path.exists(middle_path)  # Never pinned, deleted at once
+
+    sharded._release(pinned)
+    assert not os.path.exists(old_path)
+    assert os.listdir(tmp_path) == [os.path.basename(newest_path)]
+
+    sharded.shutdown()
+    assert os.listdir(tmp_path) == []
+
+
+def test_attach_clears_leftovers_and_publishes_in_background(tmp_path):
+    leftover = tmp_path / "0123abcd"
+    leftover.mkdir()
+    (leftover / "alive.npy").write_bytes(b"")
+
+    store = StubStore()
+    pools = [make_features(3)]
+    sharded = ShardedMatcher(str(tmp_path), workers=2, min_rows=1, publish_delay=0)
+    try:
+        sharded.attach(store, lambda: pools[-1])
+        assert not leftover.exists()
+        assert store.listeners == [sharded]
+        assert wait_until(lambda: sharded._acquire(pools[-1]) is not None)
+        sharded._release(sharded._current[1])
+
+        pools.append(make_features(4))
+        sharded.on_candidate_added(None)
+        assert wait_until(lambda: sharded._current is not None and sharded._current[0] is pools[-1])
+        assert wait_until(lambda: len(os.listdir(tmp_path)) == 1)
+    finally:
+        sharded.shutdown()
+    assert os.listdir(tmp_path) == []
+
+
+def test_generation_that_cannot_be_removed_is_retried_on_next_publish(tmp_path, monkeypatch):
+    sharded = ShardedMatcher(str(tmp_path), workers=2, min_rows=1)
+    locked_path = sharded.publish(make_features(3))
+
+    real_rmtree = shutil.rmtree
+
+    def refuse_once(path, *args, **kwargs):
+        monkeypatch.setattr(parallel_matcher.shutil, "rmtree", real_rmtree)
+        raise PermissionError("file is mapped by another process")
+
+    monkeypatch.setattr(parallel_matcher.shutil, "rmtree", refuse_once)
+    sharded.publish(make_features(4))
+    assert os.path.isdir(locked_path)  # Kept, not silently forgotten
+
+    newest_path = sharded.publish(make_features(5))
+    assert os.listdir(tmp_path) == [os.path.basename(newest_path)]
+    sharded.shutdown()
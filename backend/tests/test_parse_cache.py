@@ -0,0 +1,89 @@
+import pytest
+from fastapi.testclient import TestClient
+from app.database import db as app_db
+from app.database.sqlite_db import SQLiteDatabase
+from app.main import app
+from app.models.candidate import Candidate
+from app.services.ingest_queue import IngestQueue
+from app.services.parse_cache import ResumeParseCache, content_digest, parse_cache
+
+
+def make_candidate(number: int) -> Candidate:
+    return Candidate(id=f"c{number}", name=f"Candidate {number}", email=f"c{number}@example.com", skills=["Python"])
+
+
+@pytest.fixture
+def store(tmp_path):
+    db = SQLiteDatabase(str(tmp_path / "candidates.db"))
+    db.add_candidates([make_candidate(i) for i in range(3)])
+    return db
+
+
+def test_identical_content_resolves_to_the_stored_candidate(store, tmp_path):
+    cache = ResumeParseCache(store, str(tmp_path / "cache.json"), 10)
+    digest = content_digest(b"resume bytes")
+    assert digest == content_digest(b"resume bytes") != content_digest(b"resume bytes!")
+
+    assert cache.lookup(digest, 12) is None
+    cache.put(digest, "c1")
+    assert cache.lookup(digest, 12).id == "c1"
+    assert cache.stats() == {"entries": 1, "duplicates": 1, "parsed": 1, "hitRate": 0.5, "bytesSkipped": 12}
+
+
+def test_deleted_candidate_is_forgotten(store, tmp_path):
+    cache = ResumeParseCache(store, str(tmp_path / "cache.json"), 10)
+    cache.put("d1", "c1")
+    store.delete_candidate("c1")
+    assert cache.lookup("d1") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_least_recently_used_entries_are_evicted(store, tmp_path):
+    cache = ResumeParseCache(store, str(tmp_path / "cache.json"), 2)
+    cache.put("d0", "c0")
+    cache.put("d1", "c1")
+    cache.lookup("d0")
+    cache.put("d2", "c2")
+    assert cache.lookup("d1") is None
+    assert cache.lookup("d0") is not None and cache.lookup("d2") is not None
+
+
+def test_entries_persist_and_stale_ones_are_dropped_on_load(store, tmp_path):
+    path = str(tmp_path / "cache.json")
+    cache = ResumeParseCache(store, path, 10)
+    cache.put("d0", "c0")
+    cache.put("d2", "c2")
+    cache.save()
+
+    store.delete_candidate("c2")  # While the cache is not listening
+    reloaded = ResumeParseCache(store, path, 10)
+    assert reloaded.lookup("d0").id == "c0"
+    assert reloaded.lookup("d2") is None
+    assert reloaded.stats()["entries"] == 1
+
+
+def test_cached_upload_is_answered_without_a_parse(store, tmp_path):
+    cache = ResumeParseCache(store, str(tmp_path / "cache.json"), 10)
+    cache.put(content_digest(b"same file"), "c2")
+    queue = IngestQueue(store, cache, workers=1, max_pending=1, history=10)
+
+    job = queue.submit(b"same file", "again.pdf")
+    assert job.to_dict()["status"] == "done"
+    assert job.duplicate and job.candidate.id == "c2"
+    assert queue._executor is None  # No worker was started
+
+
+def test_upload_route_reports_duplicates():
+    app_db.add_candidate(Candidate(id="dup-route", name="Dup Route", email="dup@example.com"))
+    parse_cache.put(content_digest(b"%PDF- duplicate"), "dup-route")
+    try:
+        response = TestClient(app).post(
+            "/api/upload",
+            files={"file": ("cv.pdf", b"%PDF- duplicate", "application/pdf")}
+        )
+        assert response.status_code == 202
+        data = response.json()["data"]
+        assert data["duplicate"] is True
+        assert data["candidateId"] == "dup-route"
+    finally:
+        app_db.delete_candidate("dup-route")
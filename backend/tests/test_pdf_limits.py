@@ -0,0 +1,99 @@
+import io
+import time
+import PyPDF2
+import pytest
+from app.config import settings
+from app.services.resume_parser import PdfTimeoutError, ResumeParser, parse_resume_bytes
+
+
+def make_pdf(page_texts) -> bytes:
+    """A minimal PDF with one line of Helvetica text per page"""
+    count = len(page_texts)
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [" + b" ".join(b"%d 0 R" % (4 + 2 * i) for i in range(count))
+        + b"] /Count %d >>" % count,
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i, text in enumerate(page_texts):
+        stream = b"BT /F1 12 Tf 72 720 Td (" + text.encode() + b") Tj ET"
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (5 + 2 * i)
+        )
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return pdf
+
+
+PAGES = [f"Page {i} text" for i in range(5)]
+
+
+@pytest.fixture
+def parser():
+    return ResumeParser()
+
+
+def test_whole_document_within_limits(parser):
+    text = parser.parse_pdf(io.BytesIO(make_pdf(PAGES)))
+    assert [f"Page {i}" in text for i in range(5)] == [True] * 5
+    stats = parser.last_pdf_stats
+    assert (stats["pages"], stats["totalPages"], stats["truncated"]) == (5, 5, False)
+    assert len(stats["pageSeconds"]) == 5
+
+
+def test_page_limit_stops_reading(parser, monkeypatch):
+    monkeypatch.setattr(settings, "PDF_MAX_PAGES", 2)
+    text = parser.parse_pdf(io.BytesIO(make_pdf(PAGES)))
+    assert "Page 1" in text and "Page 2" not in text
+    stats = parser.last_pdf_stats
+    assert (stats["pages"], stats["totalPages"], stats["truncated"]) == (2, 5, True)
+
+
+def test_char_limit_stops_reading_and_truncates(parser, monkeypatch):
+    monkeypatch.setattr(settings, "PDF_MAX_CHARS", 15)
+    text = parser.parse_pdf(io.BytesIO(make_pdf(PAGES)))
+    assert len(text) == 15
+    assert text.startswith("Page 0")
+    assert parser.last_pdf_stats["pages"] == 2  # The page that crossed the limit is the last read
+    assert parser.last_pdf_stats["truncated"]
+
+
+def test_slow_extraction_times_out(parser, monkeypatch):
+    monkeypatch.setattr(settings, "PDF_TIMEOUT", 0.2)
+    real_extract = PyPDF2.PageObject.extract_text
+
+    def slow_extract(page, *args, **kwargs):
+        time.sleep(0.15)
+        return real_extract(page, *args, **kwargs)
+
+    monkeypatch.setattr(PyPDF2.PageObject, "extract_text", slow_extract)
+    began = time.perf_counter()
+    with pytest.raises(PdfTimeoutError):
+        parser.parse_pdf(io.BytesIO(make_pdf(PAGES)))
+    assert time.perf_counter() - began < 0.5
+
+
+def test_worker_reports_pdf_metrics(monkeypatch):
+    monkeypatch.setattr(settings, "PDF_MAX_PAGES", 3)
+    result = parse_resume_bytes(make_pdf(PAGES), "resume.pdf")
+    pdf = result["metrics"]["pdf"]
+    assert (pdf["pages"], pdf["totalPages"], pdf["truncated"]) == (3, 5, True)
+    assert pdf["slowestPageSeconds"] == max(pdf["pageSeconds"])
+
+
+def test_parallel_extraction_matches_serial(parser, monkeypatch):
+    serial = parser.parse_pdf(io.BytesIO(make_pdf(PAGES)))
+    monkeypatch.setattr(settings, "PDF_PARALLEL_MIN_PAGES", 2)
+    monkeypatch.setattr(settings, "PDF_PAGE_WORKERS", 2)
+    assert parser.parse_pdf(io.BytesIO(make_pdf(PAGES))) == serial
+    assert parser.last_pdf_stats["pages"] == 5
@@ -0,0 +1,73 @@
+import io
+import pstats
+import docx
+import pytest
+from fastapi.testclient import TestClient
+from app.database import db
+from app.main import app
+from app.models.candidate import Candidate
+from app.services.profiler import profiler
+from app.services.resume_parser import parse_resume_bytes
+
+
+@pytest.fixture
+def client():
+    db.add_candidates([
+        Candidate(id=f"prof{i}", name=f"Candidate {i}", email=f"prof{i}@example.com", skills=["Python", "SQL"])
+        for i in range(20)
+    ])
+    yield TestClient(app)
+    for i in range(20):
+        db.delete_candidate(f"prof{i}")
+
+
+def profiled_functions(session) -> set:
+    """(module file name, function) pairs in a session's dump"""
+    stats = pstats.Stats(session.stats_path)
+    return {(filename.replace("\\", "/").rsplit("/", 1)[-1], name) for filename, _, name in stats.stats}
+
+
+def test_armed_match_profile_covers_the_thread_pool(client):
+    session = profiler.start("POST", "/api/match", 1)
+    response = client.post("/api/match", json={
+        "jobDescription": {
+            "title": "Profiled backend engineer",
+            "description": "",
+            "skills": ["Python", "Docker"],
+            "experience": "3+ years",
+        },
+        "topN": 5,
+    })
+
+    assert response.status_code == 200
+    assert session.status == "done"
+    functions = profiled_functions(session)
+    # Scoring runs in the thread pool, not on the event loop
+    assert ("match_scoring.py", "rank_rows") in functions
+    assert ("match_scoring.py", "score_candidates") in functions
+
+
+def test_run_merges_nothing_outside_a_session():
+    assert profiler.run(sum, [1, 2, 3]) == 6
+
+
+def make_docx() -> bytes:
+    document = docx.Document()
+    for line in ["Ada Lovelace", "ada@example.com", "Skills: Python, SQL, Docker", "Experience", "Engineer at Acme"]:
+        document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def test_parser_process_profile_is_merged_into_the_session(tmp_path, monkeypatch):
+    monkeypatch.setattr(profiler, "directory", str(tmp_path))
+    session = profiler.start("POST", "/api/upload", 1)
+    try:
+        # What a parser process sends back for a job submitted while profiling
+        result = parse_resume_bytes(make_docx(), "resume.docx", profiled=True)
+        profiler.add_profile(session.id, result["metrics"]["profile"])
+    finally:
+        profiler.cancel(session.id)
+
+    assert ("resume_parser.py", "parse_resume") in profiled_functions(session)
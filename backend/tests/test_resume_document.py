@@ -0,0 +1,70 @@
+from app.services.resume_document import ResumeDocument
+from app.services.resume_parser import resume_parser
+
+RESUME = """
+  Ada Lovelace
+ada@example.com | +1 555 123 4567
+
+Professional Summary:
+Analyst who wrote the first published algorithm for a computing engine.
+
+WORK EXPERIENCE
+Lead Engineer
+Analytical Engines Ltd
+
+Projects
+Engineer of the Difference Engine notes
+
+Education
+B.S. Mathematics 2019
+
+Experience:
+Developer
+Babbage & Co
+"""
+
+
+def test_lines_are_stripped_and_blank_lines_dropped():
+    document = ResumeDocument(RESUME)
+    assert document.lines[:2] == ["Ada Lovelace", "ada@example.com | +1 555 123 4567"]
+    assert "" not in document.lines
+    assert document.text == RESUME
+
+
+def test_headings_split_sections_case_insensitively():
+    document = ResumeDocument(RESUME)
+    assert document.section_lines("summary") == [
+        "Analyst who wrote the first published algorithm for a computing engine."
+    ]
+    assert document.section_lines("education") == ["B.S. Mathematics 2019"]
+    # Both experience headings count; the Projects heading ends the first one
+    assert document.section_lines("experience") == [
+        "Lead Engineer", "Analytical Engines Ltd", "Developer", "Babbage & Co"
+    ]
+    assert "other" in document.sections
+
+
+def test_missing_section_falls_back_to_every_line():
+    document = ResumeDocument(RESUME)
+    assert document.section_lines("skills") is document.lines
+
+
+def test_heading_words_inside_a_sentence_are_not_headings():
+    document = ResumeDocument("Jane Doe\nExperience with Python and education technology\nEngineer")
+    assert document.sections == {}
+
+
+def test_text_without_lines():
+    document = ResumeDocument(" \n\n\t")
+    assert document.lines == [] and document.sections == {}
+    assert resume_parser.extract_name(document) == "Unknown"
+
+
+def test_extractors_read_their_section_and_accept_raw_text():
+    document = ResumeDocument(RESUME)
+    positions = [item.position for item in resume_parser.extract_experience(document)]
+    assert positions == ["Lead Engineer", "Developer"]  # Not the Projects line
+    assert resume_parser.extract_name(document) == "Ada Lovelace"
+    assert resume_parser.extract_education(document)[0].year == "2019"
+    assert resume_parser.extract_summary(document).startswith("Analyst")
+    assert resume_parser.extract_experience(RESUME) == resume_parser.extract_experience(document)
@@ -0,0 +1,80 @@
+import pytest
+from fastapi.testclient import TestClient
+from app.config import settings
+from app.database.mock_db import MockDatabase
+from app.database.sqlite_db import SQLiteDatabase
+from app.main import app
+from app.models.candidate import Candidate
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def store(request, tmp_path, monkeypatch):
+    if request.param == "json":
+        monkeypatch.setattr(settings, "MOCK_DB_PATH", str(tmp_path / "candidates.json"))
+        db = MockDatabase()
+    else:
+        db = SQLiteDatabase(str(tmp_path / "candidates.db"))
+    db.add_candidates([
+        Candidate(id="c1", name="Ada Lovelace", email="ada@example.com", skills=["Python", "Machine Learning"]),
+        Candidate(id="c2", name="Grace Hopper", email="grace@example.com", skills=["COBOL"]),
+    ])
+    return db
+
+
+@pytest.mark.parametrize("query", ["", " ", "  \t "])
+def test_blank_query_matches_nothing(store, query):
+    assert store.search_candidates(query) == []
+
+
+@pytest.mark.parametrize("query", ["%20", "%20%20", ""])
+def test_blank_query_is_rejected(query):
+    response = TestClient(app).get(f"/api/candidates/search?q={query}")
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("python", ["c1"]),
+    ("  MACHINE   learning ", ["c1"]),  # Skill queries are normalized
+    ("learn", ["c1"]),  # Substring of a skill
+    ("hopper", ["c2"]),  # Name trigrams
+    ("ada lov", ["c1"]),  # Across the space in a name
+    ("gr", ["c2"]),  # Shorter than a trigram: name scan
+    ("o", ["c1", "c2"]),
+    ("rust", []),
+])
+def test_search_matches_names_and_skills(store, query, expected):
+    assert [c.id for c in store.search_candidates(query)] == expected
+
+
+def test_search_pages_in_insertion_order(store):
+    store.add_candidates([
+        Candidate(id=f"p{i}", name=f"Pythonista {i}", email=f"p{i}@example.com", skills=[])
+        for i in range(5)
+    ])
+    assert [c.id for c in store.search_candidates("python")] == ["c1", "p0", "p1", "p2", "p3", "p4"]
+    assert [c.id for c in store.search_candidates("python", limit=2, offset=3)] == ["p2", "p3"]
+    assert store.search_candidates("python", limit=2, offset=10) == []
+
+
+def test_index_follows_updates_and_deletes(store):
+    store.add_candidate(Candidate(id="c1", name="Ada King", email="ada@example.com", skills=["Rust"]))
+    assert store.search_candidates("python") == []
+    assert store.search_candidates("lovelace") == []
+    assert [c.id for c in store.search_candidates("rust")] == ["c1"]
+    assert [c.id for c in store.search_candidates("king")] == ["c1"]
+
+    store.delete_candidate("c1")
+    assert store.search_candidates("rust") == []
+    assert store.search_candidates("king") == []
+
+
+def test_search_route_returns_matches():
+    from app.database import db
+
+    db.add_candidate(Candidate(id="route-search", name="Zebulon Quark", email="zq@example.com", skills=["Fortran"]))
+    try:
+        response = TestClient(app).get("/api/candidates/search", params={"q": "zebulon"})
+        assert response.status_code == 200
+        assert [c["id"] for c in response.json()["data"]] == ["route-search"]
+    finally:
+        db.delete_candidate("route-search")
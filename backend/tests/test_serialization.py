@@ -0,0 +1,54 @@
+import json
+import random
+import struct
+import pytest
+from app.utils import serialization
+
+orjson = pytest.importorskip("orjson")
+
+
+def stdlib_dumps(obj, monkeypatch) -> bytes:
+    with monkeypatch.context() as m:
+        m.setattr(serialization, "orjson", None)
+        return serialization.dumps(obj)
+
+
+PAYLOADS = [
+    {"op": "delete", "id": "c1"},
+    {"limit": 20, "offset": 0, "nextCursor": None, "total": 12345},
+    {"name": "Zoë Ångström 李雷", "quote": "say \"hi\"\n\t\\ /", "control": "\x00\x1f\x7f "},
+    {"flags": [True, False, None], "nested": {"empty": {}, "list": [], "tuple": (1, "a")}},
+    {"scores": [0.0, -0.0, 0.87, 87.5, 1e-5, -2.5e-5, 1e-6, 1e15, 1e16, 1.5e300, 5e-324]},
+    {"notFinite": [float("nan"), float("inf"), float("-inf")]},
+]
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_stdlib_fallback_writes_the_same_bytes_as_orjson(payload, monkeypatch):
+    assert stdlib_dumps(payload, monkeypatch) == orjson.dumps(payload)
+
+
+def test_random_floats_match_orjson(monkeypatch):
+    rng = random.Random(0)
+    values = [struct.unpack("d", struct.pack("Q", rng.getrandbits(64)))[0] for _ in range(5000)]
+    values += [10 ** rng.uniform(-8, 18) for _ in range(5000)]
+    assert stdlib_dumps(values, monkeypatch) == orjson.dumps(values)
+
+
+def test_unsupported_input_is_rejected_by_both_paths(monkeypatch):
+    for payload in ({1: "int key"}, {"value": object()}):
+        with pytest.raises(TypeError):
+            orjson.dumps(payload)
+        with pytest.raises(TypeError):
+            stdlib_dumps(payload, monkeypatch)
+
+
+def test_envelope_splices_data_and_extras(monkeypatch):
+    data = serialization.dump_candidates([])
+    fast = serialization.envelope(data, limit=20, nextCursor="abc").body
+    with monkeypatch.context() as m:
+        m.setattr(serialization, "orjson", None)
+        slow = serialization.envelope(data, limit=20, nextCursor="abc").body
+    assert fast == slow
+    assert json.loads(fast) == {"success": True, "data": [], "limit": 20, "nextCursor": "abc"}
+    assert json.loads(serialization.envelope(b"[1]").body) == {"success": True, "data": [1]}
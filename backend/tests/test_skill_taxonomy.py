@@ -0,0 +1,34 @@
+from app.services.skill_taxonomy import DEFAULT_TAXONOMY, SkillMatcher
+
+
+matcher = SkillMatcher(DEFAULT_TAXONOMY)
+
+
+def test_matches_only_on_word_boundaries():
+    assert matcher.extract("Maintained legacy systems") == []
+    assert matcher.extract("Wrote JavaScript daily") == ["JavaScript"]
+    assert matcher.extract("Java, AI and SQL.") == ["Java", "SQL", "AI"]
+    assert matcher.extract("MySQL") == ["MySQL"]
+
+
+def test_overlapping_aliases_resolve_to_one_canonical_skill():
+    assert matcher.extract("Google Cloud Platform and google cloud") == ["GCP"]
+    assert matcher.extract("Built REST APIs (restful)") == ["REST"]
+    assert matcher.extract("React.js, reactjs and React") == ["React"]
+    assert matcher.extract("node.js / nodejs") == ["Node.js"]
+
+
+def test_case_and_whitespace_are_ignored():
+    assert matcher.extract("PYTHON3 and postgres") == ["Python", "PostgreSQL"]
+    assert matcher.extract("Machine\n  LEARNING") == ["Machine Learning"]
+
+
+def test_results_follow_taxonomy_order_and_limit():
+    text = "TensorFlow, Docker, Python"
+    assert matcher.extract(text) == ["Python", "Docker", "TensorFlow"]
+    assert matcher.extract(text, limit=2) == ["Python", "Docker"]
+
+
+def test_common_words_are_not_skills():
+    text = "Added 5 ml of reagent, then walked to the node; profile at github.com/ada"
+    assert matcher.extract(text) == []
@@ -0,0 +1,99 @@
+import pytest
+from app.config import settings
+from app.database import create_database
+from app.database.mock_db import MockDatabase
+from app.database.sqlite_db import SQLiteDatabase
+from app.models.candidate import Candidate
+
+
+def make_candidate(number: int, **fields) -> Candidate:
+    values = dict(
+        id=f"c{number}",
+        name=f"Candidate {number}",
+        email=f"candidate{number}@example.com",
+        skills=["Python"],
+        uploadedAt="2026-01-15T10:00:00"
+    )
+    values.update(fields)
+    return Candidate(**values)
+
+
+@pytest.fixture
+def db(tmp_path):
+    return SQLiteDatabase(str(tmp_path / "candidates.db"))
+
+
+def test_crud_round_trip(db):
+    db.add_candidate(make_candidate(0))
+    db.add_candidates([make_candidate(1), make_candidate(2, email="Mixed.Case@Example.com")])
+
+    assert db.get_candidate_ids() == ["c0", "c1", "c2"]
+    assert db.get_candidate_by_id("c1") == make_candidate(1)
+    assert db.get_candidate_by_id("missing") is None
+    assert [c.id for c in db.get_candidates_by_email("mixed.case@EXAMPLE.com")] == ["c2"]
+
+    assert db.delete_candidate("c1") is True
+    assert db.delete_candidate("c1") is False
+    assert [c.id for c in db.get_all_candidates()] == ["c0", "c2"]
+
+
+def test_same_id_replaces_the_row_and_its_skills(db):
+    db.add_candidate(make_candidate(0, skills=["Python"]))
+    db.add_candidate(make_candidate(0, name="Renamed", skills=["Rust"]))
+
+    assert [c.name for c in db.get_all_candidates()] == ["Renamed"]
+    assert db.search_candidates("python") == []
+    assert [c.id for c in db.search_candidates("rust")] == ["c0"]
+
+
+def test_data_survives_reopening(tmp_path):
+    path = str(tmp_path / "candidates.db")
+    SQLiteDatabase(path).add_candidates([make_candidate(i) for i in range(3)])
+    reopened = SQLiteDatabase(path)
+    assert reopened.get_candidate_ids() == ["c0", "c1", "c2"]
+    assert reopened.get_stats().total == 3
+
+
+def test_cursor_pages_cover_every_row_once(db):
+    db.add_candidates([make_candidate(i) for i in range(7)])
+    db.delete_candidate("c3")
+
+    seen, cursor = [], None
+    while True:
+        page, cursor = db.get_candidates_page(cursor, 2)
+        seen += [c.id for c in page]
+        if cursor is None:
+            break
+    assert seen == ["c0", "c1", "c2", "c4", "c5", "c6"]
+    assert [len(batch) for batch in db.iter_candidates(batch_size=4)] == [4, 2]
+
+
+def test_cursor_stays_valid_across_inserts_and_deletes(db):
+    db.add_candidates([make_candidate(i) for i in range(4)])
+    page, cursor = db.get_candidates_page(None, 2)
+    db.delete_candidate("c1")
+    db.add_candidate(make_candidate(9))
+    page, cursor = db.get_candidates_page(cursor, 10)
+    assert [c.id for c in page] == ["c2", "c3", "c9"]
+    assert cursor is None
+
+
+@pytest.mark.parametrize("cursor", ["abc", "-1", "1.5", ""])
+def test_invalid_cursor_raises_value_error(db, cursor):
+    with pytest.raises(ValueError):
+        db.get_candidates_page(cursor, 10)
+
+
+def test_create_database_picks_the_backend_from_the_url(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "MOCK_DB_PATH", str(tmp_path / "candidates.json"))
+    assert isinstance(create_database(""), MockDatabase)
+    assert isinstance(create_database("json://"), MockDatabase)
+    assert isinstance(create_database("postgres://db/x"), MockDatabase)
+
+    store = create_database(f"sqlite:///{tmp_path / 'store.db'}")
+    assert isinstance(store, SQLiteDatabase)
+    assert (tmp_path / "store.db").exists()
+
+    memory = create_database("sqlite:///:memory:")
+    memory.add_candidate(make_candidate(0))
+    assert memory.get_candidate_ids() == ["c0"]
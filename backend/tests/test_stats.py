@@ -0,0 +1,60 @@
+from datetime import date
+import pytest
+from app.config import settings
+from app.database.mock_db import MockDatabase
+from app.database.sqlite_db import SQLiteDatabase
+from app.models.candidate import Candidate
+
+
+UPLOADS = [
+    # (upload timestamp, match score)
+    ("2026-03-01T00:00:00", 0.5),
+    ("2026-03-01T23:59:59", None),
+    ("2026-03-02T12:00:00", 0.9),
+    ("2026-03-04T08:30:00", 0.1),
+    ("2026-03-05T00:00:00", None),
+]
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def store(request, tmp_path, monkeypatch):
+    if request.param == "json":
+        monkeypatch.setattr(settings, "MOCK_DB_PATH", str(tmp_path / "candidates.json"))
+        db = MockDatabase()
+    else:
+        db = SQLiteDatabase(str(tmp_path / "candidates.db"))
+    db.add_candidates([
+        Candidate(id=f"c{i}", name=f"C{i}", email=f"c{i}@example.com", uploadedAt=uploaded_at, matchScore=score)
+        for i, (uploaded_at, score) in enumerate(UPLOADS)
+    ])
+    return db
+
+
+def test_range_bounds_are_inclusive_days(store):
+    stats = store.get_range_stats("2026-03-01", "2026-03-04")
+    assert stats.total == 4
+    assert stats.daily == {"2026-03-01": 2, "2026-03-02": 1, "2026-03-04": 1}
+    assert stats.avgMatchScore == pytest.approx(0.5)
+
+
+def test_range_edges_exclude_neighbouring_days(store):
+    assert store.get_range_stats("2026-03-02", "2026-03-02").daily == {"2026-03-02": 1}
+    assert store.get_range_stats("2026-03-03", "2026-03-03").total == 0
+    assert store.get_range_stats("2026-03-05", None).daily == {"2026-03-05": 1}
+    assert store.get_range_stats(None, "2026-03-01").total == 2
+
+
+def test_range_without_scores_averages_to_zero(store):
+    stats = store.get_range_stats("2026-03-05", "2026-03-05")
+    assert stats.total == 1
+    assert stats.avgMatchScore == 0.0
+
+
+def test_week_and_month_count_calendar_days_including_today(store):
+    # 2026-03-01 is the seventh day back from 2026-03-07
+    stats = store.get_stats(today=date(2026, 3, 7))
+    assert stats.total == 5
+    assert stats.thisWeek == 5
+    assert store.get_stats(today=date(2026, 3, 8)).thisWeek == 3
+    assert store.get_stats(today=date(2026, 3, 30)).thisMonth == 5
+    assert store.get_stats(today=date(2026, 3, 31)).thisMonth == 3
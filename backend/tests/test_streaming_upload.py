@@ -0,0 +1,105 @@
+import asyncio
+import pytest
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+from app.config import settings
+from app.main import app
+from app.utils.streaming_upload import (
+    MULTIPART_OVERHEAD,
+    MalformedUploadError,
+    UploadTooLargeError,
+    read_multipart_file,
+)
+
+BOUNDARY = "testboundary"
+
+
+def multipart_body(*parts) -> bytes:
+    body = b""
+    for name, filename, content in parts:
+        disposition = f'form-data; name="{name}"' + (f'; filename="{filename}"' if filename else "")
+        body += f"--{BOUNDARY}\r\nContent-Disposition: {disposition}\r\n\r\n".encode() + content + b"\r\n"
+    return body + f"--{BOUNDARY}--\r\n".encode()
+
+
+def read(body: bytes, max_size: int, content_length: bool = True, received=None):
+    """Run read_multipart_file over a request delivered in 100-byte chunks"""
+    chunk = 100
+    headers = [(b"content-type", f"multipart/form-data; boundary={BOUNDARY}".encode())]
+    if content_length:
+        headers.append((b"content-length", str(len(body)).encode()))
+    messages = [
+        {"type": "http.request", "body": body[i:i + chunk], "more_body": i + chunk < len(body)}
+        for i in range(0, len(body), chunk)
+    ]
+    received = [] if received is None else received
+
+    async def receive():
+        message = messages[len(received)]
+        received.append(message)
+        return message
+
+    request = Request({"type": "http", "method": "POST", "headers": headers}, receive)
+    result = asyncio.run(read_multipart_file(request, "file", max_size))
+    return result
+
+
+def test_file_field_is_extracted_from_a_chunked_body():
+    content = bytes(range(256)) * 4
+    body = multipart_body(("note", None, b"ignored"), ("file", "cv.pdf", content), ("other", "x.pdf", b"later"))
+    filename, data = read(body, max_size=len(content))
+    assert (filename, data) == ("cv.pdf", content)
+
+
+def test_oversized_file_stops_reading_early():
+    body = multipart_body(("file", "cv.pdf", b"x" * 5000))
+    received = []
+    with pytest.raises(UploadTooLargeError):
+        read(body, max_size=1000, content_length=False, received=received)
+    assert len(received) < 15  # Of ~50 chunks
+
+
+def test_oversized_content_length_is_rejected_before_reading():
+    body = multipart_body(("file", "cv.pdf", b"x" * (MULTIPART_OVERHEAD + 2000)))
+    headers = [
+        (b"content-type", f"multipart/form-data; boundary={BOUNDARY}".encode()),
+        (b"content-length", str(len(body)).encode()),
+    ]
+
+    async def receive():
+        raise AssertionError("body was read")
+
+    request = Request({"type": "http", "method": "POST", "headers": headers}, receive)
+    with pytest.raises(UploadTooLargeError):
+        asyncio.run(read_multipart_file(request, "file", 1000))
+
+
+@pytest.mark.parametrize("body", [
+    multipart_body(("note", None, b"no file here")),
+    multipart_body(("file", None, b"a plain form field, not a file")),
+])
+def test_missing_file_field_is_malformed(body):
+    with pytest.raises(MalformedUploadError):
+        read(body, max_size=1000)
+
+
+def test_upload_route_rejects_oversized_files(monkeypatch):
+    monkeypatch.setattr(settings, "MAX_UPLOAD_SIZE", 1024)
+    client = TestClient(app)
+
+    response = client.post("/api/upload", files={"file": ("cv.pdf", b"x" * 1025, "application/pdf")})
+    assert response.status_code == 400
+    assert "File too large" in response.json()["detail"]
+
+    huge = b"x" * (1024 + MULTIPART_OVERHEAD + 1)
+    response = client.post("/api/upload", files={"file": ("cv.pdf", huge, "application/pdf")})
+    assert response.status_code == 400
+    assert "File too large" in response.json()["detail"]
+
+
+def test_upload_route_rejects_bad_requests():
+    client = TestClient(app)
+    assert client.post("/api/upload", data={"file": "not a file"}).status_code == 422
+    response = client.post("/api/upload", files={"file": ("cv.txt", b"hello", "text/plain")})
+    assert response.status_code == 400
+    assert "Invalid file type" in response.json()["detail"]
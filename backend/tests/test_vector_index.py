@@ -0,0 +1,76 @@
+import pytest
+from app.config import settings
+from app.database.mock_db import MockDatabase
+from app.models.candidate import Candidate
+from app.services.vector_index import VectorIndex
+
+
+def profile(candidate_id: str, skills, summary: str) -> Candidate:
+    return Candidate(
+        id=candidate_id,
+        name=f"Candidate {candidate_id}",
+        email=f"{candidate_id}@example.com",
+        skills=skills,
+        summary=summary
+    )
+
+
+QUERY = "Rust, Tokio, async systems programming"
+
+
+@pytest.fixture
+def store_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "MOCK_DB_PATH", str(tmp_path / "candidates.json"))
+    monkeypatch.setattr(settings, "EMBEDDING_MODEL", "")
+    return tmp_path
+
+
+def seed(store):
+    store.add_candidates([
+        profile("c1", ["Java", "Spring"], "Enterprise Java services"),
+        profile("c2", ["Rust"], "Rust command line tools"),
+        profile("c3", ["Excel"], "Accounting and reporting"),
+    ])
+
+
+def rewrite_c1_elsewhere():
+    """Another process replaces c1's record under the same id"""
+    MockDatabase().add_candidate(
+        profile("c1", ["Rust", "Tokio"], "Async systems programming in Rust with Tokio")
+    )
+
+
+def test_reload_reembeds_records_changed_under_the_same_id(store_path):
+    store = MockDatabase()
+    seed(store)
+    index = VectorIndex(store, str(store_path / "embeddings"))
+    assert index.search(QUERY, 3)[0][0] == "c2"
+
+    rewrite_c1_elsewhere()
+    store.refresh()
+
+    assert [candidate_id for candidate_id, _ in index.search(QUERY, 3)][:2] == ["c1", "c2"]
+
+
+def test_restart_reembeds_records_changed_while_down(store_path):
+    store = MockDatabase()
+    seed(store)
+    VectorIndex(store, str(store_path / "embeddings")).save()
+
+    rewrite_c1_elsewhere()
+
+    restarted = VectorIndex(MockDatabase(), str(store_path / "embeddings"))
+    assert [candidate_id for candidate_id, _ in restarted.search(QUERY, 3)][:2] == ["c1", "c2"]
+
+
+def test_restart_with_a_matching_fingerprint_embeds_nothing(store_path, monkeypatch):
+    store = MockDatabase()
+    seed(store)
+    VectorIndex(store, str(store_path / "embeddings")).save()
+
+    encoded = []
+    monkeypatch.setattr(VectorIndex, "_append", lambda self, candidates: encoded.extend(candidates))
+    index = VectorIndex(MockDatabase(), str(store_path / "embeddings"))
+
+    assert encoded == []
+    assert index.search(QUERY, 3)[0][0] == "c2"
@@ -1,6 +1,9 @@
 import apiService from './api.service';
 import { Candidate, CandidateStats } from '../types/candidate.types';
-import { UploadResponse } from '../types/api.types';
+import { UploadJob, UploadResponse } from '../types/api.types';
+
+const UPLOAD_POLL_INTERVAL_MS = 500;
+const UPLOAD_POLL_TIMEOUT_MS = 120000;
 
 /**
  * Candidate service - handles all candidate-related API calls
@@ -10,16 +13,49 @@ class CandidateService {
 
   /**
    * Upload resume file and extract candidate information
+   *
+   * The backend parses resumes in a background queue, so this polls the
+   * upload job until the candidate has been extracted.
    */
   async uploadResume(file: File): Promise<UploadResponse> {
     const formData = new FormData();
     formData.append('file', file);
 
-    const response = await apiService.uploadFile<UploadResponse>(
+    const response = await apiService.uploadFile<UploadJob>(
       '/api/upload',
       formData
     );
-    return response.data!;
+
+    const job = await this.waitForUploadJob(response.data!.jobId);
+    return {
+      candidateId: job.candidateId!,
+      candidate: job.candidate!,
+      duplicate: job.duplicate,
+      message: job.duplicate
+        ? 'Resume was already uploaded; showing the stored candidate'
+        : 'Resume uploaded and parsed successfully',
+    };
+  }
+
+  /**
+   * Poll an upload job until it is done or failed
+   */
+  async waitForUploadJob(jobId: string): Promise<UploadJob> {
+    const deadline = Date.now() + UPLOAD_POLL_TIMEOUT_MS;
+
+    while (Date.now() < deadline) {
+      const response = await apiService.get<UploadJob>(`/api/upload/jobs/${jobId}`);
+      const job = response.data!;
+
+      if (job.status === 'done') return job;
+      if (job.status === 'failed') {
+        throw { message: job.error || 'Failed to process resume', statusCode: 500 };
+      }
+
+      await new Promise((resolve) => setTimeout(resolve, UPLOAD_POLL_INTERVAL_MS));
+    }
+
+    throw { message: 'Timed out waiting for resume processing', statusCode: 504 };
   }
 
   /**
@@ -9,9 +9,25 @@ export interface ApiResponse<T> {
 export interface UploadResponse {
   candidateId: string;
   candidate: Candidate;
+  duplicate: boolean;
   message: string;
 }
 
+export type UploadJobStatus = 'queued' | 'parsing' | 'storing' | 'done' | 'failed';
+
+export interface UploadJob {
+  jobId: string;
+  filename: string;
+  status: UploadJobStatus;
+  progress: number;
+  candidateId: string | null;
+  candidate: Candidate | null;
+  duplicate: boolean;
+  error: string | null;
+  createdAt: string;
+  finishedAt: string | null;
+}
+
 export interface ErrorResponse {
   error: string;
   detail?: string;